@@ -0,0 +1,165 @@
+import numpy as np
+
+# Hizalama yöntemleri
+NEAREST = 'nearest'
+LINEAR = 'linear'
+HOLD = 'hold'
+METHODS = (NEAREST, LINEAR, HOLD)
+# Çok örnekli sensörlerde örnek numarası alanı (IMU/ACC/GYR/GPS: I, BAT: Inst ya
+# da Instance, VIBE: IMU). Örnekler aynı akışta sırayla karışık kaydedilir.
+INSTANCE_FIELDS = ('I', 'Instance', 'Inst', 'IMU')
+
+
+def instance_field(stream):
+    names = stream.dtype.names or ()
+    for name in INSTANCE_FIELDS:
+        if name in names:
+            return name
+    return None
+
+
+def split_instances(stream):
+    """Örnek numarası -> o örneğin satırları (tek örnekli akış: {0: akış})"""
+    field = instance_field(stream)
+    if field is None or not len(stream):
+        return {0: stream}
+    instances = np.asarray(stream[field])
+    return {int(instance): stream[instances == instance] for instance in np.unique(instances)}
+
+
+def primary_instance(stream):
+    """Akışın en küçük numaralı örneği; örnekler ayrı zaman serileri olarak ele alınmalıdır"""
+    if stream is None:
+        return None
+    field = instance_field(stream)
+    if field is None or not len(stream):
+        return stream
+    instances = np.asarray(stream[field])
+    first = instances.min()
+    if np.all(instances == first):
+        return stream
+    return stream[instances == first]
+
+
+def sorted_series(timestamps, values):
+    """Zamana göre sıralı (zaman, değer) çifti; zaten sıralıysa kopyalanmaz"""
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    if len(timestamps) > 1 and np.any(timestamps[1:] < timestamps[:-1]):
+        order = np.argsort(timestamps, kind='stable')
+        timestamps, values = timestamps[order], values[order]
+    return timestamps, values
+
+
+def align(times, timestamps, values, method=LINEAR, max_gap=None):
+    """Bir seriyi verilen zamanlara hizala (nearest, hold ya da linear)"""
+    # Kaynak aralığı dışındaki ya da max_gap'ten uzun boşluğa düşen zamanlar NaN olur
+    if method not in METHODS:
+        raise ValueError(f"Bilinmeyen hizalama yöntemi: {method}")
+    times = np.asarray(times, dtype=np.float64)
+    timestamps, values = sorted_series(timestamps, values)
+    result = np.full(len(times), np.nan)
+    if not len(timestamps) or not len(times):
+        return result
+
+    # right[i]: times[i]'den büyük ilk örnek; left = right - 1 son eşit/küçük örnek
+    right = np.searchsorted(timestamps, times, side='right')
+    left = right - 1
+    has_left = left >= 0
+    has_right = right < len(timestamps)
+    left_index = np.clip(left, 0, len(timestamps) - 1)
+    right_index = np.clip(right, 0, len(timestamps) - 1)
+    left_gap = np.where(has_left, times - timestamps[left_index], np.inf)
+    right_gap = np.where(has_right, timestamps[right_index] - times, np.inf)
+
+    if method == HOLD:
+        valid = has_left
+        result[valid] = values[left_index[valid]]
+        gap = left_gap
+    elif method == NEAREST:
+        use_right = right_gap < left_gap
+        index = np.where(use_right, right_index, left_index)
+        result = values[index]
+        gap = np.minimum(left_gap, right_gap)
+        valid = np.ones(len(times), dtype=bool)
+    else:
+        exact = left_gap == 0
+        valid = (has_left & has_right) | exact
+        span = timestamps[right_index] - timestamps[left_index]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            weight = np.where(span > 0, left_gap / span, 0.0)
+            interpolated = values[left_index] + weight * (values[right_index] - values[left_index])
+        result[valid] = np.where(exact, values[left_index], interpolated)[valid]
+        # Doğrusal ara değerde boşluk, iki komşu örnek arasındaki mesafedir
+        gap = np.where(exact, 0.0, left_gap + right_gap)
+
+    if max_gap is not None:
+        valid &= gap <= max_gap
+    result[~valid] = np.nan
+    return result
+
+
+def timebase(log_data, streams, reference=None, rate=None):
+    """Akışların ortak zaman ekseni: reference akışı, rate Hz'lik eksen ya da ilk akış"""
+    if rate is not None:
+        bounds = [(stream['timestamp'].min(), stream['timestamp'].max())
+                  for stream in (primary_instance(log_data.get(name)) for name in streams)
+                  if stream is not None and len(stream)]
+        if not bounds:
+            return np.empty(0)
+        start = max(low for low, _ in bounds)
+        end = min(high for _, high in bounds)
+        if end < start:
+            return np.empty(0)
+        return start + np.arange(int(np.floor((end - start) * rate)) + 1) / rate
+
+    if reference is None:
+        reference = streams[0]
+    stream = primary_instance(log_data.get(reference))
+    if stream is None or not len(stream):
+        return np.empty(0)
+    return np.sort(np.asarray(stream['timestamp'], dtype=np.float64))
+
+
+def join_streams(log_data, columns, reference=None, rate=None, method=LINEAR, max_gap=None):
+    """Farklı mesaj tiplerindeki alanları ortak zaman eksenine hizalayıp birleştir"""
+    # columns: {çıktı adı: (akış adı, alan adı)}; method tek yöntem ya da çıktı adına göre sözlük
+    streams = list(dict.fromkeys(stream for stream, _ in columns.values()))
+    times = timebase(log_data, streams, reference, rate)
+    joined = np.empty(len(times), dtype=[('timestamp', 'f8')] + [(name, 'f8') for name in columns])
+    joined['timestamp'] = times
+
+    for name, (stream_name, field) in columns.items():
+        stream = primary_instance(log_data.get(stream_name))
+        if stream is None or field not in (stream.dtype.names or ()):
+            joined[name] = np.nan
+            continue
+        column_method = method.get(name, LINEAR) if isinstance(method, dict) else method
+        joined[name] = align(times, stream['timestamp'], stream[field], column_method, max_gap)
+    return joined
+
+
+def integrate(timestamps, values):
+    """Zaman üzerinden yamuk integral (NaN aralıklar atlanır)"""
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    if len(timestamps) < 2:
+        return 0.0
+    areas = np.diff(timestamps) * (values[1:] + values[:-1]) / 2
+    return float(np.nansum(areas))
+
+
+def cumulative_distance(gps):
+    """GPS akışında başlangıçtan itibaren kat edilen yol (m)"""
+    gps = primary_instance(gps)
+    timestamps, lat = sorted_series(gps['timestamp'], gps['lat'])
+    if 'speed' in gps.dtype.names:
+        speed = sorted_series(gps['timestamp'], gps['speed'])[1]
+        steps = np.diff(timestamps) * (speed[1:] + speed[:-1]) / 2
+    else:
+        lon = sorted_series(gps['timestamp'], gps['lon'])[1]
+        lat, lon = np.radians(lat), np.radians(lon)
+        a = (np.sin(np.diff(lat) / 2) ** 2 +
+             np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(np.diff(lon) / 2) ** 2)
+        steps = 2 * 6371000 * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+    return timestamps, np.concatenate(([0.0], np.cumsum(np.nan_to_num(steps))))
@@ -0,0 +1,166 @@
+"""Dizinlerdeki uçuş loglarını Qt olmadan toplu analiz eder"""
+# Kullanım: python -m analysis.batch_analyze logs/ --recursive --workers 8 --output ozet.json
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+
+from analysis.flight_analysis import ANALYSES, evaluate_parameter_status
+from analysis.flight_index import flight_record, vehicle_info
+from analysis.lazy_log import open_log
+from analysis.log_cache import file_key
+
+LOG_PATTERNS = ('*.bin', '*.log')
+
+
+def find_logs(paths, recursive=False, patterns=LOG_PATTERNS):
+    """Verilen dosya ve dizinlerdeki log dosyaları (sıralı, tekrarsız)"""
+    found = []
+    for path in paths:
+        if os.path.isfile(path):
+            found.append(path)
+            continue
+        for pattern in patterns:
+            if recursive:
+                found.extend(glob.glob(os.path.join(path, '**', pattern), recursive=True))
+            else:
+                found.extend(glob.glob(os.path.join(path, pattern)))
+    return sorted(set(os.path.abspath(path) for path in found))
+
+
+def analyze_file(file_path, analyses=None, use_cache=True):
+    """Tek logu analiz et; hata olursa sonuçta 'error' alanı döner"""
+    if analyses is None:
+        analyses = list(ANALYSES)
+    summary = {
+        'file': file_path,
+        'size': os.path.getsize(file_path),
+        'analyses': {},
+        'status': {},
+        'vehicle': None,
+        'error': None
+    }
+    started = time.monotonic()
+    log = None
+    try:
+        # Havuzdaki her süreç kendi dosyasını tek süreçte tarar
+        summary['file_key'] = file_key(file_path)
+        log = open_log(file_path, use_cache=use_cache, workers=1)
+        for name in analyses:
+            _, analyze = ANALYSES[name]
+            results = analyze(log)
+            summary['analyses'][name] = results
+            summary['status'][name] = {key: evaluate_parameter_status(key, value)
+                                       for key, value in results.items()
+                                       if not isinstance(value, dict)}
+        summary['vehicle'] = vehicle_info(log)
+    except Exception as e:
+        summary['error'] = str(e)
+    finally:
+        if log is not None:
+            log.close()
+    summary['duration'] = time.monotonic() - started
+    return summary
+
+
+def _analyze_file(args):
+    return analyze_file(*args)
+
+
+def run_batch(files, analyses=None, workers=None, use_cache=True):
+    """Dosyaları süreç havuzunda analiz et; sonuçlar dosya sırasıyla döner"""
+    jobs = [(file_path, analyses, use_cache) for file_path in files]
+    if workers == 1 or len(files) <= 1:
+        return [_analyze_file(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_analyze_file, jobs))
+
+
+def flatten(results, prefix=''):
+    """İç içe sonuçları 'analiz.alan.alt_alan' sütunlarına aç"""
+    row = {}
+    for key, value in results.items():
+        name = f'{prefix}{key}'
+        if isinstance(value, dict):
+            row.update(flatten(value, f'{name}.'))
+        else:
+            row[name] = value
+    return row
+
+
+def write_json(summaries, file_path):
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'created': datetime.now().isoformat(),
+            'files': summaries
+        }, f, indent=2, ensure_ascii=False, default=float)
+
+
+def write_csv(summaries, file_path):
+    rows = []
+    for summary in summaries:
+        row = {
+            'file': summary['file'],
+            'size': summary['size'],
+            'duration': round(summary['duration'], 3),
+            'error': summary['error'] or ''
+        }
+        row.update(flatten(summary['analyses']))
+        rows.append(row)
+
+    # Dosyalarda olmayan sütunlar boş kalır
+    headers = []
+    for row in rows:
+        for key in row:
+            if key not in headers:
+                headers.append(key)
+    with open(file_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=headers)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Uçuş loglarını toplu analiz et")
+    parser.add_argument('paths', nargs='+', help="Log dosyaları ya da dizinleri")
+    parser.add_argument('-r', '--recursive', action='store_true', help="Alt dizinleri de tara")
+    parser.add_argument('-a', '--analysis', action='append', choices=sorted(ANALYSES),
+                        help="Çalıştırılacak analiz (tekrarlanabilir; varsayılan: hepsi)")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="Süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument('-o', '--output', default='batch_summary.json', help="JSON özet dosyası")
+    parser.add_argument('--csv', help="CSV özet dosyası")
+    parser.add_argument('--no-cache', action='store_true', help="Ayrıştırılmış log önbelleğini kullanma")
+    parser.add_argument('--database', help="Özetlerin eklendiği uçuş dizini (SQLite)")
+    args = parser.parse_args(argv)
+
+    files = find_logs(args.paths, args.recursive)
+    if not files:
+        print("Analiz edilecek log bulunamadı")
+        return 1
+
+    started = time.monotonic()
+    summaries = run_batch(files, args.analysis, args.workers, not args.no_cache)
+    write_json(summaries, args.output)
+    if args.csv:
+        write_csv(summaries, args.csv)
+    if args.database:
+        from database.db_manager import DatabaseManager
+        db = DatabaseManager(args.database)
+        for summary in summaries:
+            if not summary['error']:
+                db.add_flight(flight_record(summary))
+
+    failed = [summary for summary in summaries if summary['error']]
+    for summary in failed:
+        print(f"Analiz hatası: {summary['file']}: {summary['error']}")
+    print(f"{len(files)} log {time.monotonic() - started:.1f} sn'de analiz edildi, {len(failed)} hata")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
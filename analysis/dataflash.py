@@ -0,0 +1,465 @@
+from concurrent.futures import ProcessPoolExecutor
+import mmap
+import os
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# ArduPilot DataFlash (.bin) kayıtları: 0xA3 0x95, mesaj tipi, yük
+HEADER = b'\xa3\x95'
+HEADER_LENGTH = 3
+FMT_TYPE = 128
+FMT_LENGTH = 89
+
+# FMT içindeki biçim karakterleri: (numpy tipi, ölçek)
+FORMAT_TYPES = {
+    'a': (('<i2', (32,)), None),
+    'b': ('i1', None),
+    'B': ('u1', None),
+    'g': ('<f2', None),
+    'h': ('<i2', None),
+    'H': ('<u2', None),
+    'i': ('<i4', None),
+    'I': ('<u4', None),
+    'f': ('<f4', None),
+    'd': ('<f8', None),
+    'n': ('S4', None),
+    'N': ('S16', None),
+    'Z': ('S64', None),
+    'c': ('<i2', 0.01),
+    'C': ('<u2', 0.01),
+    'e': ('<i4', 0.01),
+    'E': ('<u4', 0.01),
+    'L': ('<i4', 1.0e-7),
+    'M': ('u1', None),
+    'q': ('<i8', None),
+    'Q': ('<u8', None),
+}
+
+FMT_DTYPE = np.dtype([
+    ('head1', 'u1'),
+    ('head2', 'u1'),
+    ('msgid', 'u1'),
+    ('type', 'u1'),
+    ('length', 'u1'),
+    ('name', 'S4'),
+    ('format', 'S16'),
+    ('columns', 'S64'),
+])
+
+# Analizlerin kullandığı akış adları: (DataFlash mesajı, alan adı eşlemesi)
+ANALYSIS_STREAMS = {
+    'ATTITUDE': ('ATT', {'Roll': 'roll', 'Pitch': 'pitch', 'Yaw': 'yaw'}),
+    'GPS': ('GPS', {'Lat': 'lat', 'Lng': 'lon', 'Alt': 'alt', 'HDop': 'hdop', 'Spd': 'speed'}),
+    'BATTERY': ('BAT', {'Volt': 'voltage', 'Curr': 'current', 'CurrTot': 'consumed'}),
+    'CURRENT': ('CURR', {'Volt': 'voltage', 'Curr': 'current', 'CurrTot': 'consumed'}),
+    'RCIN': ('RCIN', {f'C{i}': f'chan{i}' for i in range(1, 33)}),
+    'SERVO_OUTPUT': ('RCOU', {f'C{i}': f'servo{i}' for i in range(1, 33)}),
+    'IMU': ('IMU', {'GyrX': 'gyr_x', 'GyrY': 'gyr_y', 'GyrZ': 'gyr_z',
+                    'AccX': 'acc_x', 'AccY': 'acc_y', 'AccZ': 'acc_z'}),
+}
+
+# Başlık taraması bu boyutta parçalarla yapılır
+SCAN_CHUNK = 64 * 1024 * 1024
+
+
+class MessageFormat:
+    """FMT kaydından türetilen mesaj düzeni"""
+
+    def __init__(self, type, name, length, format, columns):
+        self.type = type
+        self.name = name
+        self.length = length
+        self.format = format
+        self.columns = columns
+
+        names = []
+        formats = []
+        offsets = []
+        scales = {}
+        offset = HEADER_LENGTH
+        for char, column in zip(format, columns):
+            dtype, scale = FORMAT_TYPES[char]
+            dtype = np.dtype(dtype)
+            if column not in names:
+                names.append(column)
+                formats.append(dtype)
+                offsets.append(offset)
+                if scale is not None:
+                    scales[column] = scale
+            offset += dtype.itemsize
+        self.raw_dtype = np.dtype({'names': names, 'formats': formats,
+                                   'offsets': offsets, 'itemsize': length})
+        self.scales = scales
+
+        # Ölçekli alanlar float64'e çevrilir; zaman damgası saniye cinsinden eklenir
+        fields = []
+        self.time_field = None
+        for column in ('TimeUS', 'TimeMS'):
+            if column in names:
+                self.time_field = column
+                break
+        if self.time_field is not None and 'timestamp' not in names:
+            fields.append(('timestamp', 'f8'))
+        for column, dtype in zip(names, formats):
+            fields.append((column, 'f8' if column in scales else dtype))
+        self.dtype = np.dtype(fields)
+
+    @classmethod
+    def from_record(cls, record):
+        """FMT kaydını doğrula; geçersizse None döndür"""
+        try:
+            name = record['name'].decode('ascii')
+            format = record['format'].decode('ascii')
+            columns = record['columns'].decode('ascii').split(',')
+        except UnicodeDecodeError:
+            return None
+        if not name or not name.isalnum() or not format:
+            return None
+        if any(char not in FORMAT_TYPES for char in format) or len(columns) != len(format):
+            return None
+        size = HEADER_LENGTH + sum(np.dtype(FORMAT_TYPES[char][0]).itemsize for char in format)
+        if size != int(record['length']):
+            return None
+        return cls(int(record['type']), name, size, format, columns)
+
+    def decode(self, raw):
+        """Ham kayıtları ölçeklenmiş yapılandırılmış diziye çevir"""
+        out = np.empty(len(raw), dtype=self.dtype)
+        for column in self.raw_dtype.names:
+            scale = self.scales.get(column)
+            if scale is None:
+                out[column] = raw[column]
+            else:
+                out[column] = raw[column] * scale
+        if self.time_field is not None and 'timestamp' in self.dtype.names:
+            divisor = 1e6 if self.time_field == 'TimeUS' else 1e3
+            out['timestamp'] = raw[self.time_field] / divisor
+        return out
+
+
+def find_headers(buf, start=0, end=None):
+    """buf[start:end] içindeki tüm 0xA3 0x95 konumları"""
+    if end is None:
+        end = len(buf)
+    found = []
+    for chunk_start in range(start, end, SCAN_CHUNK):
+        chunk_end = min(chunk_start + SCAN_CHUNK, end)
+        # Parça sınırına denk gelen başlık için bir bayt fazla bak
+        view = buf[chunk_start:min(chunk_end + 1, len(buf))]
+        hits = np.flatnonzero((view[:-1] == 0xA3) & (view[1:] == 0x95))
+        found.append(hits + chunk_start)
+    if not found:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(found).astype(np.int64)
+
+
+def gather_records(buf, positions, dtype):
+    """Verilen konumlardaki sabit uzunluklu kayıtları tek diziye kopyala"""
+    if not len(positions):
+        return np.empty(0, dtype=dtype)
+    # Kayıt uzunluğunda kayan pencere görünümü; satır seçimi tek kopyadır
+    windows = sliding_window_view(buf, dtype.itemsize)
+    return np.ascontiguousarray(windows[positions]).view(dtype).reshape(len(positions))
+
+
+def read_formats(buf, headers):
+    """Dosyadaki FMT kayıtlarından tip -> MessageFormat tablosu"""
+    size = len(buf)
+    candidates = headers[headers + FMT_LENGTH <= size]
+    candidates = candidates[buf[candidates + 2] == FMT_TYPE]
+    formats = {}
+    for record in gather_records(buf, candidates, FMT_DTYPE):
+        msg_type = int(record['type'])
+        if msg_type in formats:
+            continue
+        message_format = MessageFormat.from_record(record)
+        if message_format is not None:
+            formats[msg_type] = message_format
+    return formats
+
+
+def format_lengths(formats):
+    """Mesaj tipine göre kayıt uzunluğu tablosu (bilinmeyen tip: 0)"""
+    lengths = np.zeros(256, dtype=np.int64)
+    for msg_type, message_format in formats.items():
+        lengths[msg_type] = message_format.length
+    return lengths
+
+
+def follow_chain(positions, lengths):
+    """Gerçek kayıt zincirinde olan başlık adaylarını işaretle"""
+    # Yük içinde rastlantıyla oluşan başlıklar ilk kayıttan başlayan zincire girmez;
+    # düzensiz düğümler arasındaki ulaşılabilirlik pointer jumping ile bulunur
+    count = len(positions)
+    if not count:
+        return np.zeros(0, dtype=bool)
+    jump = np.searchsorted(positions, positions + lengths, side='left')
+    irregular = np.flatnonzero(jump != np.arange(1, count + 1))
+    if not len(irregular):
+        return np.ones(count, dtype=bool)
+
+    # İndirgenmiş çizge: düzensiz düğümden atlayıp ulaşılan ilk düzensiz düğüm
+    size = len(irregular)
+    reduced = np.empty(size + 1, dtype=np.int64)
+    reduced[:size] = np.searchsorted(irregular, jump[irregular], side='left')
+    reduced[size] = size
+    reached = np.zeros(size + 1, dtype=bool)
+    reached[0] = True
+    while reduced[0] != size:
+        reached[reduced[reached]] = True
+        reduced = reduced[reduced]
+    reached[reduced[reached]] = True
+
+    # Zincire giriş noktalarından bir sonraki düzensiz düğüme kadar her şey zincirde
+    entries = np.concatenate(([0], jump[irregular[reached[:size]]]))
+    entries = entries[entries < count]
+    ends = np.searchsorted(irregular, entries, side='left')
+    ends = np.where(ends < size, irregular[np.minimum(ends, size - 1)], count - 1)
+    cover = np.zeros(count + 1, dtype=np.int64)
+    np.add.at(cover, entries, 1)
+    np.add.at(cover, ends + 1, -1)
+    return np.cumsum(cover[:count]) > 0
+
+
+class DataFlashLog:
+    """Bellek eşlemeli DataFlash log okuyucu"""
+    # scan() FMT düzenlerini ve kayıt konumlarını bir kez bulur; messages() bir tipi
+    # satır başına nesne oluşturmadan numpy yapılandırılmış dizisine çözer
+
+    def __init__(self, file_path, formats=None, start=0, end=None, offsets=None):
+        self.file_path = file_path
+        self.formats = formats or {}
+        self.offsets = offsets or {}
+        self._file = open(file_path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Boş dosya eşlenemez
+            self._mmap = None
+        self.buf = np.frombuffer(self._mmap, dtype=np.uint8) if self._mmap is not None else np.empty(0, np.uint8)
+        self.start = start
+        self.end = len(self.buf) if end is None else end
+        # Konumlar önceden (ör. paralel taramayla) bulunduysa tekrar taranmaz
+        if offsets is None:
+            self.scan()
+
+    def close(self):
+        self.buf = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def scan(self):
+        """[start, end) aralığındaki kayıtları bul; aralık kayıt başında başlamalı"""
+        buf = self.buf
+        headers = find_headers(buf, self.start, self.end)
+        headers = headers[headers + HEADER_LENGTH <= self.end]
+        if not self.formats:
+            self.formats = read_formats(buf, headers)
+
+        lengths = format_lengths(self.formats)
+        types = buf[headers + 2]
+        record_lengths = lengths[types]
+        valid = (record_lengths > 0) & (headers + record_lengths <= self.end)
+        headers = headers[valid]
+        types = types[valid]
+
+        on_chain = follow_chain(headers, lengths[types])
+        headers = headers[on_chain]
+        types = types[on_chain]
+
+        # Tiplere göre grupla; sıralama kararlı olduğundan zaman sırası korunur
+        order = np.argsort(types, kind='stable')
+        sorted_types = types[order]
+        bounds = np.flatnonzero(np.diff(sorted_types)) + 1
+        self.offsets = {}
+        for group in np.split(order, bounds):
+            if not len(group):
+                continue
+            message_format = self.formats[int(types[group[0]])]
+            self.offsets[message_format.name] = headers[group]
+
+    def message_types(self):
+        return sorted(self.offsets)
+
+    def count(self, name):
+        offsets = self.offsets.get(name)
+        return 0 if offsets is None else len(offsets)
+
+    def format(self, name):
+        for message_format in self.formats.values():
+            if message_format.name == name:
+                return message_format
+        return None
+
+    def messages(self, name):
+        offsets = self.offsets.get(name)
+        message_format = self.format(name)
+        if offsets is None or message_format is None:
+            return None
+        raw = gather_records(self.buf, offsets, message_format.raw_dtype)
+        return message_format.decode(raw)
+
+    def load(self, types=None):
+        if types is None:
+            types = self.message_types()
+        data = {}
+        for name in types:
+            messages = self.messages(name)
+            if messages is not None:
+                data[name] = messages
+        return data
+
+
+def parse_dataflash(file_path, types=None):
+    """.bin dosyasını mesaj adı -> yapılandırılmış dizi sözlüğüne çevir"""
+    with DataFlashLog(file_path) as log:
+        return log.load(types)
+
+
+def align_boundary(buf, lengths, position, confirm=16, window=64 * 1024):
+    """position'dan sonraki ilk gerçek kayıt başlangıcı (confirm kayıt art arda doğrulanır)"""
+    size = len(buf)
+    while position < size:
+        window_end = min(position + window, size)
+        for candidate in find_headers(buf, position, window_end):
+            p = int(candidate)
+            for _ in range(confirm):
+                if p == size:
+                    break
+                if p + HEADER_LENGTH > size or buf[p] != 0xA3 or buf[p + 1] != 0x95:
+                    p = -1
+                    break
+                length = int(lengths[buf[p + 2]])
+                if not length or p + length > size:
+                    p = -1
+                    break
+                p += length
+            if p >= 0:
+                return int(candidate)
+        position = window_end
+    return size
+
+
+def _range_formats(args):
+    file_path, start, end = args
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        # Aralık sonunda başlayan FMT kaydının tamamı için fazladan oku
+        data = f.read(end - start + FMT_LENGTH - 1)
+    buf = np.frombuffer(data, dtype=np.uint8)
+    headers = find_headers(buf, 0, min(end - start, len(buf)))
+    headers = headers[headers + FMT_LENGTH <= len(buf)]
+    headers = headers[buf[headers + 2] == FMT_TYPE]
+    return gather_records(buf, headers, FMT_DTYPE)
+
+
+def _decode_range(args):
+    file_path, formats, start, end, types = args
+    with DataFlashLog(file_path, formats, start, end) as log:
+        return log.load(types)
+
+
+def _scan_range(args):
+    file_path, formats, start, end = args
+    with DataFlashLog(file_path, formats, start, end) as log:
+        return log.offsets
+
+
+def _plan_ranges(pool, file_path, chunks):
+    """FMT tablosu ve kayıt başlangıcına hizalanmış bayt aralıkları"""
+    size = os.path.getsize(file_path)
+    nominal = [size * i // chunks for i in range(chunks + 1)]
+
+    # FMT kayıtları dosya sırasıyla; aynı tip için ilk geçerli tanım kullanılır
+    formats = {}
+    for records in pool.map(_range_formats, [(file_path, nominal[i], nominal[i + 1]) for i in range(chunks)]):
+        for record in records:
+            msg_type = int(record['type'])
+            if msg_type not in formats:
+                message_format = MessageFormat.from_record(record)
+                if message_format is not None:
+                    formats[msg_type] = message_format
+
+    lengths = format_lengths(formats)
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        buf = np.frombuffer(mm, dtype=np.uint8)
+        bounds = [0] + [align_boundary(buf, lengths, position) for position in nominal[1:-1]] + [size]
+        del buf
+    ranges = [(start, end) for start, end in zip(bounds[:-1], bounds[1:]) if start < end]
+    return formats, ranges
+
+
+def _parallel_chunks(file_path, workers, min_chunk_size):
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return min(workers, os.path.getsize(file_path) // min_chunk_size)
+
+
+def _merge_parts(parts):
+    """Aralık sonuçlarını tip başına dosya sırasıyla birleştir"""
+    data = {}
+    names = sorted(set().union(*parts))
+    for name in names:
+        arrays = [part[name] for part in parts if name in part]
+        data[name] = arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
+    return data
+
+
+def parse_dataflash_parallel(file_path, types=None, workers=None, min_chunk_size=32 * 1024 * 1024):
+    """parse_dataflash'in çok süreçli hali; küçük dosyalar tek süreçte okunur"""
+    # Aralık sınırları gerçek kayıt başlangıcına hizalanır, parçalar dosya sırasıyla birleştirilir
+    chunks = _parallel_chunks(file_path, workers, min_chunk_size)
+    if chunks <= 1:
+        return parse_dataflash(file_path, types)
+
+    with ProcessPoolExecutor(max_workers=chunks) as pool:
+        formats, ranges = _plan_ranges(pool, file_path, chunks)
+        parts = list(pool.map(_decode_range, [(file_path, formats, start, end, types) for start, end in ranges]))
+    return _merge_parts(parts)
+
+
+def open_dataflash(file_path, workers=None, min_chunk_size=32 * 1024 * 1024):
+    """Taranmış ama henüz çözülmemiş DataFlashLog; tipler messages() ile istendikçe çözülür"""
+    chunks = _parallel_chunks(file_path, workers, min_chunk_size)
+    if chunks <= 1:
+        return DataFlashLog(file_path)
+
+    with ProcessPoolExecutor(max_workers=chunks) as pool:
+        formats, ranges = _plan_ranges(pool, file_path, chunks)
+        parts = list(pool.map(_scan_range, [(file_path, formats, start, end) for start, end in ranges]))
+    return DataFlashLog(file_path, formats, offsets=_merge_parts(parts))
+
+
+def rename_fields(array, renames):
+    """Alanları yeniden adlandırılmış görünüm (veri kopyalanmaz)"""
+    if not renames:
+        return array
+    dtype = array.dtype
+    names = [renames.get(name, name) for name in dtype.names]
+    if len(set(names)) != len(names):
+        return array
+    fields = [dtype.fields[name] for name in dtype.names]
+    return array.view(np.dtype({'names': names,
+                                'formats': [field[0] for field in fields],
+                                'offsets': [field[1] for field in fields],
+                                'itemsize': dtype.itemsize}))
+
+
+def analysis_streams(data):
+    """DataFlash mesajlarına analizlerin beklediği adlarla erişim ekle"""
+    streams = dict(data)
+    for stream, (name, renames) in ANALYSIS_STREAMS.items():
+        if name in data:
+            streams[stream] = rename_fields(data[name], renames)
+    return streams
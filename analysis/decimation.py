@@ -0,0 +1,148 @@
+import numpy as np
+
+# Piramitte her seviye bir öncekinin bu kadar örneğini tek kovaya toplar
+PYRAMID_FACTOR = 8
+# Bu kadar noktadan kısa seriler seyreltilmez
+MIN_POINTS = 4096
+# Bir görünümde seçilen seviyeden en fazla piksel başına bu kadar nokta alınır
+POINTS_PER_PIXEL = 4
+
+
+def finite_series(x, y):
+    """NaN içermeyen float64 (x, y) çifti"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    finite = np.isfinite(x) & np.isfinite(y)
+    if not finite.all():
+        x, y = x[finite], y[finite]
+    return x, y
+
+
+def minmax_indices(y, buckets):
+    """Her kovadaki en küçük ve en büyük değerin indeksleri (sıralı)"""
+    n = len(y)
+    if buckets <= 0 or n <= 2 * buckets:
+        return np.arange(n)
+    size = -(-n // buckets)
+    full = n // size
+    # Tam kovalar kopyasız yeniden şekillendirilir, artan kısım ayrıca işlenir
+    blocks = y[:full * size].reshape(full, size)
+    starts = np.arange(full) * size
+    lows = starts + np.argmin(blocks, axis=1)
+    highs = starts + np.argmax(blocks, axis=1)
+    if full * size < n:
+        tail = y[full * size:]
+        lows = np.append(lows, full * size + np.argmin(tail))
+        highs = np.append(highs, full * size + np.argmax(tail))
+
+    # Kova içindeki zaman sırası korunur; min ve max aynı noktaysa bir kez alınır
+    indices = np.stack((np.minimum(lows, highs), np.maximum(lows, highs)), axis=1).ravel()
+    keep = np.ones(len(indices), dtype=bool)
+    keep[1:] = indices[1:] != indices[:-1]
+    return indices[keep]
+
+
+def minmax(x, y, buckets):
+    """Min-max kovalama: her kovadan en küçük ve en büyük nokta (en fazla 2 x kova)"""
+    x, y = finite_series(x, y)
+    indices = minmax_indices(y, buckets)
+    return x[indices], y[indices]
+
+
+def lttb(x, y, threshold):
+    """Largest-Triangle-Three-Buckets seyreltmesi (ilk ve son nokta korunur)"""
+    x, y = finite_series(x, y)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return x, y
+
+    edges = np.floor(np.linspace(1, n - 1, threshold - 1)).astype(np.int64)
+    # Sonraki kova ortalamaları önceden toplu hesaplanır
+    counts = np.diff(edges)
+    counts[counts == 0] = 1
+    x_means = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / counts
+    y_means = np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / counts
+    x_means = np.append(x_means[1:], x[-1])
+    y_means = np.append(y_means[1:], y[-1])
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    previous = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], max(edges[i + 1], edges[i] + 1)
+        px, py = x[previous], y[previous]
+        area = np.abs((px - x_means[i]) * (y[start:end] - py) -
+                      (px - x[start:end]) * (y_means[i] - py))
+        previous = start + int(np.argmax(area))
+        selected[i + 1] = previous
+    return x[selected], y[selected]
+
+
+class DecimationPyramid:
+    """Yakınlaştırma/kaydırma için önceden hesaplanmış çok çözünürlüklü seri"""
+    # Her seviye bir öncekinin min/max kovalarıdır, kısa darbeler kaybolmaz; view() görünen
+    # aralığa yetecek seviyeyi seçtiği için çizim maliyeti log uzunluğundan bağımsızdır
+
+    def __init__(self, x, y, factor=PYRAMID_FACTOR, min_points=MIN_POINTS):
+        x, y = finite_series(x, y)
+        if len(x) > 1 and np.any(x[1:] < x[:-1]):
+            order = np.argsort(x, kind='stable')
+            x, y = x[order], y[order]
+        self.levels = [(x, y)]
+        while len(self.levels[-1][0]) > min_points:
+            level_x, level_y = self.levels[-1]
+            indices = minmax_indices(level_y, -(-len(level_y) // factor))
+            if len(indices) >= len(level_y):
+                break
+            self.levels.append((level_x[indices], level_y[indices]))
+
+    def __len__(self):
+        return len(self.levels[0][0])
+
+    @property
+    def x_range(self):
+        x = self.levels[0][0]
+        return (float(x[0]), float(x[-1])) if len(x) else (0.0, 0.0)
+
+    def view(self, x_min, x_max, width, method='minmax'):
+        """[x_min, x_max] aralığı için yaklaşık width piksellik nokta kümesi"""
+        budget = max(int(width), 1) * POINTS_PER_PIXEL
+        for level_x, level_y in self.levels:
+            # Kenar noktaları da alınır ki çizgi görünüm dışına uzansın
+            start = max(np.searchsorted(level_x, x_min, side='left') - 1, 0)
+            end = min(np.searchsorted(level_x, x_max, side='right') + 1, len(level_x))
+            if end - start <= budget or (level_x is self.levels[-1][0]):
+                break
+        x, y = level_x[start:end], level_y[start:end]
+        if method == 'lttb':
+            return lttb(x, y, 2 * max(int(width), 1))
+        return minmax(x, y, max(int(width), 1))
+
+
+class DecimatedLine:
+    """Eksen sınırları değiştikçe piramitten yeniden seyreltilen matplotlib çizgisi"""
+
+    def __init__(self, ax, x, y, method='minmax', **kwargs):
+        self.ax = ax
+        self.method = method
+        self.pyramid = DecimationPyramid(x, y)
+        self.line, = ax.plot([], [], **kwargs)
+        self.update()
+        ax.callbacks.connect('xlim_changed', self.update)
+
+    def width(self):
+        # Eksenin ekrandaki piksel genişliği
+        return max(int(self.ax.get_window_extent().width), 100)
+
+    def update(self, ax=None):
+        if not len(self.pyramid):
+            return
+        x_min, x_max = self.ax.get_xlim() if ax is not None else self.pyramid.x_range
+        x, y = self.pyramid.view(x_min, x_max, self.width(), self.method)
+        self.line.set_data(x, y)
+        if ax is None:
+            self.ax.relim()
+            self.ax.autoscale_view()
+        else:
+            self.ax.figure.canvas.draw_idle()
@@ -0,0 +1,207 @@
+import numpy as np
+
+from analysis.alignment import align, cumulative_distance, integrate, join_streams, primary_instance
+from analysis.vibration import gyro_noise, vibe_summary, vibration_summary
+
+# Bu süreden uzun veri boşluklarına ara değer üretilmez (sn)
+MAX_ALIGN_GAP = 5.0
+
+
+def _stream(log_data, name):
+    # Çok örnekli akışlarda (GPS[0]/[1], BAT[0]/[1]) yalnızca ilk örnek
+    stream = primary_instance(log_data.get(name))
+    if stream is None or not len(stream):
+        return None
+    return stream
+
+
+def analyze_flight_performance(log_data):
+    results = {}
+    gps = _stream(log_data, 'GPS')
+    attitude = _stream(log_data, 'ATTITUDE')
+
+    # Uçuş süresi
+    if gps is not None:
+        timestamps = gps['timestamp']
+        results['flight_time'] = float(timestamps[-1] - timestamps[0])
+
+        # Maksimum yükseklik
+        results['max_altitude'] = float(np.nanmax(gps['alt']))
+
+        # Ortalama hız
+        _, distance = cumulative_distance(gps)
+        if results['flight_time'] > 0:
+            results['avg_speed'] = float(distance[-1] / results['flight_time'])
+
+    # Stabilite analizi
+    if attitude is not None:
+        results['stability'] = {
+            'roll_deviation': float(np.nanstd(attitude['roll'])),
+            'pitch_deviation': float(np.nanstd(attitude['pitch']))
+        }
+
+    return results
+
+
+def analyze_battery(log_data):
+    results = {}
+
+    # Batarya mesajı yoksa akım sensörü verisi kullanılır
+    source = 'BATTERY'
+    battery = _stream(log_data, source)
+    if battery is None:
+        source = 'CURRENT'
+        battery = _stream(log_data, source)
+
+    if battery is not None:
+        # Gerilim ve akım farklı hızlarda gelebilir; batarya zaman eksenine hizalanır
+        current_source = source
+        currents = np.asarray(battery['current'], dtype=np.float64)
+        if np.all(np.isnan(currents)) and source == 'BATTERY' and _stream(log_data, 'CURRENT') is not None:
+            current_source = 'CURRENT'
+        joined = join_streams(log_data, {
+            'voltage': (source, 'voltage'),
+            'current': (current_source, 'current')
+        }, reference=source, max_gap=MAX_ALIGN_GAP)
+        timestamps = joined['timestamp']
+        voltages = joined['voltage']
+        currents = joined['current']
+        power = voltages * currents
+
+        results['min_voltage'] = float(np.nanmin(voltages))
+        results['max_current'] = float(np.nanmax(currents))
+
+        # Ortalama güç zamana göre ağırlıklıdır: enerji / süre
+        duration = timestamps[-1] - timestamps[0]
+        energy = integrate(timestamps, power)
+        results['energy_wh'] = energy / 3600
+        results['avg_power'] = float(energy / duration) if duration > 0 else float(np.nanmean(power))
+
+        # Enerji verimliliği: GPS yolu batarya zamanlarına hizalanır
+        gps = _stream(log_data, 'GPS')
+        if gps is not None:
+            gps_times, distance = cumulative_distance(gps)
+            travelled = align(timestamps, gps_times, distance, max_gap=MAX_ALIGN_GAP)
+            covered = ~np.isnan(travelled)
+            if covered.sum() > 1:
+                distance_km = (np.nanmax(travelled) - np.nanmin(travelled)) / 1000
+                window_energy = integrate(timestamps[covered], power[covered]) / 3600
+                results['distance_km'] = float(distance_km)
+                if distance_km > 0.01:
+                    results['energy_per_km'] = float(window_energy / distance_km)
+
+        # Voltage sag analizi
+        voltage_sag = np.nanmax(voltages) - np.nanmin(voltages)
+        results['voltage_sag'] = float(voltage_sag)
+
+        # Batarya sağlığı değerlendirmesi
+        results['health_score'] = evaluate_battery_health(voltages, currents)
+
+    return results
+
+
+def evaluate_battery_health(voltages, currents):
+    # Batarya sağlığı skorlama algoritması
+    # 0-100 arası bir skor döndürür
+    try:
+        return battery_health_score(float(np.nanstd(voltages)),
+                                    float(np.nanmean(currents)),
+                                    float(np.nanmax(currents)))
+    except Exception:
+        return 0
+
+
+def battery_health_score(voltage_std, current_mean, current_max):
+    # Özet istatistiklerden skor; canlı analiz de aynı formülü kullanır
+    voltage_stability = 100 - (voltage_std * 10)
+    current_efficiency = 100 - (current_mean / current_max * 100) if current_max > 0 else 0
+
+    health_score = (voltage_stability + current_efficiency) / 2
+    return float(max(0, min(100, health_score)))
+
+
+def analyze_sensor_health(log_data):
+    results = {}
+
+    # Yüksek hızlı ivme kaydı (ACC) varsa onu, yoksa IMU'yu kullan
+    accel = _stream(log_data, 'ACC')
+    imu = _stream(log_data, 'IMU')
+    if accel is None:
+        accel = imu
+    if accel is not None:
+        summary = vibration_summary(accel)
+        results['imu_sample_rate'] = summary['sample_rate']
+        if summary['axes']:
+            results['vibration_rms'] = {axis: values['rms'] for axis, values in summary['axes'].items()}
+            results['vibration_level'] = summary['max_window_rms']
+            results['dominant_frequencies'] = {axis: [freq for freq, _ in values['peaks']]
+                                               for axis, values in summary['axes'].items()}
+        results['clipping'] = summary.get('clipped_samples', 0)
+        if 'harmonics' in summary:
+            results['motor_harmonics'] = summary['harmonics']
+
+    gyro = _stream(log_data, 'GYR')
+    if gyro is None:
+        gyro = imu
+    if gyro is not None:
+        noise = gyro_noise(gyro)
+        if noise:
+            results['gyro_noise'] = noise
+
+    # Uçuş kontrolcüsünün kendi titreşim ölçümü
+    vibe = _stream(log_data, 'VIBE')
+    if vibe is not None:
+        results['vibe'] = vibe_summary(vibe)
+        if results['vibe']['clips'] is not None:
+            results['vibe_clips'] = results['vibe']['clips']
+
+    return results
+
+
+def evaluate_parameter_status(parameter, value):
+    # Parametre değerlerini değerlendir
+    if parameter == 'flight_time':
+        if value > 600:  # 10 dakikadan uzun uçuş
+            return "İyi"
+        elif value > 300:  # 5 dakikadan uzun uçuş
+            return "Orta"
+        else:
+            return "Kötü"
+    elif parameter == 'max_altitude':
+        if value < 400:
+            return "İyi"
+        elif value < 500:
+            return "Orta"
+        else:
+            return "Kötü"
+    elif parameter == 'health_score':
+        if value > 80:
+            return "İyi"
+        elif value > 60:
+            return "Orta"
+        else:
+            return "Kötü"
+    elif parameter == 'vibration_level':
+        # ArduPilot: 30 m/s² altı kabul edilebilir, 60 üstü sorunlu
+        if value < 30:
+            return "İyi"
+        elif value < 60:
+            return "Orta"
+        else:
+            return "Kötü"
+    elif parameter in ('clipping', 'vibe_clips'):
+        if value == 0:
+            return "İyi"
+        elif value < 100:
+            return "Orta"
+        else:
+            return "Kötü"
+    return "Değerlendirilmedi"
+
+
+# Komut satırı adı -> (arayüzdeki analiz adı, fonksiyon)
+ANALYSES = {
+    'flight_performance': ("Uçuş Performansı", analyze_flight_performance),
+    'battery': ("Batarya Analizi", analyze_battery),
+    'sensor_health': ("Sensör Sağlığı", analyze_sensor_health),
+}
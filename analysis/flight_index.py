@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta, timezone
+import os
+
+import numpy as np
+
+from analysis.log_cache import file_key
+
+# GPS haftası/milisaniyesinden UTC zamanına
+GPS_EPOCH = datetime(1980, 1, 6, tzinfo=timezone.utc)
+GPS_LEAP_SECONDS = 18
+# Açılış mesajlarında sürüm bilgisini taşıyan araç tipleri
+FIRMWARE_PREFIXES = ('ArduCopter', 'ArduPlane', 'ArduRover', 'ArduSub', 'Rover',
+                     'Blimp', 'AntennaTracker', 'PX4')
+
+
+def _field_stream(log, name, field):
+    stream = log.get(name)
+    if stream is None or not len(stream) or field not in (stream.dtype.names or ()):
+        return None
+    return stream
+
+
+def vehicle_info(log):
+    """Logdan araç kimliği (SYSID_THISMAV), firmware sürümü ve başlangıç zamanı"""
+    info = {'vehicle_id': None, 'firmware': None, 'started_at': None}
+
+    parameters = _field_stream(log, 'PARM', 'Name')
+    if parameters is not None:
+        values = parameters['Value'][parameters['Name'] == b'SYSID_THISMAV']
+        if len(values):
+            info['vehicle_id'] = int(values[-1])
+
+    messages = _field_stream(log, 'MSG', 'Message')
+    if messages is not None:
+        for text in messages['Message'][:50]:
+            text = text.decode('ascii', 'ignore').strip()
+            if text.startswith(FIRMWARE_PREFIXES):
+                info['firmware'] = text
+                break
+
+    gps = _field_stream(log, 'GPS', 'GWk')
+    if gps is not None and 'GMS' in gps.dtype.names:
+        fixed = np.flatnonzero(gps['GWk'] > 0)
+        if len(fixed):
+            first = fixed[0]
+            started = GPS_EPOCH + timedelta(weeks=int(gps['GWk'][first]),
+                                            milliseconds=int(gps['GMS'][first]),
+                                            seconds=-GPS_LEAP_SECONDS)
+            # GPS kilidi uçuş başından sonra gelmiş olabilir
+            started -= timedelta(seconds=float(gps['timestamp'][first] - gps['timestamp'][0]))
+            info['started_at'] = started.strftime('%Y-%m-%d %H:%M:%S')
+    return info
+
+
+def flight_record(summary):
+    """Toplu analiz özetinden flights tablosu satırı"""
+    analyses = summary.get('analyses', {})
+    performance = analyses.get('flight_performance', {})
+    battery = analyses.get('battery', {})
+    sensors = analyses.get('sensor_health', {})
+    vehicle = summary.get('vehicle') or {}
+
+    started_at = vehicle.get('started_at')
+    if started_at is None:
+        # GPS zamanı yoksa dosyanın değiştirilme zamanı kullanılır
+        modified = datetime.fromtimestamp(os.path.getmtime(summary['file']), timezone.utc)
+        started_at = modified.strftime('%Y-%m-%d %H:%M:%S')
+
+    vibe = sensors.get('vibe', {})
+    vibe_levels = [vibe[key] for key in ('max_x', 'max_y', 'max_z') if key in vibe]
+    return {
+        'file_path': summary['file'],
+        'file_key': summary.get('file_key'),
+        'vehicle_id': vehicle.get('vehicle_id'),
+        'firmware': vehicle.get('firmware'),
+        'started_at': started_at,
+        'duration': performance.get('flight_time'),
+        'max_altitude': performance.get('max_altitude'),
+        'min_voltage': battery.get('min_voltage'),
+        'voltage_sag': battery.get('voltage_sag'),
+        'max_current': battery.get('max_current'),
+        'energy_wh': battery.get('energy_wh'),
+        'vibration_level': sensors.get('vibration_level'),
+        'vibe_max': max(vibe_levels) if vibe_levels else None,
+        # VIBE Clip sayaçlarının log boyunca toplam artışı; ham ivme örneği
+        # sayısıyla toplanmaz (farklı birimler). VIBE yoksa NULL.
+        'clipping': sensors.get('vibe_clips')
+    }
+
+
+def ingest_log(db, file_path, use_cache=True, force=False):
+    """Logu analiz edip uçuş dizinine ekle; satır kimliğini ya da başarısızsa None döndürür"""
+    from analysis.batch_analyze import analyze_file
+
+    file_path = os.path.abspath(file_path)
+    if not force:
+        existing = db.find_flight(file_path)
+        if existing is not None and existing['file_key'] == file_key(file_path):
+            return existing['id']
+
+    summary = analyze_file(file_path, use_cache=use_cache)
+    if summary['error']:
+        print(f"Uçuş dizine eklenemedi: {file_path}: {summary['error']}")
+        return None
+    return db.add_flight(flight_record(summary))
@@ -0,0 +1,110 @@
+from collections.abc import Mapping
+from functools import partial
+import os
+
+from analysis.dataflash import ANALYSIS_STREAMS, open_dataflash, rename_fields
+from analysis.log_cache import LogCache
+from analysis.text_log import TextLog
+
+
+class LazyLog(Mapping):
+    """Mesaj tiplerini ilk erişimde çözen log"""
+    # Önce önbelleğe bakılır; aliases analizlerdeki adları kaynaktaki mesaj ve alan adlarına çevirir
+
+    def __init__(self, file_path, open_source, aliases=None, cache=None):
+        self.file_path = file_path
+        self.aliases = aliases or {}
+        self.cache = cache
+        self._open_source = open_source
+        self._source = None
+        self._data = {}
+        self._missing = set()
+        self._types = None
+
+    def source(self):
+        if self._source is None:
+            self._source = self._open_source(self.file_path)
+        return self._source
+
+    def close(self):
+        if self._source is not None:
+            self._source.close()
+            self._source = None
+        self._data = {}
+
+    def message_types(self):
+        """Kaynaktaki mesaj tipleri ve karşılıkları bulunan takma adlar"""
+        if self._types is None:
+            types = None
+            if self.cache is not None and self._source is None:
+                meta = self.cache.meta(self.file_path)
+                if meta is not None:
+                    types = meta.get('message_types')
+            if types is None:
+                types = list(self.source().message_types())
+                if self.cache is not None:
+                    self.cache.put(self.file_path, {}, message_types=types)
+            aliases = [alias for alias, (name, _) in self.aliases.items()
+                       if name in types and alias not in types]
+            self._types = types + aliases
+        return self._types
+
+    def __bool__(self):
+        # Boş kontrolü için dosyanın taranması gerekmez
+        return True
+
+    def __iter__(self):
+        return iter(self.message_types())
+
+    def __len__(self):
+        return len(self.message_types())
+
+    def __contains__(self, name):
+        if name in self._data:
+            return True
+        return name not in self._missing and name in self.message_types()
+
+    def __getitem__(self, name):
+        messages = self._load(name)
+        if messages is None:
+            raise KeyError(name)
+        return messages
+
+    def load(self, names):
+        """Birden fazla tipi önceden çöz"""
+        return {name: self[name] for name in names if name in self}
+
+    def _load(self, name):
+        if name in self._data:
+            return self._data[name]
+        if name in self._missing:
+            return None
+
+        source_name, renames = self.aliases.get(name, (name, None))
+        messages = None
+        if self.cache is not None:
+            cached = self.cache.get(self.file_path, [source_name])
+            if cached:
+                messages = cached.get(source_name)
+        if messages is None:
+            messages = self.source().messages(source_name)
+            if messages is not None and self.cache is not None:
+                self.cache.put(self.file_path, {source_name: messages})
+
+        if messages is None:
+            self._missing.add(name)
+            return None
+        messages = rename_fields(messages, renames)
+        self._data[name] = messages
+        return messages
+
+
+def open_log(file_path, use_cache=True, workers=None):
+    """Uzantıya göre .bin ya da .log dosyasını tembel log olarak aç (workers: tarama süreç sayısı)"""
+    ext = os.path.splitext(file_path)[1].lower()
+    cache = LogCache() if use_cache else None
+    if ext == '.bin':
+        return LazyLog(file_path, partial(open_dataflash, workers=workers), ANALYSIS_STREAMS, cache)
+    elif ext == '.log':
+        return LazyLog(file_path, TextLog, cache=cache)
+    raise ValueError("Desteklenmeyen log formatı")
@@ -0,0 +1,188 @@
+"""Canlı telemetriden uçuş sırasında güncellenen analizler"""
+import math
+import threading
+
+from analysis.flight_analysis import MAX_ALIGN_GAP, battery_health_score
+
+# Analizin ihtiyaç duyduğu MAVLink mesajları (seçici çözmede istenir)
+LIVE_MESSAGES = ('ATTITUDE', 'GLOBAL_POSITION_INT', 'SYS_STATUS', 'VIBRATION')
+# SYS_STATUS'ta ölçülmeyen gerilim UINT16_MAX (mV) olarak gelir
+UNKNOWN_VOLTAGE = 65.535
+
+
+class RunningStats:
+    """Welford yöntemiyle akan ortalama, varyans, en küçük ve en büyük değer"""
+    __slots__ = ('count', 'mean', '_m2', 'min', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def variance(self):
+        # np.std ile aynı (popülasyon) varyansı
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+
+class FlightStatistics:
+    """Tek aracın akan uçuş istatistikleri"""
+
+    def __init__(self):
+        self.first_time = None
+        self.last_time = None
+        self.roll = RunningStats()
+        self.pitch = RunningStats()
+        # GLOBAL_POSITION_INT: alt MSL (log analizindeki GPS yüksekliği gibi), relative_alt eve göre
+        self.altitude = RunningStats()
+        self.relative_altitude = RunningStats()
+        self.voltage = RunningStats()
+        self.current = RunningStats()
+
+        # Enerji, ardışık güç örnekleri arasında yamuk kuralıyla toplanır
+        self.energy = 0.0
+        self.powered_time = 0.0
+        self._last_power = None
+
+        # VIBRATION, logdaki VIBE mesajının canlı karşılığıdır
+        self.vibration = [RunningStats(), RunningStats(), RunningStats()]
+        self.first_clipping = None
+        self.clipping = (0, 0, 0)
+
+    def update(self, record):
+        family = record.family
+        timestamp = record.timestamp
+        if family == 'attitude':
+            self.roll.add(math.degrees(record.roll))
+            self.pitch.add(math.degrees(record.pitch))
+        elif family == 'position':
+            if self.first_time is None:
+                self.first_time = timestamp
+            self.last_time = timestamp
+            self.altitude.add(record.alt)
+            self.relative_altitude.add(record.relative_alt)
+        elif family == 'sys_status':
+            self.update_battery(record.voltage, record.current, timestamp)
+        elif family == 'vibration':
+            levels = (record.vibration_x, record.vibration_y, record.vibration_z)
+            for stats, level in zip(self.vibration, levels):
+                stats.add(level)
+            # Kırpılma sayaçları açılıştan beri birikimlidir; ilk görülen değer düşülür
+            self.clipping = (record.clipping_0, record.clipping_1, record.clipping_2)
+            if self.first_clipping is None:
+                self.first_clipping = self.clipping
+
+    def update_battery(self, voltage, current, timestamp):
+        if voltage <= 0 or voltage >= UNKNOWN_VOLTAGE:
+            return
+        self.voltage.add(voltage)
+        if current < 0:
+            # Akım sensörü yok
+            self._last_power = None
+            return
+        self.current.add(current)
+
+        power = voltage * current
+        if self._last_power is not None:
+            last_time, last_power = self._last_power
+            dt = timestamp - last_time
+            # Bağlantı kopukluklarının üzerinden integral alınmaz
+            if 0 < dt <= MAX_ALIGN_GAP:
+                self.energy += dt * (power + last_power) / 2
+                self.powered_time += dt
+        self._last_power = (timestamp, power)
+
+    def results(self):
+        results = {}
+        if self.first_time is not None:
+            results['flight_time'] = self.last_time - self.first_time
+            results['max_altitude'] = self.altitude.max
+            results['max_relative_alt'] = self.relative_altitude.max
+        if self.roll.count:
+            results['stability'] = {
+                'roll_deviation': self.roll.std,
+                'pitch_deviation': self.pitch.std
+            }
+        if self.voltage.count:
+            results['min_voltage'] = self.voltage.min
+            results['voltage_sag'] = self.voltage.max - self.voltage.min
+        if self.current.count:
+            results['max_current'] = self.current.max
+            results['energy_wh'] = self.energy / 3600
+            if self.powered_time > 0:
+                results['avg_power'] = self.energy / self.powered_time
+            results['health_score'] = battery_health_score(self.voltage.std, self.current.mean,
+                                                           self.current.max)
+        if self.first_clipping is not None:
+            # Log analizindeki vibe_summary ile aynı alanlar
+            vibe = {}
+            for axis, stats in zip(('x', 'y', 'z'), self.vibration):
+                vibe[f'max_{axis}'] = stats.max
+                vibe[f'mean_{axis}'] = stats.mean
+            vibe['clips'] = sum(self.clipping) - sum(self.first_clipping)
+            results['vibe'] = vibe
+            results['vibe_max'] = max(stats.max for stats in self.vibration)
+            results['vibe_clips'] = vibe['clips']
+        return results
+
+
+class LiveFlightAnalytics:
+    """MAVLinkHandler kayıtlarından araç başına canlı uçuş analizi"""
+    # on_record okuyucu thread'inde çağrılır; results() herhangi bir anda sorgulanabilir
+
+    def __init__(self):
+        self.vehicles = {}
+        self._lock = threading.Lock()
+        self.handler = None
+
+    def attach(self, handler):
+        self.handler = handler
+        handler.add_record_listener(self.on_record)
+        handler.require_messages(*LIVE_MESSAGES)
+
+    def detach(self):
+        if self.handler is not None:
+            self.handler.remove_record_listener(self.on_record)
+            self.handler = None
+
+    def on_record(self, system_id, record):
+        if record.family not in ('attitude', 'position', 'sys_status', 'vibration'):
+            return
+        with self._lock:
+            vehicle = self.vehicles.get(system_id)
+            if vehicle is None:
+                vehicle = self.vehicles[system_id] = FlightStatistics()
+            vehicle.update(record)
+
+    def reset(self, system_id=None):
+        """Yeni uçuş için istatistikleri sıfırla (ör. arm edildiğinde)"""
+        with self._lock:
+            if system_id is None:
+                self.vehicles.clear()
+            else:
+                self.vehicles.pop(system_id, None)
+
+    def results(self, system_id=None):
+        if system_id is None and self.handler is not None:
+            system_id = self.handler.state.primary_system
+        with self._lock:
+            vehicle = self.vehicles.get(system_id)
+            if vehicle is None and system_id is None and self.vehicles:
+                vehicle = next(iter(self.vehicles.values()))
+            return vehicle.results() if vehicle is not None else {}
@@ -13,74 +13,35 @@
         
         if file_path:
             try:
+                # Önceki logun dosya eşlemesini bırak
+                if hasattr(self.log_data, 'close'):
+                    self.log_data.close()
                 # Log dosyasını oku
                 self.log_data = self.parse_log_file(file_path)
+                self.log_file = file_path
                 self.file_label.setText(f"Dosya: {os.path.basename(file_path)}")
                 QMessageBox.information(self, "Başarılı", "Log dosyası yüklendi!")
             except Exception as e:
                 QMessageBox.warning(self, "Hata", f"Log dosyası yüklenemedi: {str(e)}")
 
-    def parse_log_file(self, file_path):
-        # Log formatını kontrol et
-        ext = os.path.splitext(file_path)[1].lower()
-        
-        if ext == '.bin':
-            return self.parse_binary_log(file_path)
-        elif ext == '.log':
-            return self.parse_text_log(file_path)
-        else:
-            raise ValueError("Desteklenmeyen log formatı")
+    def index_flight(self, db_file='mission_planner.db'):
+        # Yüklü logun özetini filo uçuş dizinine ekle (değişmediyse yeniden analiz edilmez)
+        from analysis.flight_index import ingest_log
+        from database.db_manager import DatabaseManager
 
-    def parse_binary_log(self, file_path):
-        # Binary log parser
-        data = {}
-        try:
-            with open(file_path, 'rb') as f:
-                # TODO: Binary log format parsing
-                # ArduPilot binary log format implementasyonu
-                pass
-            return data
-        except Exception as e:
-            raise Exception(f"Binary log parse hatası: {str(e)}")
+        if not getattr(self, 'log_file', None):
+            QMessageBox.warning(self, "Uyarı", "Önce log dosyası yükleyin!")
+            return None
+        flight_id = ingest_log(DatabaseManager(db_file), self.log_file)
+        if flight_id is None:
+            QMessageBox.warning(self, "Hata", "Uçuş dizine eklenemedi!")
+        return flight_id
 
-    def parse_text_log(self, file_path):
-        # Text log parser
-        data = {
-            'ATTITUDE': [],
-            'GPS': [],
-            'CURRENT': [],
-            'BATTERY': [],
-            'RCIN': [],
-            'SERVO_OUTPUT': [],
-            'IMU': []
-        }
-        
-        try:
-            with open(file_path, 'r') as f:
-                for line in f:
-                    if line.startswith('ATTITUDE'):
-                        # Örnek: ATTITUDE,timestamp,roll,pitch,yaw
-                        parts = line.strip().split(',')
-                        data['ATTITUDE'].append({
-                            'timestamp': float(parts[1]),
-                            'roll': float(parts[2]),
-                            'pitch': float(parts[3]),
-                            'yaw': float(parts[4])
-                        })
-                    elif line.startswith('GPS'):
-                        # GPS verilerini parse et
-                        parts = line.strip().split(',')
-                        data['GPS'].append({
-                            'timestamp': float(parts[1]),
-                            'lat': float(parts[2]),
-                            'lon': float(parts[3]),
-                            'alt': float(parts[4]),
-                            'hdop': float(parts[5])
-                        })
-                    # Diğer veri tipleri için benzer parsing
-            return data
-        except Exception as e:
-            raise Exception(f"Text log parse hatası: {str(e)}")
+    def parse_log_file(self, file_path):
+        # Log formatı uzantıdan belirlenir; mesaj tipleri (ör. Batarya
+        # Analizi için yalnızca BAT/CURR) analizler eriştikçe çözülür
+        from analysis.lazy_log import open_log
+        return open_log(file_path)
 
     def analyze_log(self):
         if not self.log_data:
@@ -108,66 +69,22 @@
             QMessageBox.warning(self, "Hata", f"Analiz hatası: {str(e)}")
 
     def analyze_flight_performance(self):
-        results = {}
-        
-        # Uçuş süresi
-        if 'GPS' in self.log_data and self.log_data['GPS']:
-            start_time = self.log_data['GPS'][0]['timestamp']
-            end_time = self.log_data['GPS'][-1]['timestamp']
-            flight_time = end_time - start_time
-            results['flight_time'] = flight_time
-        
-        # Maksimum yükseklik
-        if 'GPS' in self.log_data:
-            max_alt = max(point['alt'] for point in self.log_data['GPS'])
-            results['max_altitude'] = max_alt
-        
-        # Ortalama hız
-        # TODO: Hız hesaplaması
-        
-        # Stabilite analizi
-        if 'ATTITUDE' in self.log_data:
-            roll_std = np.std([point['roll'] for point in self.log_data['ATTITUDE']])
-            pitch_std = np.std([point['pitch'] for point in self.log_data['ATTITUDE']])
-            results['stability'] = {
-                'roll_deviation': roll_std,
-                'pitch_deviation': pitch_std
-            }
-        
-        return results
+        # Analizler Qt'den bağımsızdır; toplu komut satırı aracı da kullanır
+        from analysis import flight_analysis
+        return flight_analysis.analyze_flight_performance(self.log_data)
 
     def analyze_battery(self):
-        results = {}
-        
-        if 'BATTERY' in self.log_data:
-            voltages = [point.get('voltage', 0) for point in self.log_data['BATTERY']]
-            currents = [point.get('current', 0) for point in self.log_data['BATTERY']]
-            
-            results['min_voltage'] = min(voltages)
-            results['max_current'] = max(currents)
-            results['avg_power'] = np.mean(np.array(voltages) * np.array(currents))
-            
-            # Voltage sag analizi
-            voltage_sag = max(voltages) - min(voltages)
-            results['voltage_sag'] = voltage_sag
-            
-            # Batarya sağlığı değerlendirmesi
-            health_score = self.evaluate_battery_health(voltages, currents)
-            results['health_score'] = health_score
-        
-        return results
+        from analysis import flight_analysis
+        return flight_analysis.analyze_battery(self.log_data)
 
     def evaluate_battery_health(self, voltages, currents):
-        # Batarya sağlığı skorlama algoritması
-        # 0-100 arası bir skor döndürür
-        try:
-            voltage_stability = 100 - (np.std(voltages) * 10)
-            current_efficiency = 100 - (np.mean(currents) / max(currents) * 100)
-            
-            health_score = (voltage_stability + current_efficiency) / 2
-            return max(0, min(100, health_score))
-        except:
-            return 0
+        from analysis import flight_analysis
+        return flight_analysis.evaluate_battery_health(voltages, currents)
+
+    def analyze_sensor_health(self):
+        # IMU/ACC titreşim spektrumu, kırpılma ve VIBE özeti
+        from analysis import flight_analysis
+        return flight_analysis.analyze_sensor_health(self.log_data)
 
     def display_results(self, results):
         self.results_table.setRowCount(0)
@@ -198,29 +115,8 @@
             self.results_table.setItem(row, 2, status_item)
 
     def evaluate_parameter_status(self, parameter, value):
-        # Parametre değerlerini değerlendir
-        if parameter == 'flight_time':
-            if value > 600:  # 10 dakikadan uzun uçuş
-                return "İyi"
-            elif value > 300:  # 5 dakikadan uzun uçuş
-                return "Orta"
-            else:
-                return "Kötü"
-        elif parameter == 'max_altitude':
-            if value < 400:
-                return "İyi"
-            elif value < 500:
-                return "Orta"
-            else:
-                return "Kötü"
-        elif parameter == 'health_score':
-            if value > 80:
-                return "İyi"
-            elif value > 60:
-                return "Orta"
-            else:
-                return "Kötü"
-        return "Değerlendirilmedi"
+        from analysis import flight_analysis
+        return flight_analysis.evaluate_parameter_status(parameter, value)
 
     def export_report(self):
         if not self.log_data:
@@ -235,74 +131,46 @@
         )
         
         if file_path:
-            try:
-                self.generate_html_report(file_path)
-                QMessageBox.information(self, "Başarılı", "Rapor kaydedildi!")
-            except Exception as e:
-                QMessageBox.warning(self, "Hata", f"Rapor oluşturma hatası: {str(e)}")
-
-    def generate_html_report(self, file_path):
-        # HTML rapor şablonu
-        html_template = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Uçuş Analiz Raporu</title>
-            <style>
-                body { font-family: Arial, sans-serif; margin: 20px; }
-                .header { background-color: #f0f0f0; padding: 10px; }
-                .section { margin: 20px 0; }
-                .good { color: green; }
-                .medium { color: orange; }
-                .bad { color: red; }
-                table { border-collapse: collapse; width: 100%; }
-                th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
-                th { background-color: #f0f0f0; }
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>Uçuş Analiz Raporu</h1>
-                <p>Oluşturulma Tarihi: {date}</p>
-            </div>
-            {content}
-        </body>
-        </html>
-        """
+            # Rapor arka planda yazılır; grafikler HTML'e gömülür
+            from analysis.report import write_html_report
+            self.start_report(write_html_report, file_path, **self.report_contents())
+
+    def start_report(self, writer, file_path, **kwargs):
+        from PyQt6.QtWidgets import QProgressDialog
+        from services.report_thread import ReportThread
+
+        # Her raporun kendi ilerleme penceresi vardır; aynı anda birden fazla
+        # rapor yazılabilir ve ReportThread bitene kadar kendini canlı tutar
+        progress = QProgressDialog("Rapor oluşturuluyor...", None, 0, 100, self)
+        progress.setWindowTitle("Rapor")
+        progress.setMinimumDuration(0)
+
+        thread = ReportThread(writer, file_path, **kwargs)
+        thread.progress_updated.connect(progress.setValue)
+        thread.status_updated.connect(progress.setLabelText)
+        thread.completed.connect(progress.close)
+        thread.completed.connect(self.report_finished)
+        thread.start()
+        return thread
+
+    def report_finished(self, success, message):
+        if success:
+            QMessageBox.information(self, "Başarılı", "Rapor kaydedildi!")
+        else:
+            QMessageBox.warning(self, "Hata", f"Rapor oluşturma hatası: {message}")
 
-        # Rapor içeriğini oluştur
-        content = "<div class='section'><h2>Analiz Sonuçları</h2><table>"
-        content += "<tr><th>Parametre</th><th>Değer</th><th>Durum</th></tr>"
-        
+    def report_contents(self):
+        # Sonuç tablosu ve grafikler arayüz iş parçacığında toplanır
+        rows = []
         for row in range(self.results_table.rowCount()):
-            param = self.results_table.item(row, 0).text()
-            value = self.results_table.item(row, 1).text()
-            status = self.results_table.item(row, 2).text()
-            
-            status_class = ""
-            if status == "İyi":
-                status_class = "good"
-            elif status == "Orta":
-                status_class = "medium"
-            else:
-                status_class = "bad"
-            
-            content += f"<tr><td>{param}</td><td>{value}</td><td class='{status_class}'>{status}</td></tr>"
-        
-        content += "</table></div>"
+            rows.append((self.results_table.item(row, 0).text(),
+                         self.results_table.item(row, 1).text(),
+                         self.results_table.item(row, 2).text()))
 
-        # Grafikleri ekle
-        if hasattr(self, 'plot_data'):
-            content += "<div class='section'><h2>Grafikler</h2>"
-            for plot_name, plot_path in self.plot_data.items():
-                content += f"<img src='{plot_path}' alt='{plot_name}' style='max-width: 100%;'><br>"
-            content += "</div>"
+        # plot_data değerleri PNG baytları ya da görüntü dosyası yolları olabilir
+        images = dict(getattr(self, 'plot_data', {}))
+        return {'title': "Uçuş Analiz Raporu", 'rows': rows, 'images': images}
 
-        # HTML dosyasını oluştur
-        html_content = html_template.format(
-            date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            content=content
-        )
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
\ No newline at end of file
+    def generate_html_report(self, file_path):
+        from analysis.report import write_html_report
+        write_html_report(file_path, **self.report_contents())
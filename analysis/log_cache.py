@@ -0,0 +1,179 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+# Ayrıştırıcı çıktısı değişirse eski kayıtlar kullanılmasın
+CACHE_VERSION = 1
+META_FILE = 'meta.json'
+
+# Anahtar için dosyanın başı, sonu ve arasından eşit aralıklı örnekler okunur
+SAMPLE_SIZE = 64 * 1024
+SAMPLE_COUNT = 16
+
+
+def load_cache_settings(settings_file='config/settings.json'):
+    try:
+        with open(settings_file, 'r') as f:
+            return json.load(f).get('analysis', {})
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def file_key(file_path):
+    """Boyut, mtime ve dosyadan örneklenen bloklardan türetilen önbellek anahtarı"""
+    stat = os.stat(file_path)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f'{CACHE_VERSION}:{stat.st_size}:{stat.st_mtime_ns}'.encode())
+    with open(file_path, 'rb') as f:
+        if stat.st_size <= SAMPLE_SIZE * (SAMPLE_COUNT + 2):
+            digest.update(f.read())
+        else:
+            step = (stat.st_size - SAMPLE_SIZE) // (SAMPLE_COUNT + 1)
+            for i in range(SAMPLE_COUNT + 2):
+                f.seek(i * step)
+                digest.update(f.read(SAMPLE_SIZE))
+    return digest.hexdigest()
+
+
+class LogCache:
+    """Ayrıştırılmış logların diskteki önbelleği (tip başına bellek eşlenen .npy)"""
+    # Toplam boyut max_size'ı aşarsa en uzun süredir kullanılmayan kayıtlar silinir
+
+    def __init__(self, cache_dir=None, max_size=None):
+        settings = load_cache_settings()
+        if cache_dir is None:
+            cache_dir = settings.get('cache_directory', 'cache/logs/')
+        if max_size is None:
+            max_size = settings.get('max_cache_size_mb', 2048) * 1024 * 1024
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+
+    def entry_path(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def meta(self, file_path):
+        """Kaydın meta bilgisi (önbellekteki tipler, logdaki tüm tipler); yoksa None"""
+        try:
+            key = file_key(file_path)
+        except OSError:
+            return None
+        return self._read_meta(self.entry_path(key))
+
+    def _read_meta(self, path):
+        try:
+            with open(os.path.join(path, META_FILE), 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _write_meta(self, path, meta):
+        temp_file = os.path.join(path, META_FILE + '.tmp')
+        with open(temp_file, 'w') as f:
+            json.dump(meta, f)
+        os.replace(temp_file, os.path.join(path, META_FILE))
+
+    def get(self, file_path, types=None):
+        """Önbellekteki diziler; kayıt yoksa None"""
+        try:
+            key = file_key(file_path)
+        except OSError:
+            return None
+        path = self.entry_path(key)
+        meta = self._read_meta(path)
+        if meta is None:
+            return None
+
+        names = meta['types'] if types is None else [name for name in types if name in meta['types']]
+        data = {}
+        try:
+            for name in names:
+                data[name] = np.load(os.path.join(path, f'{name}.npy'), mmap_mode='r', allow_pickle=False)
+        except (OSError, ValueError) as e:
+            print(f"Log önbelleği okunamadı: {e}")
+            return None
+
+        # LRU sırası için son kullanım zamanını güncelle
+        os.utime(os.path.join(path, META_FILE))
+        return data
+
+    def put(self, file_path, data, message_types=None):
+        """Dizileri önbelleğe yaz; kayıt varsa eksik tipleri ekle"""
+        # message_types saklanırsa tip listesi logu taramadan okunabilir
+        try:
+            key = file_key(file_path)
+        except OSError:
+            return
+        path = self.entry_path(key)
+        meta = self._read_meta(path)
+        if meta is not None:
+            self._extend(path, meta, data, message_types)
+            return
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Yarım yazılmış kayıt görünmesin diye önce geçici dizine yaz
+        temp_path = tempfile.mkdtemp(prefix='.tmp_', dir=self.cache_dir)
+        try:
+            for name, array in data.items():
+                np.save(os.path.join(temp_path, f'{name}.npy'), np.ascontiguousarray(array), allow_pickle=False)
+            self._write_meta(temp_path, {
+                'source': os.path.abspath(file_path),
+                'created': time.time(),
+                'types': sorted(data),
+                'message_types': message_types
+            })
+            os.rename(temp_path, path)
+        except OSError as e:
+            print(f"Log önbelleğe yazılamadı: {e}")
+            shutil.rmtree(temp_path, ignore_errors=True)
+            return
+        self.evict()
+
+    def _extend(self, path, meta, data, message_types):
+        added = [name for name in data if name not in meta['types']]
+        try:
+            for name in added:
+                temp_file = os.path.join(path, f'.{name}.npy')
+                np.save(temp_file, np.ascontiguousarray(data[name]), allow_pickle=False)
+                os.replace(temp_file, os.path.join(path, f'{name}.npy'))
+            if added or (message_types is not None and meta.get('message_types') is None):
+                meta['types'] = sorted(set(meta['types']) | set(added))
+                if message_types is not None:
+                    meta['message_types'] = message_types
+                self._write_meta(path, meta)
+        except OSError as e:
+            print(f"Log önbelleğe yazılamadı: {e}")
+            return
+        if added:
+            self.evict()
+
+    def entries(self):
+        """(son kullanım, boyut, yol) listesi"""
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for key in os.listdir(self.cache_dir):
+            path = self.entry_path(key)
+            meta_path = os.path.join(path, META_FILE)
+            if key.startswith('.') or not os.path.exists(meta_path):
+                continue
+            size = sum(entry.stat().st_size for entry in os.scandir(path))
+            entries.append((os.path.getmtime(meta_path), size, path))
+        return entries
+
+    def evict(self):
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        # En yeni kayıt, sınırdan büyük olsa bile tutulur
+        while len(entries) > 1 and total > self.max_size:
+            _, size, path = entries.pop(0)
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        for _, _, path in self.entries():
+            shutil.rmtree(path, ignore_errors=True)
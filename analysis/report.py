@@ -0,0 +1,148 @@
+"""Analiz raporlarının HTML ve PDF çıktısı (Qt'den bağımsız)"""
+from datetime import datetime
+from html import escape
+import base64
+import io
+
+HTML_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>{title}</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 20px; }}
+        .header {{ background-color: #f0f0f0; padding: 10px; }}
+        .section {{ margin: 20px 0; }}
+        .good {{ color: green; }}
+        .medium {{ color: orange; }}
+        .bad {{ color: red; }}
+        table {{ border-collapse: collapse; width: 100%; }}
+        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+        th {{ background-color: #f0f0f0; }}
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>{title}</h1>
+        {info}
+    </div>
+    {content}
+</body>
+</html>
+"""
+
+
+def figure_to_png(figure, dpi=100):
+    """Matplotlib figürünü PNG baytlarına çiz"""
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format='png', dpi=dpi)
+    return buffer.getvalue()
+
+
+def image_bytes(image):
+    """PNG baytları ya da dosya yolu olarak verilen görüntünün baytları"""
+    if isinstance(image, (bytes, bytearray)):
+        return bytes(image)
+    with open(image, 'rb') as f:
+        return f.read()
+
+
+def status_class(status):
+    if status == "İyi":
+        return "good"
+    elif status == "Orta":
+        return "medium"
+    return "bad"
+
+
+def _notify(progress, percent, message):
+    if progress is not None:
+        progress(percent, message)
+
+
+def build_html_report(title, rows, images=None, info=None, progress=None):
+    """Sonuç tablosu ve gömülü (base64) grafiklerle HTML metni"""
+    if info is None:
+        info = [f"Oluşturulma Tarihi: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"]
+    images = images or {}
+
+    content = "<div class='section'><h2>Analiz Sonuçları</h2><table>"
+    content += "<tr><th>Parametre</th><th>Değer</th><th>Durum</th></tr>"
+    for param, value, status in rows:
+        content += (f"<tr><td>{escape(param)}</td><td>{escape(value)}</td>"
+                    f"<td class='{status_class(status)}'>{escape(status)}</td></tr>")
+    content += "</table></div>"
+    _notify(progress, 20, "Sonuç tablosu oluşturuldu")
+
+    if images:
+        content += "<div class='section'><h2>Grafikler</h2>"
+        for i, (name, image) in enumerate(images.items()):
+            encoded = base64.b64encode(image_bytes(image)).decode('ascii')
+            content += (f"<img src='data:image/png;base64,{encoded}' alt='{escape(name)}' "
+                        f"style='max-width: 100%;'><br>")
+            _notify(progress, 20 + 70 * (i + 1) // len(images), f"Grafik eklendi: {name}")
+        content += "</div>"
+
+    return HTML_TEMPLATE.format(
+        title=escape(title),
+        info="".join(f"<p>{escape(line)}</p>" for line in info),
+        content=content
+    )
+
+
+def write_html_report(file_path, title, rows, images=None, info=None, progress=None):
+    html_content = build_html_report(title, rows, images, info, progress)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(html_content)
+    _notify(progress, 100, "Rapor kaydedildi")
+
+
+def write_pdf_report(file_path, title, rows, images=None, info=None, progress=None):
+    """Sonuç tablosu ve bellekteki grafiklerle PDF raporu (reportlab)"""
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.utils import ImageReader
+    from reportlab.platypus import Image, Paragraph, SimpleDocTemplate, Table, TableStyle
+
+    doc = SimpleDocTemplate(file_path, pagesize=letter)
+    story = []
+    styles = getSampleStyleSheet()
+
+    # Başlık
+    story.append(Paragraph(escape(title), styles['Heading1']))
+    for line in info or []:
+        story.append(Paragraph(escape(line), styles['Normal']))
+
+    # Analiz sonuçları tablosu
+    data = [['Metrik', 'Değer', 'Durum']]
+    data.extend([list(row) for row in rows])
+    table = Table(data)
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 14),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 12),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ]))
+    story.append(table)
+    _notify(progress, 20, "Sonuç tablosu oluşturuldu")
+
+    # Grafikler sayfa genişliğine ölçeklenir
+    images = images or {}
+    for i, (name, image) in enumerate(images.items()):
+        data = image_bytes(image)
+        width, height = ImageReader(io.BytesIO(data)).getSize()
+        scale = min(1.0, doc.width / width)
+        story.append(Image(io.BytesIO(data), width * scale, height * scale))
+        _notify(progress, 20 + 50 * (i + 1) // len(images), f"Grafik eklendi: {name}")
+
+    doc.build(story)
+    _notify(progress, 100, "Rapor kaydedildi")
@@ -0,0 +1,191 @@
+import io
+import re
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+import pandas as pd
+
+# Metin log satırları: TİP,timestamp,değer1,değer2,...
+TEXT_LOG_COLUMNS = {
+    'ATTITUDE': ['roll', 'pitch', 'yaw'],
+    'GPS': ['lat', 'lon', 'alt', 'hdop'],
+    'CURRENT': ['voltage', 'current', 'consumed'],
+    'BATTERY': ['voltage', 'current', 'consumed'],
+    'RCIN': 'chan',
+    'SERVO_OUTPUT': 'servo',
+    'IMU': ['gyr_x', 'gyr_y', 'gyr_z', 'acc_x', 'acc_y', 'acc_z'],
+}
+# Tip adları bu uzunluğa kadar ayırt edilir
+TYPE_KEY_SIZE = 16
+# Çok örnekli sensör satırları: IMU[1], BAT[0], GPS[1] ...
+INSTANCE_TYPE = re.compile(r'(.+)\[(\d+)\]$')
+
+
+def columns_to_array(names, columns):
+    """Eşit uzunluklu sütunlardan yapılandırılmış dizi oluştur"""
+    length = len(columns[0]) if columns else 0
+    array = np.empty(length, dtype=[(name, 'f8') for name in names])
+    for name, column in zip(names, columns):
+        array[name] = column
+    return array
+
+
+def stream_columns(msg_type, width):
+    """Tipin ilk width değer sütununun adları"""
+    schema = TEXT_LOG_COLUMNS.get(msg_type)
+    if schema is None:
+        return [f'field{i + 1}' for i in range(width)]
+    if isinstance(schema, str):
+        # Kanal sayısı sabit değil; satırlardaki en fazla değer kadar sütun
+        return [f'{schema}{i + 1}' for i in range(width)]
+    return schema[:width] + [f'field{i + 1}' for i in range(len(schema), width)]
+
+
+def empty_stream(msg_type):
+    schema = TEXT_LOG_COLUMNS[msg_type]
+    names = ['timestamp'] + ([] if isinstance(schema, str) else schema)
+    return np.empty(0, dtype=[(name, 'f8') for name in names])
+
+
+class TextLog:
+    """Tip başına istendiğinde ayrıştırılan metin logu"""
+    # Satır sınırları ve tip adları açılışta numpy ile bulunur; messages() bir tipin satırlarını
+    # pandas ile float64 sütunlara çevirir. TİP[n] satırları TİP akışında, örnek numarası 'I' sütunundadır
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.buf = np.fromfile(file_path, dtype=np.uint8)
+        self.labels = None
+        self.widths = {}
+        self._type_labels = {}
+        # Tip -> {örnek numarası: etiketler}
+        self._instance_labels = {}
+        self.index()
+
+    def index(self):
+        buf = self.buf
+        if not len(buf):
+            return
+
+        newlines = np.flatnonzero(buf == ord('\n'))
+        starts = np.concatenate(([0], newlines + 1))
+        ends = np.concatenate((newlines, [len(buf)]))
+        commas = np.flatnonzero(buf == ord(','))
+        first = np.searchsorted(commas, starts)
+        type_ends = np.append(commas, len(buf))[first]
+
+        # Virgülsüz (boş ya da bozuk) satırlar atlanır
+        valid = type_ends < ends
+        starts, ends, first, type_ends = starts[valid], ends[valid], first[valid], type_ends[valid]
+        if not len(starts):
+            return
+        value_counts = np.searchsorted(commas, ends) - first
+
+        # Tip adının ilk TYPE_KEY_SIZE baytı gruplama anahtarıdır
+        padded = np.concatenate((buf, np.zeros(TYPE_KEY_SIZE, dtype=np.uint8)))
+        keys = sliding_window_view(padded, TYPE_KEY_SIZE)[starts].copy()
+        keys[np.arange(TYPE_KEY_SIZE) >= (type_ends - starts)[:, None]] = 0
+        keys = keys.view(f'S{TYPE_KEY_SIZE}').ravel()
+        type_names, inverse = np.unique(keys, return_inverse=True)
+
+        # Her baytı satırının tip numarasıyla etiketle (tip adı ve virgül: 0).
+        # Aralıklar çakışmadığından uint8 taşması toplamı bozmaz.
+        label_dtype = np.uint8 if len(type_names) < 255 else np.int32
+        label_ids = (inverse + 1).astype(label_dtype)
+        delta = np.zeros(len(buf) + 1, dtype=label_dtype)
+        delta[type_ends + 1] = label_ids
+        np.subtract.at(delta, np.minimum(ends + 1, len(buf)), label_ids)
+        self.labels = np.cumsum(delta[:-1], dtype=label_dtype)
+
+        widths = np.zeros(len(type_names), dtype=np.int64)
+        np.maximum.at(widths, inverse, value_counts)
+        for index, type_name in enumerate(type_names):
+            # Baştaki/sondaki boşluk farkı aynı tip sayılır
+            msg_type = type_name.decode('utf-8', 'replace').strip()
+            instance = 0
+            match = INSTANCE_TYPE.match(msg_type)
+            if match:
+                msg_type, instance = match.group(1).strip(), int(match.group(2))
+                self._instance_labels.setdefault(msg_type, {}).setdefault(instance, []).append(index + 1)
+            self._type_labels.setdefault(msg_type, []).append(index + 1)
+            self.widths[msg_type] = max(self.widths.get(msg_type, 0), int(widths[index]))
+
+    def message_types(self):
+        return list(TEXT_LOG_COLUMNS) + [name for name in self._type_labels if name not in TEXT_LOG_COLUMNS]
+
+    def close(self):
+        self.buf = None
+        self.labels = None
+
+    def messages(self, msg_type):
+        type_labels = self._type_labels.get(msg_type)
+        if type_labels is None:
+            return empty_stream(msg_type) if msg_type in TEXT_LOG_COLUMNS else None
+        instance_labels = self._instance_labels.get(msg_type)
+        if instance_labels is None:
+            return self._parse(msg_type, type_labels)
+
+        # Örnek numaraları etiketlerden gelir; her örnek ayrı ayrıştırılıp birleştirilir
+        tagged = {label for labels in instance_labels.values() for label in labels}
+        groups = dict(instance_labels)
+        untagged = [label for label in type_labels if label not in tagged]
+        if untagged:
+            groups.setdefault(0, []).extend(untagged)
+        parts = []
+        for instance, labels in sorted(groups.items()):
+            part = self._parse(msg_type, labels)
+            if part is not None and len(part):
+                parts.append((instance, part))
+        if not parts:
+            return empty_stream(msg_type) if msg_type in TEXT_LOG_COLUMNS else None
+
+        # Sütun adları genişliğe göre önekli olduğundan en geniş parça esas alınır
+        names = max((part.dtype.names for _, part in parts), key=len)
+        timestamps = np.concatenate([part['timestamp'] for _, part in parts])
+        order = np.argsort(timestamps, kind='stable')
+        columns = [np.concatenate([part[name] if name in part.dtype.names
+                                   else np.full(len(part), np.nan) for _, part in parts])[order]
+                   for name in names]
+        instances = np.concatenate([np.full(len(part), instance) for instance, part in parts])[order]
+        return columns_to_array(list(names) + ['I'], columns + [instances])
+
+    def _parse(self, msg_type, type_labels):
+        # Bu tipin satırlarını (tip adı olmadan) tek bloğa topla
+        if len(type_labels) == 1:
+            mask = self.labels == type_labels[0]
+        else:
+            mask = np.isin(self.labels, type_labels)
+        block = self.buf[mask].tobytes()
+
+        frame = pd.read_csv(io.BytesIO(block), header=None, names=range(self.widths[msg_type]),
+                            skipinitialspace=True, engine='c')
+        for column in frame.columns:
+            if not pd.api.types.is_float_dtype(frame[column]):
+                # Sayı olmayan alanlar NaN olur
+                frame[column] = pd.to_numeric(frame[column], errors='coerce')
+        group = frame.to_numpy(dtype=np.float64)
+
+        # Zaman damgası olmayan satırlar atlanır
+        group = group[~np.isnan(group[:, 0])]
+        if not len(group):
+            return empty_stream(msg_type) if msg_type in TEXT_LOG_COLUMNS else None
+        present = np.flatnonzero(~np.isnan(group).all(axis=0))
+        width = int(present[-1]) if len(present) else 0
+        if isinstance(TEXT_LOG_COLUMNS.get(msg_type), list):
+            # Bildirilen sütunlar eksik değerli satırlarda da bulunur (NaN)
+            width = max(width, len(TEXT_LOG_COLUMNS[msg_type]))
+        names = ['timestamp'] + stream_columns(msg_type, width)
+        columns = [group[:, i] if i < group.shape[1] else np.full(len(group), np.nan)
+                   for i in range(width + 1)]
+        return columns_to_array(names, columns)
+
+
+def parse_text_log(file_path, types=None):
+    """Metin logunu tip adı -> yapılandırılmış dizi sözlüğüne çevir"""
+    log = TextLog(file_path)
+    data = {}
+    for msg_type in (log.message_types() if types is None else types):
+        messages = log.messages(msg_type)
+        if messages is not None:
+            data[msg_type] = messages
+    return data
@@ -0,0 +1,190 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from analysis.alignment import primary_instance, split_instances
+
+GRAVITY = 9.80665
+# ArduPilot ivmeölçerlerinin varsayılan ölçüm aralığı (±16 g)
+DEFAULT_ACCEL_RANGE = 16 * GRAVITY
+# Aynı anda FFT'si alınan pencere sayısı (bellek sınırı)
+FFT_BATCH = 2048
+
+
+def sample_rate(timestamps):
+    """Zaman damgalarından örnekleme frekansı (medyan aralıkla)"""
+    if len(timestamps) < 2:
+        return 0.0
+    dt = np.median(np.diff(timestamps))
+    return float(1.0 / dt) if dt > 0 else 0.0
+
+
+def contiguous_segments(timestamps, gap_factor=5.0):
+    """Kayıt boşluklarında bölünmüş (başlangıç, bitiş) indeks aralıkları"""
+    if len(timestamps) < 2:
+        return [(0, len(timestamps))]
+    dt = np.diff(timestamps)
+    gaps = np.flatnonzero(dt > gap_factor * np.median(dt)) + 1
+    bounds = np.concatenate(([0], gaps, [len(timestamps)]))
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def spectrogram(signal, rate, timestamps=None, window_size=1024, overlap=0.5):
+    """Pencereli FFT ile güç spektrogramı: (frekanslar, pencere zamanları, güç [pencere x frekans])"""
+    # Zaman damgası verilirse kayıt boşluklarını aşan pencereler oluşturulmaz
+    signal = np.asarray(signal, dtype=np.float64)
+    step = max(1, int(window_size * (1 - overlap)))
+    freqs = np.fft.rfftfreq(window_size, 1.0 / rate) if rate > 0 else np.zeros(window_size // 2 + 1)
+    window = np.hanning(window_size)
+    # Tek taraflı güç yoğunluğu için ölçek
+    scale = 2.0 / (rate * np.sum(window ** 2)) if rate > 0 else 0.0
+
+    if timestamps is None:
+        segments = [(0, len(signal))]
+    else:
+        segments = contiguous_segments(np.asarray(timestamps, dtype=np.float64))
+
+    powers = []
+    times = []
+    for start, end in segments:
+        if end - start < window_size:
+            continue
+        frames = sliding_window_view(signal[start:end], window_size)[::step]
+        for i in range(0, len(frames), FFT_BATCH):
+            batch = frames[i:i + FFT_BATCH]
+            batch = (batch - batch.mean(axis=1, keepdims=True)) * window
+            powers.append((np.abs(np.fft.rfft(batch, axis=1)) ** 2 * scale).astype(np.float32))
+        centers = start + np.arange(len(frames)) * step + window_size // 2
+        if timestamps is None:
+            times.append(centers / rate if rate > 0 else centers.astype(np.float64))
+        else:
+            times.append(np.asarray(timestamps, dtype=np.float64)[centers])
+
+    if not powers:
+        return freqs, np.empty(0), np.empty((0, len(freqs)), dtype=np.float32)
+    return freqs, np.concatenate(times), np.concatenate(powers)
+
+
+def find_peaks(freqs, power, count=5, min_freq=5.0, threshold=4.0):
+    """Gürültü tabanının threshold katı üzerindeki en güçlü yerel maksimumlar"""
+    if len(power) < 3:
+        return []
+    floor = np.median(power[freqs >= min_freq]) if np.any(freqs >= min_freq) else 0.0
+    middle = power[1:-1]
+    is_peak = (middle > power[:-2]) & (middle >= power[2:]) & (middle > floor * threshold)
+    is_peak &= freqs[1:-1] >= min_freq
+    indices = np.flatnonzero(is_peak) + 1
+    indices = indices[np.argsort(power[indices])[::-1][:count]]
+    return [(float(freqs[i]), float(power[i])) for i in indices]
+
+
+def match_harmonics(peaks, fundamental, max_order=5, tolerance=0.03, resolution=0.0):
+    """Temel frekansın katlarına denk gelen tepe noktaları (kat numaraları)"""
+    orders = []
+    peak_freqs = np.array([freq for freq, _ in peaks])
+    if not len(peak_freqs) or fundamental <= 0:
+        return orders
+    for order in range(2, max_order + 1):
+        target = order * fundamental
+        if np.any(np.abs(peak_freqs - target) <= max(tolerance * target, 1.5 * resolution)):
+            orders.append(order)
+    return orders
+
+
+def axis_columns(stream, prefix):
+    """Akıştaki x/y/z eksen sütunları (acc_x ya da AccX adlandırması)"""
+    names = stream.dtype.names
+    columns = []
+    for axis in ('x', 'y', 'z'):
+        for name in (f'{prefix}_{axis}', f'{prefix.capitalize()}{axis.upper()}'):
+            if name in names:
+                columns.append((axis, name))
+                break
+    return columns
+
+
+def vibration_summary(stream, window_size=1024, overlap=0.5, peak_count=5,
+                      accel_range=DEFAULT_ACCEL_RANGE):
+    """İvme akışı için titreşim özeti: RMS, spektrum tepeleri, harmonikler, kırpılma"""
+    # Birden fazla IMU örneği varsa FFT yalnızca ilk örneğe uygulanır
+    stream = primary_instance(stream)
+    timestamps = np.asarray(stream['timestamp'], dtype=np.float64)
+    rate = sample_rate(timestamps)
+    columns = axis_columns(stream, 'acc')
+    summary = {
+        'sample_rate': rate,
+        'samples': int(len(stream)),
+        'axes': {}
+    }
+    if not columns or rate <= 0:
+        return summary
+
+    # Pencere, kısa loglarda da en az birkaç pencere oluşacak şekilde küçültülür
+    window_size = int(min(window_size, 2 ** int(np.log2(max(len(stream) // 4, 16)))))
+    total_power = None
+    clipped = np.zeros(len(stream), dtype=bool)
+    max_window_rms = 0.0
+    for axis, name in columns:
+        values = np.asarray(stream[name], dtype=np.float64)
+        clipped |= np.abs(values) >= 0.98 * accel_range
+
+        freqs, times, power = spectrogram(values, rate, timestamps, window_size, overlap)
+        if not len(power):
+            continue
+        average = power.mean(axis=0)
+        total_power = average if total_power is None else total_power + average
+
+        # Pencere başına RMS: ortalaması çıkarılmış sinyalin güç toplamından
+        resolution = freqs[1] - freqs[0]
+        window_rms = np.sqrt(power.sum(axis=1) * resolution)
+        max_window_rms = max(max_window_rms, float(window_rms.max()))
+        summary['axes'][axis] = {
+            'rms': float(np.sqrt(average.sum() * resolution)),
+            'max_window_rms': float(window_rms.max()),
+            'peaks': find_peaks(freqs, average, peak_count)
+        }
+
+    summary['clipped_samples'] = int(clipped.sum())
+    summary['max_window_rms'] = max_window_rms
+    if total_power is not None:
+        resolution = freqs[1] - freqs[0]
+        peaks = find_peaks(freqs, total_power, peak_count * 2)
+        if peaks:
+            fundamental = min(freq for freq, _ in peaks[:2])
+            summary['dominant_frequency'] = peaks[0][0]
+            summary['harmonics'] = {
+                'fundamental': fundamental,
+                'orders': match_harmonics(peaks, fundamental, resolution=resolution)
+            }
+    return summary
+
+
+def gyro_noise(stream):
+    """Jiroskop eksenlerinin standart sapması (rad/s)"""
+    stream = primary_instance(stream)
+    return {axis: float(np.nanstd(stream[name])) for axis, name in axis_columns(stream, 'gyr')}
+
+
+def vibe_summary(vibe):
+    """ArduPilot VIBE mesajı: ilk IMU'nun en yüksek/ortalama titreşimi ve kırpılma sayısı"""
+    # clips tüm IMU'larda log boyunca eklenen kırpılmadır; Clip alanı yoksa None
+    primary = primary_instance(vibe)
+    summary = {}
+    for axis in ('X', 'Y', 'Z'):
+        name = f'Vibe{axis}'
+        if name in primary.dtype.names and len(primary):
+            summary[f'max_{axis.lower()}'] = float(np.nanmax(primary[name]))
+            summary[f'mean_{axis.lower()}'] = float(np.nanmean(primary[name]))
+
+    clips = None
+    clip_fields = [name for name in vibe.dtype.names if name.startswith('Clip')]
+    if clip_fields and len(vibe):
+        clips = 0
+        for rows in split_instances(vibe).values():
+            for name in clip_fields:
+                # Sayaçlar açılıştan beri birikimlidir; log içindeki artış alınır
+                counter = np.asarray(rows[name], dtype=np.float64)
+                counter = counter[~np.isnan(counter)]
+                if len(counter):
+                    clips += int(counter.max() - counter[0])
+    summary['clips'] = clips
+    return summary
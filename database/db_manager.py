@@ -1,6 +1,13 @@
 import sqlite3
 from datetime import datetime
 
+# flights tablosuna yazılabilen sütunlar
+FLIGHT_COLUMNS = (
+    'file_path', 'file_key', 'vehicle_id', 'firmware', 'started_at', 'duration',
+    'max_altitude', 'min_voltage', 'voltage_sag', 'max_current', 'energy_wh',
+    'vibration_level', 'vibe_max', 'clipping'
+)
+
 class DatabaseManager:
     def __init__(self, db_file='mission_planner.db'):
         self.db_file = db_file
@@ -32,5 +39,115 @@ class DatabaseManager:
                     FOREIGN KEY (mission_id) REFERENCES missions (id)
                 )
             ''')
-            
-            conn.commit()
\ No newline at end of file
+
+            # Uçuş özet dizini: log başına bir satır, loglar yeniden
+            # ayrıştırılmadan filo çapında sorgulanabilir
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS flights (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    file_path TEXT NOT NULL UNIQUE,
+                    file_key TEXT,
+                    vehicle_id INTEGER,
+                    firmware TEXT,
+                    started_at TIMESTAMP,
+                    duration REAL,
+                    max_altitude REAL,
+                    min_voltage REAL,
+                    voltage_sag REAL,
+                    max_current REAL,
+                    energy_wh REAL,
+                    vibration_level REAL,
+                    vibe_max REAL,
+                    clipping INTEGER,
+                    indexed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_flights_vehicle_time
+                ON flights (vehicle_id, started_at)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_flights_time
+                ON flights (started_at)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_flights_sag
+                ON flights (voltage_sag)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_flights_vibration
+                ON flights (vibration_level)
+            ''')
+
+            conn.commit()
+
+    def add_flight(self, flight):
+        """Uçuş özetini ekle; aynı log daha önce eklendiyse güncelle"""
+        columns = [column for column in FLIGHT_COLUMNS if column in flight]
+        placeholders = ', '.join('?' for _ in columns)
+        updates = ', '.join(f'{column} = excluded.{column}' for column in columns if column != 'file_path')
+        with sqlite3.connect(self.db_file) as conn:
+            cursor = conn.cursor()
+            cursor.execute(f'''
+                INSERT INTO flights ({', '.join(columns)}) VALUES ({placeholders})
+                ON CONFLICT (file_path) DO UPDATE SET {updates}, indexed_at = CURRENT_TIMESTAMP
+            ''', [flight[column] for column in columns])
+            cursor.execute('SELECT id FROM flights WHERE file_path = ?', (flight['file_path'],))
+            flight_id = cursor.fetchone()[0]
+            conn.commit()
+        return flight_id
+
+    def find_flight(self, file_path):
+        """Dizindeki logun satırı; log dizinde yoksa None"""
+        with sqlite3.connect(self.db_file) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute('SELECT * FROM flights WHERE file_path = ?', (file_path,)).fetchone()
+        return dict(row) if row else None
+
+    def find_flights(self, vehicle_id=None, since=None, until=None, min_voltage_sag=None,
+                     min_vibration=None, firmware=None, limit=None):
+        """Koşullara uyan uçuşlar (en yeniden eskiye); tarihler UTC datetime ya da metin"""
+        conditions = []
+        values = []
+        if vehicle_id is not None:
+            conditions.append('vehicle_id = ?')
+            values.append(vehicle_id)
+        if since is not None:
+            conditions.append('started_at >= ?')
+            values.append(_timestamp(since))
+        if until is not None:
+            conditions.append('started_at < ?')
+            values.append(_timestamp(until))
+        if min_voltage_sag is not None:
+            conditions.append('voltage_sag > ?')
+            values.append(min_voltage_sag)
+        if min_vibration is not None:
+            conditions.append('vibration_level > ?')
+            values.append(min_vibration)
+        if firmware is not None:
+            conditions.append('firmware LIKE ?')
+            values.append(f'%{firmware}%')
+
+        query = 'SELECT * FROM flights'
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY started_at DESC'
+        if limit is not None:
+            query += ' LIMIT ?'
+            values.append(limit)
+
+        with sqlite3.connect(self.db_file) as conn:
+            conn.row_factory = sqlite3.Row
+            return [dict(row) for row in conn.execute(query, values)]
+
+    def delete_flight(self, file_path):
+        with sqlite3.connect(self.db_file) as conn:
+            conn.execute('DELETE FROM flights WHERE file_path = ?', (file_path,))
+            conn.commit()
+
+
+def _timestamp(value):
+    # CURRENT_TIMESTAMP ile aynı biçim: 'YYYY-MM-DD HH:MM:SS' (UTC)
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    return value
\ No newline at end of file
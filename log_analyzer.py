@@ -1,59 +1,48 @@
-            try:
-                # PDF rapor oluştur
-                from reportlab.lib import colors
-                from reportlab.lib.pagesizes import letter
-                from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
-                from reportlab.lib.styles import getSampleStyleSheet
-                
-                doc = SimpleDocTemplate(file_path, pagesize=letter)
-                story = []
-                styles = getSampleStyleSheet()
-                
-                # Başlık
-                story.append(Paragraph(f"Analiz Raporu - {self.analysis_type.currentText()}", styles['Heading1']))
-                story.append(Paragraph(f"Oluşturulma Tarihi: {self.current_time_utc}", styles['Normal']))
-                story.append(Paragraph(f"Kullanıcı: {self.current_user}", styles['Normal']))
-                
-                # Analiz sonuçları tablosu
-                data = []
-                data.append(['Metrik', 'Değer', 'Durum'])  # Başlık satırı
-                
-                # Sonuçları tabloya ekle
-                for row in range(self.results_table.rowCount()):
-                    metric = self.results_table.item(row, 0).text()
-                    value = self.results_table.item(row, 1).text()
-                    status = self.results_table.item(row, 2).text()
-                    data.append([metric, value, status])
-                
-                # Tablo stilini oluştur
-                table = Table(data)
-                table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 14),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                    ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 1), (-1, -1), 12),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                ]))
-                story.append(table)
-                
-                # Grafiği ekle
-                self.figure.savefig('temp_plot.png')
-                story.append(Paragraph("<img src='temp_plot.png'/>", styles['Normal']))
-                
-                # PDF oluştur
-                doc.build(story)
-                os.remove('temp_plot.png')  # Geçici dosyayı sil
-                
-                QMessageBox.information(self, "Başarılı", "Rapor oluşturuldu!")
-                
-            except Exception as e:
-                QMessageBox.warning(self, "Hata", f"Rapor oluşturulamadı: {str(e)}")
+            # Rapor arka planda yazılır; grafik geçici dosya yerine bellekte taşınır
+            from analysis.report import figure_to_png, write_pdf_report
+
+            rows = self.report_rows()
+            images = {}
+            if hasattr(self, 'figure'):
+                images["Grafik"] = figure_to_png(self.figure)
+            self.start_report(write_pdf_report, file_path,
+                              title=f"Analiz Raporu - {self.analysis_type.currentText()}",
+                              rows=rows, images=images,
+                              info=[f"Oluşturulma Tarihi: {self.current_time_utc}",
+                                    f"Kullanıcı: {self.current_user}"])
+
+    def report_rows(self):
+        # Sonuç tablosunun (metrik, değer, durum) satırları
+        rows = []
+        for row in range(self.results_table.rowCount()):
+            rows.append((self.results_table.item(row, 0).text(),
+                         self.results_table.item(row, 1).text(),
+                         self.results_table.item(row, 2).text()))
+        return rows
+
+    def start_report(self, writer, file_path, **kwargs):
+        from PyQt6.QtWidgets import QProgressDialog
+        from services.report_thread import ReportThread
+
+        # Her raporun kendi ilerleme penceresi vardır; aynı anda birden fazla
+        # rapor yazılabilir ve ReportThread bitene kadar kendini canlı tutar
+        progress = QProgressDialog("Rapor oluşturuluyor...", None, 0, 100, self)
+        progress.setWindowTitle("Rapor")
+        progress.setMinimumDuration(0)
+
+        thread = ReportThread(writer, file_path, **kwargs)
+        thread.progress_updated.connect(progress.setValue)
+        thread.status_updated.connect(progress.setLabelText)
+        thread.completed.connect(progress.close)
+        thread.completed.connect(self.report_finished)
+        thread.start()
+        return thread
+
+    def report_finished(self, success, message):
+        if success:
+            QMessageBox.information(self, "Başarılı", "Rapor oluşturuldu!")
+        else:
+            QMessageBox.warning(self, "Hata", f"Rapor oluşturulamadı: {message}")
 
     def save_analysis_results(self):
         if not self.analysis_results:
@@ -73,4 +62,24 @@
                     json.dump(self.analysis_results, f, indent=4)
                 QMessageBox.information(self, "Başarılı", "Sonuçlar kaydedildi!")
             except Exception as e:
-                QMessageBox.warning(self, "Hata", f"Sonuçlar kaydedilemedi: {str(e)}")
\ No newline at end of file
+                QMessageBox.warning(self, "Hata", f"Sonuçlar kaydedilemedi: {str(e)}")
+
+    def plot_log_data(self, msg_type, fields):
+        # Uzun loglarda tüm örnekler çizilmez; görünen aralık eksenin piksel
+        # genişliğine seyreltilir ve yakınlaştırma/kaydırmada yeniden hesaplanır
+        from analysis.decimation import DecimatedLine
+
+        stream = self.log_data.get(msg_type) if self.log_data else None
+        if stream is None or not len(stream):
+            QMessageBox.warning(self, "Uyarı", f"Logda {msg_type} verisi yok!")
+            return
+
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+        self.plot_lines = [DecimatedLine(ax, stream['timestamp'], stream[field], label=field)
+                           for field in fields if field in stream.dtype.names]
+        ax.set_title(msg_type)
+        ax.set_xlabel("Zaman (s)")
+        ax.grid(True)
+        ax.legend()
+        self.canvas.draw_idle()
@@ -217,36 +217,18 @@ class MissionManager(QWidget):
         self.mission_updated.emit(optimized)
 
     def optimize_distance(self, points):
-        # TSP benzeri optimizasyon
-        coords = np.array([[p['lat'], p['lon']] for p in points])
-        n_points = len(coords)
-        
-        def calculate_total_distance(order):
-            ordered = coords[order]
-            return np.sum(np.sqrt(np.sum(np.diff(ordered, axis=0)**2, axis=1)))
-
-        # Başlangıç sıralaması
-        current_order = np.arange(n_points)
-        best_distance = calculate_total_distance(current_order)
-        best_order = current_order.copy()
-
-        # 2-opt algoritması
-        improved = True
-        while improved:
-            improved = False
-            for i in range(1, n_points-2):
-                for j in range(i+1, n_points):
-                    new_order = current_order.copy()
-                    new_order[i:j] = new_order[i:j][::-1]
-                    new_distance = calculate_total_distance(new_order)
-                    
-                    if new_distance < best_distance:
-                        best_distance = new_distance
-                        best_order = new_order.copy()
-                        improved = True
-            current_order = best_order.copy()
-
-        return [points[i] for i in best_order]
+        # TSP benzeri optimizasyon: ilk nokta sabit, bitiş serbest.
+        # Haversine mesafe matrisi bir kez hesaplanır; 2-opt/Or-opt hamleleri
+        # komşu listeleri üzerinde kenar farklarıyla değerlendirilir
+        from mission.route_optimization import haversine_matrix, optimize_order
+
+        if len(points) < 3:
+            return list(points)
+        dist = haversine_matrix([p['lat'] for p in points],
+                                [p['lon'] for p in points],
+                                [p['alt'] for p in points])
+        order = optimize_order(dist, start=0)
+        return [points[i] for i in order]
 
     def simulate_mission(self):
         if not self.mission_points:
@@ -1,9 +1,15 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
                             QLabel, QSpinBox, QDoubleSpinBox, QComboBox, 
-                            QProgressBar, QGroupBox)
+                            QProgressBar, QGroupBox, QMessageBox)
 from PyQt6.QtCore import pyqtSignal
 import numpy as np
-from scipy.optimize import minimize
+
+from mission.route_solver import EnergyCostModel, TimeCostModel
+from mission.trajectory_costs import (altitude_constraint, model_weights, path_cost,
+                                      refine, spacing_constraint)
+
+# Hedef hız 0 seçilirse süre/enerji tanımsız olmasın diye (m/s)
+MIN_SPEED = 0.1
 
 class MissionOptimizer(QWidget):
     optimization_completed = pyqtSignal(list)  # optimize edilmiş waypoint'ler
@@ -136,60 +142,36 @@ class MissionOptimizer(QWidget):
             self.progress.setValue(100)
         else:
             self.progress.setValue(0)
+            QMessageBox.warning(self, "Uyarı", f"Optimizasyon yakınsamadı: {result.message}")
 
     def create_constraints(self, params):
-        def altitude_constraint(x):
-            n = len(x) // 3
-            return params['max_altitude'] - x[2*n:]  # alt değerleri
-
-        def distance_constraint(x):
-            n = len(x) // 3
-            lats = x[:n]
-            lons = x[n:2*n]
-            distances = []
-            for i in range(n-1):
-                d = self.haversine_distance(lats[i], lons[i], lats[i+1], lons[i+1])
-                distances.append(d - params['min_distance'])
-            return np.array(distances)
-
+        # Kısıtlar analitik Jacobian'larıyla birlikte verilir
         return [
-            {'type': 'ineq', 'fun': altitude_constraint},
-            {'type': 'ineq', 'fun': distance_constraint}
+            altitude_constraint(params['max_altitude']),
+            spacing_constraint(params['min_distance'])
         ]
 
-    def haversine_distance(self, lat1, lon1, lat2, lon2):
-        R = 6371000  # Dünya yarıçapı (metre)
-        phi1 = np.radians(lat1)
-        phi2 = np.radians(lat2)
-        delta_phi = np.radians(lat2 - lat1)
-        delta_lambda = np.radians(lon2 - lon1)
+    def optimize_distance(self, x0, constraints):
+        # Toplam yatay büyük çember mesafesi
+        return refine(path_cost, x0, constraints)
 
-        a = (np.sin(delta_phi/2) * np.sin(delta_phi/2) +
-             np.cos(phi1) * np.cos(phi2) *
-             np.sin(delta_lambda/2) * np.sin(delta_lambda/2))
-        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1-a))
-        return R * c
+    def optimize_time(self, x0, constraints, params):
+        # Hedef hızla yatay uçuş, dikey hızla tırmanma/alçalma ve
+        # minimum dönüş yarıçaplı yaylarda geçen süre
+        model = TimeCostModel(horizontal_speed=max(params['target_speed'], MIN_SPEED))
+        return self.refine_cost(x0, constraints, model, params)
 
-    def optimize_distance(self, x0, constraints):
-        def objective(x):
-            n = len(x) // 3
-            total_distance = 0
-            for i in range(n-1):
-                total_distance += self.haversine_distance(
-                    x[i], x[n+i], x[i+1], x[n+i+1]
-                )
-            return total_distance
+    def optimize_energy(self, x0, constraints, params):
+        # Tırmanma alçalmadan daha fazla güç harcar (route_solver enerji modeli)
+        model = EnergyCostModel(horizontal_speed=max(params['target_speed'], MIN_SPEED))
+        return self.refine_cost(x0, constraints, model, params)
 
-        return minimize(objective, x0, constraints=constraints)
+    def refine_cost(self, x0, constraints, model, params):
+        horizontal, vertical, climb = model_weights(model)
+        n = len(x0) // 3
+        ref_lat = float(np.mean(x0[:n]))
 
-    def optimize_time(self, x0, constraints, params):
         def objective(x):
-            n = len(x) // 3
-            total_time = 0
-            for i in range(n-1):
-                distance = self.haversine_distance(
-                    x[i], x[n+i], x[i+1], x[n+i+1]
-                )
-                # Basit zaman hesabı (dönüşleri hesaba katarak)
-                time = distance / params['target_speed']
-                
\ No newline at end of file
+            return path_cost(x, horizontal, vertical, climb, params['turn_radius'], ref_lat)
+
+        return refine(objective, x0, constraints)
@@ -0,0 +1,221 @@
+"""Görev noktası sıralaması için rota iyileştirme (2-opt, Or-opt)"""
+from collections import deque
+import time
+
+import numpy as np
+
+EARTH_RADIUS = 6371000.0
+# Her nokta için denenen en yakın komşu sayısı
+NEIGHBOURS = 10
+# Or-opt ile taşınan en uzun ardışık nokta dizisi
+OR_OPT_LENGTH = 3
+# Kayan nokta hatasıyla sonsuz döngüye girmemek için en küçük kazanç (m)
+EPSILON = 1e-7
+
+
+def haversine_matrix(lats, lons, alts=None):
+    """Noktalar arası büyük çember mesafeleri (m); yükseklik farkı da eklenir"""
+    lats = np.radians(np.asarray(lats, dtype=np.float64))
+    lons = np.radians(np.asarray(lons, dtype=np.float64))
+    dlat = lats[:, None] - lats[None, :]
+    dlon = lons[:, None] - lons[None, :]
+    a = np.sin(dlat / 2) ** 2 + np.cos(lats)[:, None] * np.cos(lats)[None, :] * np.sin(dlon / 2) ** 2
+    dist = 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+    if alts is not None:
+        alts = np.asarray(alts, dtype=np.float64)
+        dist = np.hypot(dist, alts[:, None] - alts[None, :])
+    return dist
+
+
+def neighbour_lists(dist, k=NEIGHBOURS):
+    """Her nokta için yakından uzağa sıralı en yakın k komşu"""
+    n = len(dist)
+    k = min(k, n - 1)
+    if k <= 0:
+        return np.empty((n, 0), dtype=np.int64)
+    masked = dist + np.diag(np.full(n, np.inf))
+    nearest = np.argpartition(masked, k - 1, axis=1)[:, :k]
+    distances = np.take_along_axis(masked, nearest, axis=1)
+    return np.take_along_axis(nearest, np.argsort(distances, axis=1), axis=1)
+
+
+def route_length(order, dist):
+    order = np.asarray(order)
+    return float(dist[order[:-1], order[1:]].sum())
+
+
+def nearest_neighbour_order(dist, start=0, end=None, neighbours=None, deadline=None):
+    """En yakın komşu ile başlangıç sıralaması (bitiş verilirse sona konur)"""
+    # deadline (time.monotonic) geçerse kalan noktalar son noktaya uzaklık sırasıyla eklenir
+    n = len(dist)
+    visited = np.zeros(n, dtype=bool)
+    visited[start] = True
+    if end is not None:
+        visited[end] = True
+    order = [start]
+    current = start
+    left = n - int(visited.sum())
+    while left:
+        following = None
+        if neighbours is not None:
+            for candidate in neighbours[current]:
+                if not visited[candidate]:
+                    following = int(candidate)
+                    break
+        if following is None:
+            row = np.where(visited, np.inf, dist[current])
+            if deadline is not None and time.monotonic() > deadline:
+                order.extend(int(i) for i in np.argsort(row, kind='stable')[:left])
+                break
+            following = int(np.argmin(row))
+        visited[following] = True
+        order.append(following)
+        current = following
+        left -= 1
+    if end is not None and end != start:
+        order.append(end)
+    return np.array(order, dtype=np.int64)
+
+
+class RouteImprover:
+    """Uçları sabit açık rota üzerinde komşu listeli 2-opt ve Or-opt"""
+
+    def __init__(self, dist, neighbours):
+        self.dist = dist
+        self.neighbours = [list(row) for row in neighbours]
+
+    def improve(self, order, time_limit=None, or_opt=True):
+        self.order = np.array(order, dtype=np.int64)
+        self.pos = np.empty(len(self.order), dtype=np.int64)
+        self.pos[self.order] = np.arange(len(self.order))
+        self.last = len(self.order) - 1
+        if self.last < 3:
+            return self.order
+
+        deadline = None if time_limit is None else time.monotonic() + time_limit
+        queue = deque(int(node) for node in self.order)
+        queued = np.ones(len(self.order), dtype=bool)
+        while queue:
+            if deadline is not None and time.monotonic() > deadline:
+                break
+            node = queue.popleft()
+            queued[node] = False
+            touched = self.two_opt(node)
+            if touched is None and or_opt:
+                touched = self.or_opt(node)
+            if touched is not None:
+                for other in touched:
+                    if not queued[other]:
+                        queued[other] = True
+                        queue.append(other)
+        return self.order
+
+    def _reverse(self, start, end):
+        # order[start..end] (dahil) ters çevrilir
+        segment = self.order[start:end + 1][::-1].copy()
+        self.order[start:end + 1] = segment
+        self.pos[segment] = np.arange(start, end + 1)
+
+    def two_opt(self, a):
+        d = self.dist
+        order, pos, last = self.order, self.pos, self.last
+        i = int(pos[a])
+        for forward in (True, False):
+            # forward: (a, ardılı) kenarı, değilse (öncülü, a) kenarı kırılır
+            if forward and i == last or not forward and i == 0:
+                continue
+            b = int(order[i + 1] if forward else order[i - 1])
+            d_ab = d[a, b]
+            for c in self.neighbours[a]:
+                d_ac = d[a, c]
+                if d_ac >= d_ab:
+                    break
+                j = int(pos[c])
+                if forward and j == last or not forward and j == 0:
+                    continue
+                e = int(order[j + 1] if forward else order[j - 1])
+                if c == b or e == a:
+                    continue
+                if d_ac + d[b, e] - d_ab - d[c, e] >= -EPSILON:
+                    continue
+                if forward and i < j:
+                    self._reverse(i + 1, j)
+                elif forward:
+                    self._reverse(j + 1, i)
+                elif i < j:
+                    self._reverse(i, j - 1)
+                else:
+                    self._reverse(j, i - 1)
+                return (a, b, c, e)
+        return None
+
+    def or_opt(self, a):
+        d = self.dist
+        order, pos, last = self.order, self.pos, self.last
+        i = int(pos[a])
+        for length in range(1, OR_OPT_LENGTH + 1):
+            # Taşınan dizi order[i..i+length-1]; uç noktalar dizide olamaz
+            if i < 1 or i + length > last:
+                break
+            first, end = a, int(order[i + length - 1])
+            before, after = int(order[i - 1]), int(order[i + length])
+            removed = d[before, first] + d[end, after] - d[before, after]
+            if removed <= EPSILON:
+                continue
+
+            for anchor, other in ((first, end), (end, first)):
+                for c in self.neighbours[anchor]:
+                    d_c = d[c, anchor]
+                    if d_c >= removed:
+                        break
+                    j = int(pos[c])
+                    if i <= j < i + length:
+                        continue
+                    # c'nin iki yanındaki kenarlardan birine yerleştir
+                    for x, y in ((j, j + 1), (j - 1, j)):
+                        if x < 0 or y > last or i - 1 <= x < i + length:
+                            continue
+                        p, q = int(order[x]), int(order[y])
+                        if p == c:
+                            # p -> anchor ... other -> q
+                            added = d_c + d[other, q] - d[p, q]
+                            reverse = anchor == end
+                        else:
+                            # p -> other ... anchor -> q
+                            added = d[p, other] + d_c - d[p, q]
+                            reverse = anchor == first
+                        if added - removed >= -EPSILON:
+                            continue
+                        self._move(i, length, y, reverse)
+                        return (before, after, first, end, p, q)
+        return None
+
+    def _move(self, start, length, target, reverse):
+        # order[start:start+length] dizisini target konumundaki noktanın önüne taşı
+        segment = self.order[start:start + length].copy()
+        if reverse:
+            segment = segment[::-1]
+        rest = np.concatenate((self.order[:start], self.order[start + length:]))
+        index = target if target < start else target - length
+        self.order[:] = np.concatenate((rest[:index], segment, rest[index:]))
+        low = min(start, index)
+        high = max(start + length, index + length)
+        self.pos[self.order[low:high]] = np.arange(low, high)
+
+
+def optimize_order(dist, start=0, end=None, neighbours=NEIGHBOURS, time_limit=None):
+    """Sabit başlangıçlı (ve isteğe bağlı sabit bitişli) en kısa açık rota sırası"""
+    n = len(dist)
+    if n < 4:
+        if end is None:
+            return np.array([start] + [i for i in range(n) if i != start], dtype=np.int64)
+        return np.array([start] + [i for i in range(n) if i not in (start, end)] + [end], dtype=np.int64)
+
+    free_end = end is None
+    if free_end:
+        dist = np.pad(dist, ((0, 1), (0, 1)))
+        end = n
+    order = nearest_neighbour_order(dist, start, end)
+    improver = RouteImprover(dist, neighbour_lists(dist, neighbours))
+    order = improver.improve(order, time_limit)
+    return order[:-1] if free_end else order
@@ -0,0 +1,331 @@
+"""Süre ve enerji maliyetli görev noktası sıralaması"""
+# Yöne bağlı enerji c(i, j) = s(i, j) + g(j) - g(i) biçimindedir; açık rotada g terimleri yalnızca
+# uçlara bağlı olduğundan rota simetrik s üzerinde iyileştirilir
+import math
+import time
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from mission.route_optimization import (EARTH_RADIUS, EPSILON, NEIGHBOURS, OR_OPT_LENGTH,
+                                        RouteImprover, nearest_neighbour_order)
+
+# Bu sayıya kadar nokta için maliyet matrisi bir kez hesaplanır (~70 MB)
+MATRIX_POINTS = 3000
+# Varsayılan toplam çözüm süresi (s)
+TIME_LIMIT = 2.0
+# Tavlama sıcaklığı, ortalama bacak maliyetine oranla başlar ve
+# süre sonunda bu oranın ANNEAL_COOLING katına iner
+ANNEAL_START = 0.05
+ANNEAL_COOLING = 1e-3
+# Küçük görevlerde süre dolmadan durmak için nokta başına en çok adım
+ANNEAL_STEPS = 500
+# Süre kontrolü bu kadar tavlama adımında bir yapılır
+ANNEAL_CHECK = 200
+# Tavlamadan sonraki son yerel arama için ayrılan süre payı
+FINAL_SHARE = 0.1
+
+
+class TimeCostModel:
+    """Bacak süresi (s): yatay ve dikey hareket ayrı hızlarla"""
+
+    def __init__(self, horizontal_speed=15.0, vertical_speed=5.0):
+        self.horizontal_speed = horizontal_speed
+        self.vertical_speed = vertical_speed
+
+    def symmetric(self, horizontal, vertical):
+        # vertical: mutlak yükseklik farkı
+        return horizontal / self.horizontal_speed + vertical / self.vertical_speed
+
+    def potential(self, alts):
+        return np.zeros(len(alts))
+
+    def hold_cost(self, hold_times):
+        return float(np.sum(hold_times))
+
+
+class EnergyCostModel:
+    """Bacak enerjisi (J): tırmanma alçalmadan daha fazla güç harcar"""
+
+    def __init__(self, base_power=100.0, climb_factor=1.5, descent_factor=0.8,
+                 horizontal_speed=15.0, vertical_speed=5.0):
+        self.base_power = base_power
+        self.climb_power = base_power * climb_factor
+        self.descent_power = base_power * descent_factor
+        self.horizontal_speed = horizontal_speed
+        self.vertical_speed = vertical_speed
+
+    def symmetric(self, horizontal, vertical):
+        # Tırmanma/alçalma gücünün ortalaması simetrik, yarı farkı potansiyel olur
+        vertical_power = (self.climb_power + self.descent_power) / 2
+        return (self.base_power * horizontal / self.horizontal_speed
+                + vertical_power * vertical / self.vertical_speed)
+
+    def potential(self, alts):
+        return (self.climb_power - self.descent_power) / 2 * np.asarray(alts, dtype=np.float64) / self.vertical_speed
+
+    def hold_cost(self, hold_times):
+        return self.base_power * float(np.sum(hold_times))
+
+
+class RouteCost:
+    """Simetrik bacak maliyetleri; bitiş serbestse son indeks sanal bitiş noktasıdır"""
+    # cost[a, b] tek maliyet, cost[a] maliyet satırı döndürür (numpy matrisi yerine kullanılır)
+
+    def __init__(self, model, lats, lons, alts, free_end=True):
+        self.model = model
+        self.lats = np.radians(np.asarray(lats, dtype=np.float64))
+        self.lons = np.radians(np.asarray(lons, dtype=np.float64))
+        self.alts = np.asarray(alts, dtype=np.float64)
+        self.points = len(self.lats)
+        self.free_end = free_end
+
+        # Rota hangi noktada biterse o noktanın potansiyeli eklenir; sabit
+        # kaydırma sıralamayı değiştirmez, maliyetler negatif olmasın diye
+        potential = model.potential(self.alts)
+        self.terminal = potential - potential.min()
+
+        # Skaler erişim için Python listeleri numpy öğe erişiminden hızlıdır
+        self._lats = self.lats.tolist()
+        self._lons = self.lons.tolist()
+        self._cos = np.cos(self.lats).tolist()
+        self._alts = self.alts.tolist()
+        self._terminal = self.terminal.tolist()
+
+    def __len__(self):
+        return self.points + 1 if self.free_end else self.points
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            return self.cost(*key)
+        return self.row(key)
+
+    def cost(self, a, b):
+        n = self.points
+        if a == n or b == n:
+            return 0.0 if a == b else self._terminal[a if b == n else b]
+        s = (math.sin((self._lats[b] - self._lats[a]) / 2) ** 2
+             + self._cos[a] * self._cos[b] * math.sin((self._lons[b] - self._lons[a]) / 2) ** 2)
+        horizontal = 2 * EARTH_RADIUS * math.asin(math.sqrt(min(s, 1.0)))
+        return self.model.symmetric(horizontal, abs(self._alts[b] - self._alts[a]))
+
+    def pairs(self, first, second):
+        """Gerçek nokta çiftleri (first[i], second[i]) arasındaki maliyetler"""
+        dlat = self.lats[second] - self.lats[first]
+        dlon = self.lons[second] - self.lons[first]
+        s = np.sin(dlat / 2) ** 2 + np.cos(self.lats[first]) * np.cos(self.lats[second]) * np.sin(dlon / 2) ** 2
+        horizontal = 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.clip(s, 0, 1)))
+        return self.model.symmetric(horizontal, np.abs(self.alts[second] - self.alts[first]))
+
+    def rows(self, indices):
+        """Verilen noktalardan tüm noktalara maliyetler (sanal nokta dahil)"""
+        indices = np.asarray(indices)
+        real = np.minimum(indices, self.points - 1)
+        costs = self.pairs(real[:, None], np.arange(self.points)[None, :])
+        if not self.free_end:
+            return costs
+        costs = np.hstack((costs, self.terminal[real, None]))
+        dummy = indices == self.points
+        if dummy.any():
+            costs[dummy, :-1] = self.terminal
+            costs[dummy, -1] = 0.0
+        return costs
+
+    def row(self, a):
+        return self.rows([a])[0]
+
+    def matrix(self, block=256, deadline=None):
+        """Tam maliyet matrisi; deadline geçerse None (maliyetler istendiğinde hesaplanır)"""
+        size = len(self)
+        matrix = np.empty((size, size))
+        for first in range(0, size, block):
+            if deadline is not None and time.monotonic() > deadline:
+                return None
+            matrix[first:first + block] = self.rows(np.arange(first, min(first + block, size)))
+        return matrix
+
+    def neighbours(self, k=NEIGHBOURS):
+        """Matris olmadan en yakın k komşu: konumdan aday seçilip maliyetle sıralanır"""
+        n = self.points
+        size = len(self)
+        k = min(k, size - 1)
+        cos_lats = np.cos(self.lats)
+        positions = np.column_stack((EARTH_RADIUS * cos_lats * np.cos(self.lons),
+                                     EARTH_RADIUS * cos_lats * np.sin(self.lons),
+                                     EARTH_RADIUS * np.sin(self.lats),
+                                     self.alts))
+        candidates = min(2 * k + 1, n)
+        _, nearest = cKDTree(positions).query(positions, candidates)
+        nearest = np.asarray(nearest).reshape(n, candidates)
+        costs = self.pairs(np.arange(n)[:, None], nearest)
+        costs[nearest == np.arange(n)[:, None]] = np.inf
+        if self.free_end:
+            # Sanal bitiş de her noktanın adayıdır
+            nearest = np.hstack((nearest, np.full((n, 1), n)))
+            costs = np.hstack((costs, self.terminal[:, None]))
+        chosen = np.argsort(costs, axis=1, kind='stable')[:, :k]
+        lists = np.empty((size, k), dtype=np.int64)
+        lists[:n] = np.take_along_axis(nearest, chosen, axis=1)
+        if self.free_end:
+            lists[n] = np.argsort(self.terminal, kind='stable')[:k]
+        return lists
+
+
+class RouteAnnealer(RouteImprover):
+    """Yerel en iyiden çıkmak için rastgele 2-opt/Or-opt hamleleriyle tavlama"""
+
+    def anneal(self, order, length, time_limit, rng):
+        self.order = np.array(order, dtype=np.int64)
+        self.pos = np.empty(len(self.order), dtype=np.int64)
+        self.pos[self.order] = np.arange(len(self.order))
+        self.last = len(self.order) - 1
+        if self.last < 3 or time_limit <= 0:
+            return self.order, length
+
+        deadline = time.monotonic() + time_limit
+        started = time.monotonic()
+        current = best = length
+        best_order = self.order.copy()
+        start_temperature = ANNEAL_START * length / self.last
+        temperature = start_temperature
+        nodes = len(self.order)
+        max_steps = ANNEAL_STEPS * nodes
+        steps = 0
+        while steps < max_steps:
+            steps += 1
+            if steps % ANNEAL_CHECK == 0:
+                now = time.monotonic()
+                if now > deadline:
+                    break
+                # Soğuma, süre ya da adım bütçesinden hangisi öndeyse ona göre
+                progress = max((now - started) / time_limit, steps / max_steps)
+                temperature = start_temperature * ANNEAL_COOLING ** progress
+            a = int(rng.integers(nodes))
+            if rng.random() < 0.5:
+                delta = self.random_two_opt(a, rng, temperature)
+            else:
+                delta = self.random_or_opt(a, rng, temperature)
+            if delta is None:
+                continue
+            current += delta
+            if current < best - EPSILON:
+                best = current
+                best_order = self.order.copy()
+        return best_order, best
+
+    def _accept(self, delta, rng, temperature):
+        return delta < 0 or rng.random() < math.exp(-delta / temperature)
+
+    def random_two_opt(self, a, rng, temperature):
+        d = self.dist
+        order, pos, last = self.order, self.pos, self.last
+        i = int(pos[a])
+        forward = rng.random() < 0.5
+        if forward and i == last or not forward and i == 0:
+            return None
+        neighbours = self.neighbours[a]
+        if not neighbours:
+            return None
+        c = neighbours[int(rng.integers(len(neighbours)))]
+        j = int(pos[c])
+        if forward and j == last or not forward and j == 0:
+            return None
+        b = int(order[i + 1] if forward else order[i - 1])
+        e = int(order[j + 1] if forward else order[j - 1])
+        if c == b or e == a:
+            return None
+        delta = d[a, c] + d[b, e] - d[a, b] - d[c, e]
+        if not self._accept(delta, rng, temperature):
+            return None
+        if forward and i < j:
+            self._reverse(i + 1, j)
+        elif forward:
+            self._reverse(j + 1, i)
+        elif i < j:
+            self._reverse(i, j - 1)
+        else:
+            self._reverse(j, i - 1)
+        return delta
+
+    def random_or_opt(self, a, rng, temperature):
+        d = self.dist
+        order, pos, last = self.order, self.pos, self.last
+        i = int(pos[a])
+        length = int(rng.integers(1, OR_OPT_LENGTH + 1))
+        if i < 1 or i + length > last:
+            return None
+        neighbours = self.neighbours[a]
+        if not neighbours:
+            return None
+        c = neighbours[int(rng.integers(len(neighbours)))]
+        j = int(pos[c])
+        # Dizi c'nin hemen ardına ya da önüne, a c'ye bitişik olacak şekilde
+        x, y = (j, j + 1) if rng.random() < 0.5 else (j - 1, j)
+        if x < 0 or y > last or i - 1 <= x < i + length:
+            return None
+        first, end = a, int(order[i + length - 1])
+        before, after = int(order[i - 1]), int(order[i + length])
+        p, q = int(order[x]), int(order[y])
+        removed = d[before, first] + d[end, after] - d[before, after]
+        if p == c:
+            added = d[p, first] + d[end, q] - d[p, q]
+            reverse = False
+        else:
+            added = d[p, end] + d[first, q] - d[p, q]
+            reverse = True
+        delta = added - removed
+        if not self._accept(delta, rng, temperature):
+            return None
+        self._move(i, length, y, reverse)
+        return delta
+
+
+def route_cost(model, lats, lons, alts, order, hold_times=None):
+    """Verilen sıranın yöne bağlı gerçek maliyeti (bekleme dahil)"""
+    order = np.asarray(order)
+    cost = RouteCost(model, lats, lons, alts, free_end=False)
+    total = sum(cost.cost(int(a), int(b)) for a, b in zip(order[:-1], order[1:]))
+    potential = model.potential(cost.alts)
+    total += potential[order[-1]] - potential[order[0]]
+    if hold_times is not None:
+        total += model.hold_cost(hold_times)
+    return float(total)
+
+
+def solve_route(model, lats, lons, alts, start=0, end=None, time_limit=TIME_LIMIT,
+                anneal=True, seed=None, neighbours=NEIGHBOURS):
+    """Maliyet modeline göre sabit başlangıçlı rota sırası (asıl nokta indeksleri)"""
+    # Süre sınırı kurulum dahildir; yerel aramadan kalan süre tavlamaya ayrılır
+    started = time.monotonic()
+    n = len(lats)
+    if n < 4:
+        if end is None:
+            return np.array([start] + [i for i in range(n) if i != start], dtype=np.int64)
+        return np.array([start] + [i for i in range(n) if i not in (start, end)] + [end], dtype=np.int64)
+
+    free_end = end is None
+    cost = RouteCost(model, lats, lons, alts, free_end=free_end)
+    if free_end:
+        end = n
+
+    def remaining():
+        return max(0.0, time_limit - (time.monotonic() - started))
+
+    deadline = started + time_limit
+    lists = cost.neighbours(neighbours)
+    dist = None
+    if len(cost) <= MATRIX_POINTS:
+        dist = cost.matrix(deadline=deadline)
+    if dist is None:
+        dist = cost
+
+    order = nearest_neighbour_order(dist, start, end, lists, deadline)
+    annealer = RouteAnnealer(dist, lists)
+    order = annealer.improve(order, remaining())
+    if anneal and remaining() > 0:
+        length = sum(dist[int(a), int(b)] for a, b in zip(order[:-1], order[1:]))
+        order, _ = annealer.anneal(order, length, remaining() * (1 - FINAL_SHARE),
+                                   np.random.default_rng(seed))
+        # Tavlamanın en iyisi yerel en iyi olmayabilir; kalan sürede son iyileştirme
+        order = annealer.improve(order, remaining())
+    return order[:-1] if free_end else order
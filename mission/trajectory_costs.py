@@ -0,0 +1,288 @@
+"""Sürekli waypoint iyileştirmesi için vektörel amaç ve kısıt fonksiyonları"""
+# x = [enlemler, boylamlar, yükseklikler] (derece, derece, metre); fonksiyonlar değeri
+# analitik türeviyle birlikte döndürür
+import numpy as np
+from scipy.optimize import OptimizeResult, minimize
+
+from mission.route_optimization import EARTH_RADIUS
+
+# Derece -> radyan
+DEG = np.pi / 180
+# |dz| ve |dönüş açısı| sıfırda türevlenebilsin diye yumuşatma payları
+SMOOTH_ALTITUDE = 0.1
+SMOOTH_ANGLE = 0.01
+# Çakışık noktalarda haversine türevinin sonsuza gitmemesi için
+MIN_HAVERSINE = 1e-18
+# refine yakınsama ölçütleri: kısıt ihlali (m) ve dış adımlar arası göreli amaç değişimi
+CONSTRAINT_TOLERANCE = 0.01
+OBJECTIVE_TOLERANCE = 1e-6
+# İç L-BFGS-B çözümünün gradyan toleransı (başlangıç gradyanına göre)
+GRADIENT_TOLERANCE = 1e-5
+# Artırılmış Lagrange dış adım sayısı ve tüm iç iterasyonların toplam sınırı
+MAX_OUTER = 30
+MAX_ITERATIONS = 50000
+# İhlal bu oranda azalmazsa ceza katsayısı PENALTY_GROWTH ile büyür
+PENALTY_GROWTH = 10.0
+PENALTY_PROGRESS = 0.25
+
+
+def split(x):
+    n = len(x) // 3
+    return x[:n], x[n:2 * n], x[2 * n:]
+
+
+def segment_lengths(x):
+    """Ardışık noktalar arası büyük çember mesafeleri ve kısmi türevleri"""
+    # Türevler (n-1, 4): lat[i], lat[i+1], lon[i], lon[i+1] derecesi başına metre
+    lats, lons, _ = split(x)
+    phi = lats * DEG
+    dphi = np.diff(phi)
+    dlam = np.diff(lons) * DEG
+    cos1, cos2 = np.cos(phi[:-1]), np.cos(phi[1:])
+    sin_half = np.sin(dlam / 2) ** 2
+
+    a = np.clip(np.sin(dphi / 2) ** 2 + cos1 * cos2 * sin_half, 0, 1)
+    lengths = 2 * EARTH_RADIUS * np.arcsin(np.sqrt(a))
+
+    # d = 2R asin(sqrt(a)) => dd/da = R / sqrt(a (1 - a))
+    dd_da = EARTH_RADIUS / np.sqrt(np.maximum(a * (1 - a), MIN_HAVERSINE)) * DEG
+    partials = np.empty((len(lengths), 4))
+    partials[:, 0] = (-np.sin(dphi) / 2 - np.sin(phi[:-1]) * cos2 * sin_half) * dd_da
+    partials[:, 1] = (np.sin(dphi) / 2 - cos1 * np.sin(phi[1:]) * sin_half) * dd_da
+    partials[:, 3] = cos1 * cos2 * np.sin(dlam) / 2 * dd_da
+    partials[:, 2] = -partials[:, 3]
+    return lengths, partials
+
+
+def _smooth_abs(values, smooth):
+    # sqrt(v² + s²) - s ve türevi
+    root = np.sqrt(values * values + smooth * smooth)
+    return root - smooth, values / root
+
+
+def turn_angles(x, ref_lat):
+    """Ara noktalardaki işaretli dönüş açıları (rad) ve yerel düzlemdeki türevleri"""
+    # Türevler (n-2, 3, 2): önceki, kendisi, sonraki noktanın (doğu, kuzey) metre koordinatına göre
+    lats, lons, _ = split(x)
+    east = EARTH_RADIUS * np.cos(ref_lat * DEG) * lons * DEG
+    north = EARTH_RADIUS * lats * DEG
+    ux, uy = np.diff(east)[:-1], np.diff(north)[:-1]
+    vx, vy = np.diff(east)[1:], np.diff(north)[1:]
+    cross = ux * vy - uy * vx
+    dot = ux * vx + uy * vy
+    angles = np.arctan2(cross, dot)
+
+    # dθ = (dot dcross - cross ddot) / (cross² + dot²)
+    norm = np.maximum(cross * cross + dot * dot, MIN_HAVERSINE)
+    d_ux = (dot * vy - cross * vx) / norm
+    d_uy = (-dot * vx - cross * vy) / norm
+    d_vx = (-dot * uy - cross * ux) / norm
+    d_vy = (dot * ux - cross * uy) / norm
+    partials = np.empty((len(angles), 3, 2))
+    partials[:, 0] = np.column_stack((-d_ux, -d_uy))
+    partials[:, 1] = np.column_stack((d_ux - d_vx, d_uy - d_vy))
+    partials[:, 2] = np.column_stack((d_vx, d_vy))
+    return angles, partials
+
+
+def model_weights(model):
+    """route_solver maliyet modelinin metre başına yatay, dikey ve net tırmanma ağırlıkları"""
+    horizontal = model.symmetric(1.0, 0.0)
+    vertical = model.symmetric(0.0, 1.0)
+    climb = float(np.diff(model.potential([0.0, 1.0]))[0])
+    return horizontal, vertical, climb
+
+
+def path_cost(x, horizontal=1.0, vertical=0.0, climb=0.0, turn_radius=0.0, ref_lat=None):
+    """Rota maliyeti ve gradyanı"""
+    # horizontal * (yatay mesafe + turn_radius * |dönüş|) + vertical * |dikey fark|
+    # + climb * (son - ilk yükseklik)
+    x = np.asarray(x, dtype=np.float64)
+    n = len(x) // 3
+    grad = np.zeros_like(x)
+    if n < 2:
+        return 0.0, grad
+
+    lengths, partials = segment_lengths(x)
+    cost = horizontal * lengths.sum()
+    partials = horizontal * partials
+    np.add.at(grad, np.arange(n - 1), partials[:, 0])
+    np.add.at(grad, np.arange(1, n), partials[:, 1])
+    np.add.at(grad, np.arange(n, 2 * n - 1), partials[:, 2])
+    np.add.at(grad, np.arange(n + 1, 2 * n), partials[:, 3])
+
+    if vertical:
+        steps, slopes = _smooth_abs(np.diff(x[2 * n:]), SMOOTH_ALTITUDE)
+        cost += vertical * steps.sum()
+        grad[2 * n:-1] -= vertical * slopes
+        grad[2 * n + 1:] += vertical * slopes
+
+    if climb:
+        cost += climb * (x[-1] - x[2 * n])
+        grad[2 * n] -= climb
+        grad[-1] += climb
+
+    if turn_radius and n > 2:
+        if ref_lat is None:
+            ref_lat = x[:n].mean()
+        angles, angle_partials = turn_angles(x, ref_lat)
+        turns, turn_slopes = _smooth_abs(angles, SMOOTH_ANGLE)
+        weight = horizontal * turn_radius
+        cost += weight * turns.sum()
+        # (doğu, kuzey) metre -> (boylam, enlem) derece
+        scale = np.array([EARTH_RADIUS * np.cos(ref_lat * DEG) * DEG, EARTH_RADIUS * DEG])
+        partials = weight * turn_slopes[:, None, None] * angle_partials * scale
+        for offset in range(3):
+            index = np.arange(offset, offset + n - 2)
+            grad[n + index] += partials[:, offset, 0]
+            grad[index] += partials[:, offset, 1]
+    return float(cost), grad
+
+
+def spacing_constraint(min_distance):
+    """Ardışık noktalar en az min_distance uzaklıkta olsun (ineq >= 0)"""
+    def fun(x):
+        lengths, _ = segment_lengths(x)
+        return lengths - min_distance
+
+    def jac(x):
+        n = len(x) // 3
+        _, partials = segment_lengths(x)
+        rows = np.arange(n - 1)
+        jacobian = np.zeros((n - 1, len(x)))
+        jacobian[rows, rows] = partials[:, 0]
+        jacobian[rows, rows + 1] = partials[:, 1]
+        jacobian[rows, n + rows] = partials[:, 2]
+        jacobian[rows, n + rows + 1] = partials[:, 3]
+        return jacobian
+
+    def vjp(x, weights):
+        # jac(x).T @ weights, yoğun Jacobian kurmadan O(n)
+        n = len(x) // 3
+        _, partials = segment_lengths(x)
+        out = np.zeros_like(x)
+        out[:n - 1] += weights * partials[:, 0]
+        out[1:n] += weights * partials[:, 1]
+        out[n:2 * n - 1] += weights * partials[:, 2]
+        out[n + 1:2 * n] += weights * partials[:, 3]
+        return out
+
+    return {'type': 'ineq', 'fun': fun, 'jac': jac, 'vjp': vjp}
+
+
+def altitude_constraint(max_altitude):
+    """Tüm yükseklikler max_altitude altında kalsın (ineq >= 0)"""
+    def fun(x):
+        n = len(x) // 3
+        return max_altitude - x[2 * n:]
+
+    def jac(x):
+        n = len(x) // 3
+        jacobian = np.zeros((n, len(x)))
+        jacobian[np.arange(n), 2 * n + np.arange(n)] = -1.0
+        return jacobian
+
+    def vjp(x, weights):
+        n = len(x) // 3
+        out = np.zeros_like(x)
+        out[2 * n:] = -weights
+        return out
+
+    return {'type': 'ineq', 'fun': fun, 'jac': jac, 'vjp': vjp}
+
+
+def _transpose_product(constraint):
+    # Kısıtta vjp yoksa yoğun Jacobian ile J.T @ w
+    if 'vjp' in constraint:
+        return constraint['vjp']
+    return lambda x, weights: constraint['jac'](x).T @ weights
+
+
+def refine(objective, x0, constraints=(), maxiter=MAX_ITERATIONS, tol=CONSTRAINT_TOLERANCE):
+    """objective(x) -> (değer, gradyan) fonksiyonunu 'ineq' kısıtları altında küçült"""
+    # Artırılmış Lagrange ve L-BFGS-B; değişkenler başlangıca göre metre ölçekli olduğundan
+    # tol metre (ya da kısıtın kendi birimi) cinsindendir
+    x0 = np.asarray(x0, dtype=np.float64)
+    n = len(x0) // 3
+    ref_lat = x0[:n].mean()
+    scale = np.concatenate((np.full(n, EARTH_RADIUS * DEG),
+                            np.full(n, EARTH_RADIUS * np.cos(ref_lat * DEG) * DEG),
+                            np.ones(n)))
+    funs = [c['fun'] for c in constraints]
+    products = [_transpose_product(c) for c in constraints]
+
+    def unscale(y):
+        return x0 + y / scale
+
+    def values(x):
+        if not funs:
+            return np.zeros(0)
+        return np.concatenate([np.atleast_1d(fun(x)) for fun in funs])
+
+    def transpose_product(x, weights):
+        out = np.zeros_like(x)
+        start = 0
+        for size, product in zip(sizes, products):
+            out += product(x, weights[start:start + size])
+            start += size
+        return out
+
+    def violation(c):
+        return float(np.max(-c, initial=0.0))
+
+    value, grad = objective(x0)
+    c = values(x0)
+    sizes = [len(np.atleast_1d(fun(x0))) for fun in funs]
+    grad_norm = max(float(np.max(np.abs(grad / scale), initial=0.0)), 1e-12)
+
+    # PHR artırılmış Lagrange: s = max(0, λ - ρc), L = f + (s·s - λ·λ) / 2ρ
+    multipliers = np.zeros(len(c))
+    penalty = 10.0 * grad_norm
+    y = np.zeros_like(x0)
+    iterations = evaluations = 0
+    last_violation = violation(c)
+    last_value = value
+    success = False
+    message = 'Dış iterasyon sınırına ulaşıldı'
+
+    def lagrangian(y):
+        x = unscale(y)
+        value, grad = objective(x)
+        shifted = np.maximum(0.0, multipliers - penalty * values(x))
+        value += (shifted @ shifted - multipliers @ multipliers) / (2 * penalty)
+        if shifted.any():
+            grad = grad - transpose_product(x, shifted)
+        return value, grad / scale
+
+    for _ in range(MAX_OUTER):
+        inner = minimize(lagrangian, y, jac=True, method='L-BFGS-B',
+                         options={'maxiter': max(maxiter - iterations, 1),
+                                  'gtol': GRADIENT_TOLERANCE * grad_norm,
+                                  'ftol': 0.0})
+        y = inner.x
+        iterations += inner.nit
+        evaluations += inner.nfev
+        x = unscale(y)
+        value = objective(x)[0]
+        c = values(x)
+        current_violation = violation(c)
+        multipliers = np.maximum(0.0, multipliers - penalty * c)
+
+        change = abs(value - last_value) / max(abs(value), 1.0)
+        if current_violation <= tol and change <= OBJECTIVE_TOLERANCE:
+            success = True
+            message = 'Yakınsadı'
+            break
+        if iterations >= maxiter:
+            message = 'Toplam iterasyon sınırına ulaşıldı'
+            break
+        if current_violation > PENALTY_PROGRESS * last_violation:
+            penalty *= PENALTY_GROWTH
+        last_violation = current_violation
+        last_value = value
+
+    x = unscale(y)
+    value, grad = objective(x)
+    return OptimizeResult(x=x, fun=value, jac=grad, success=success, status=0 if success else 1,
+                          message=message, nit=iterations, nfev=evaluations,
+                          constr_violation=violation(values(x)))
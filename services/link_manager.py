@@ -0,0 +1,95 @@
+from collections import deque
+import threading
+import time
+
+
+class RedundantLink:
+    """Aynı araca giden bağlantılardan biri ve gecikme/sağlık bilgisi"""
+
+    def __init__(self, name, decoder, stats):
+        self.name = name
+        self.decoder = decoder
+        self.stats = stats
+        self.connection = None
+        self.read_thread = None
+        self.closed = False
+
+        # Diğer bağlantılara göre ortalama geç kalma süresi (EWMA, saniye)
+        self.lag = 0.0
+        self.first_count = 0
+        self.duplicate_count = 0
+
+    def is_alive(self, timeout, now=None):
+        if self.closed or self.stats.last_receive is None:
+            return False
+        if now is None:
+            now = time.monotonic()
+        return now - self.stats.last_receive < timeout
+
+    def health(self, timeout, now=None):
+        return {
+            'name': self.name,
+            'alive': self.is_alive(timeout, now),
+            'lag_ms': self.lag * 1000.0,
+            'packet_loss': self.stats.packet_loss(),
+            'messages_per_s': self.stats.messages.current(now),
+            'first': self.first_count,
+            'duplicates': self.duplicate_count
+        }
+
+
+class LinkDeduplicator:
+    """Birden fazla bağlantıdan gelen aynı çerçeveleri eler.
+
+    Anahtar (sysid, compid, seq, msgid, crc) olduğundan 8 bitlik sıra
+    numarasının başa dönmesi farklı mesajları karıştırmaz. İlk gelen çerçeve
+    kabul edilir; aynı çerçeve başka bağlantıdan geldiğinde o bağlantının
+    gecikmesi güncellenir.
+    """
+
+    def __init__(self, window=1.0, smoothing=0.05):
+        self.window = window
+        self.smoothing = smoothing
+        self.accepted = 0
+        self.duplicates = 0
+        self._seen = {}
+        self._order = deque()
+        self._lock = threading.Lock()
+
+    def accept(self, key, link, now):
+        with self._lock:
+            # Pencere dışına çıkan anahtarları temizle
+            order = self._order
+            limit = now - self.window
+            while order and order[0][0] < limit:
+                _, old_key = order.popleft()
+                self._seen.pop(old_key, None)
+
+            first = self._seen.get(key)
+            if first is None:
+                self._seen[key] = (now, link)
+                order.append((now, key))
+                self.accepted += 1
+                if link is not None:
+                    link.first_count += 1
+                    link.lag -= self.smoothing * link.lag
+                return True
+
+            self.duplicates += 1
+            if link is not None and link is not first[1]:
+                link.duplicate_count += 1
+                link.lag += self.smoothing * ((now - first[0]) - link.lag)
+            return False
+
+
+def select_best_link(links, timeout):
+    """Komut göndermek için en sağlıklı bağlantıyı seç"""
+    now = time.monotonic()
+    alive = [link for link in links if link.is_alive(timeout, now)]
+    if not alive:
+        # Hiçbiri canlı değilse açık olan ilk bağlantıyı kullan
+        alive = [link for link in links if not link.closed]
+        if not alive:
+            return None
+        return alive[0]
+    return min(alive, key=lambda link: (link.lag + link.stats.packet_loss() * 0.01, link.name or ''))
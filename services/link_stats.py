@@ -0,0 +1,200 @@
+from services.mavlink_filter import mavlink2
+import time
+
+
+class LatencyHistogram:
+    """Mikrosaniye cinsinden log2 kovalı süre histogramı"""
+    __slots__ = ('buckets', 'count', 'total', 'max')
+
+    BUCKETS = 24  # 1 us .. ~8 s
+
+    def __init__(self):
+        self.buckets = [0] * self.BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        micros = int(seconds * 1e6)
+        index = micros.bit_length()
+        if index >= self.BUCKETS:
+            index = self.BUCKETS - 1
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, p):
+        """Yaklaşık yüzdelik (kova üst sınırı, mikrosaniye)"""
+        if not self.count:
+            return 0
+        target = self.count * p / 100.0
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                return 1 << index
+        return 1 << (self.BUCKETS - 1)
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'mean_us': self.total / self.count * 1e6 if self.count else 0.0,
+            'p50_us': self.percentile(50),
+            'p99_us': self.percentile(99),
+            'max_us': self.max * 1e6,
+            'buckets': list(self.buckets)
+        }
+
+
+class RateMeter:
+    """Toplam sayaç ve yaklaşık saniyelik hız"""
+    __slots__ = ('total', 'rate', 'window_start', 'window_count')
+
+    def __init__(self):
+        self.total = 0
+        self.rate = 0.0
+        self.window_start = time.monotonic()
+        self.window_count = 0
+
+    def add(self, n, now):
+        self.total += n
+        self.window_count += n
+        elapsed = now - self.window_start
+        if elapsed >= 1.0:
+            self.rate = self.window_count / elapsed
+            self.window_start = now
+            self.window_count = 0
+
+    def current(self, now=None):
+        if now is None:
+            now = time.monotonic()
+        elapsed = now - self.window_start
+        # Uzun süre veri gelmediyse hız sıfıra doğru düşer
+        if elapsed >= 2.0:
+            return self.window_count / elapsed
+        return self.rate
+
+
+class SequenceTracker:
+    """Bir (sysid, compid) kaynağı için sıra numarası boşluklarından paket kaybı"""
+    __slots__ = ('last_seq', 'received', 'lost')
+
+    def __init__(self):
+        self.last_seq = -1
+        self.received = 0
+        self.lost = 0
+
+    def add(self, seq):
+        if self.last_seq >= 0:
+            gap = (seq - self.last_seq - 1) & 0xFF
+            # Büyük geri sıçramalar yeniden başlatma/çoğaltma sayılır
+            if gap < 128:
+                self.lost += gap
+        self.last_seq = seq
+        self.received += 1
+
+    def loss_percent(self):
+        total = self.received + self.lost
+        return 100.0 * self.lost / total if total else 0.0
+
+
+class LinkStats:
+    """Tek bir bağlantının mesaj, bayt, kayıp ve süre istatistikleri.
+
+    Sayaçlar okuyucu thread'inden güncellenir; summary() herhangi bir
+    thread'den çağrılabilir.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.messages = RateMeter()
+        self.bytes = RateMeter()
+        self.types = {}       # msg_id -> RateMeter
+        self.decode = {}      # mesaj tipi -> LatencyHistogram
+        self.sources = {}     # (sysid, compid) -> SequenceTracker
+        self.dispatch = {}    # tüketici adı -> LatencyHistogram
+        self.last_receive = None
+
+    def record_bytes(self, n, now):
+        self.bytes.add(n, now)
+
+    def record_frame(self, system_id, component_id, seq, msg_id, now):
+        self.last_receive = now
+        self.messages.add(1, now)
+
+        meter = self.types.get(msg_id)
+        if meter is None:
+            meter = self.types[msg_id] = RateMeter()
+        meter.add(1, now)
+
+        source = (system_id, component_id)
+        tracker = self.sources.get(source)
+        if tracker is None:
+            tracker = self.sources[source] = SequenceTracker()
+        tracker.add(seq)
+
+    def record_decode(self, msg_type, seconds):
+        histogram = self.decode.get(msg_type)
+        if histogram is None:
+            histogram = self.decode[msg_type] = LatencyHistogram()
+        histogram.add(seconds)
+
+    def record_dispatch(self, consumer, seconds):
+        histogram = self.dispatch.get(consumer)
+        if histogram is None:
+            histogram = self.dispatch[consumer] = LatencyHistogram()
+        histogram.add(seconds)
+
+    def record_message(self, msg, now):
+        """Önceden çözülmüş mesajlar için (recv_match yolu)"""
+        self.record_bytes(len(msg.get_msgbuf()), now)
+        self.record_frame(msg.get_srcSystem(), msg.get_srcComponent(),
+                          msg.get_seq(), msg.get_msgId(), now)
+
+    def packet_loss(self):
+        received = sum(tracker.received for tracker in list(self.sources.values()))
+        lost = sum(tracker.lost for tracker in list(self.sources.values()))
+        total = received + lost
+        return 100.0 * lost / total if total else 0.0
+
+    def summary(self):
+        now = time.monotonic()
+        types = {}
+        for msg_id, meter in list(self.types.items()):
+            msg_type = message_name(msg_id)
+            entry = {'count': meter.total, 'rate': meter.current(now)}
+            histogram = self.decode.get(msg_type)
+            if histogram is not None:
+                entry['decode'] = histogram.as_dict()
+            types[msg_type] = entry
+
+        return {
+            'name': self.name,
+            'messages': self.messages.total,
+            'messages_per_s': self.messages.current(now),
+            'bytes': self.bytes.total,
+            'bytes_per_s': self.bytes.current(now),
+            'packet_loss': self.packet_loss(),
+            'sources': {
+                f"{system_id}/{component_id}": {
+                    'received': tracker.received,
+                    'lost': tracker.lost,
+                    'loss_percent': tracker.loss_percent()
+                }
+                for (system_id, component_id), tracker in list(self.sources.items())
+            },
+            'types': types,
+            'dispatch': {consumer: histogram.as_dict()
+                         for consumer, histogram in list(self.dispatch.items())}
+        }
+
+
+def message_name(msg_id):
+    cls = mavlink2.mavlink_map.get(msg_id)
+    return cls.msgname if cls is not None else str(msg_id)
+
+
+def consumer_name(callback):
+    return getattr(callback, '__qualname__', None) or repr(callback)
@@ -0,0 +1,202 @@
+from pymavlink.dialects.v20 import ardupilotmega as mavlink2
+import time
+
+MAVLINK1_MAGIC = 0xFE
+MAVLINK2_MAGIC = 0xFD
+MAVLINK_IFLAG_SIGNED = 0x01
+
+# Mesaj adı -> mesaj ID
+MESSAGE_IDS = {cls.msgname: msg_id for msg_id, cls in mavlink2.mavlink_map.items()}
+# Mesaj ID -> CRC_EXTRA (çerçeve CRC'sine eklenen şema özeti)
+CRC_EXTRA = {msg_id: cls.crc_extra for msg_id, cls in mavlink2.mavlink_map.items()}
+
+
+def x25_crc(data, start, stop, extra):
+    """MAVLink CRC-16/X.25: data[start:stop] ve CRC_EXTRA baytı üzerinden"""
+    crc = mavlink2.x25crc(bytes(data[start:stop]))
+    crc.accumulate(bytes((extra,)))
+    return crc.crc
+
+
+def create_parser():
+    """MAVLink 1 ve 2 çerçevelerini çözebilen parser"""
+    parser = mavlink2.MAVLink(None)
+    parser.robust_parsing = True
+    return parser
+
+
+def message_ids(msg_types):
+    return {MESSAGE_IDS[msg_type] for msg_type in msg_types if msg_type in MESSAGE_IDS}
+
+
+class SelectiveParser:
+    """Ham çerçevedeki mesaj ID'sine bakarak yalnızca istenen mesajları çözer.
+
+    Çerçeve başlığı okunur, ID istenenler arasında değilse çerçeve pymavlink'e
+    verilmeden atlanır. wanted None ise tüm mesajlar çözülür. İstenen
+    çerçeveler doğrudan MAVLink.decode ile çözülür; CRC'yi o denetler.
+    """
+
+    def __init__(self, wanted=None):
+        self.parser = create_parser()
+        self.wanted_ids = None
+        self._buffer = bytearray()
+        self.decoded = 0
+        self.skipped = 0
+        self.skipped_by_id = {}
+        self.bad_bytes = 0
+        # Başlığı geçerli görünüp CRC'si ya da sonraki başlığı tutmayan çerçeveler
+        self.resyncs = 0
+        # İsteğe bağlı LinkStats: bayt, çerçeve ve çözme süresi sayaçları
+        self.stats = None
+        # İsteğe bağlı TlogRecorder: tüm çerçeveler (atlananlar dahil) kaydedilir
+        self.recorder = None
+        # İsteğe bağlı LinkDeduplicator: yedekli bağlantılarda tekrarlanan çerçeveler
+        self.deduplicator = None
+        self.link = None
+        self.duplicates = 0
+        self.set_wanted(wanted)
+
+    def set_wanted(self, msg_types):
+        # frozenset ataması tek adımdadır; okuyucu thread'i ile yarışmaz
+        self.wanted_ids = None if msg_types is None else frozenset(message_ids(msg_types))
+
+    def counters(self):
+        return {
+            'decoded': self.decoded,
+            'skipped': self.skipped,
+            'bad_bytes': self.bad_bytes,
+            'resyncs': self.resyncs,
+            'duplicates': self.duplicates,
+            'skipped_by_type': {
+                mavlink2.mavlink_map[msg_id].msgname if msg_id in mavlink2.mavlink_map else str(msg_id): count
+                for msg_id, count in self.skipped_by_id.items()
+            }
+        }
+
+    def parse_buffer(self, data):
+        buf = self._buffer
+        buf += data
+        wanted = self.wanted_ids
+        stats = self.stats
+        recorder = self.recorder
+        deduplicator = self.deduplicator
+        if stats is not None or deduplicator is not None:
+            now = time.monotonic()
+        if stats is not None:
+            stats.record_bytes(len(data), now)
+        messages = []
+        pos = 0
+        end = len(buf)
+
+        while pos < end:
+            magic = buf[pos]
+            if magic == MAVLINK2_MAGIC:
+                if end - pos < 10:
+                    break
+                length = buf[pos + 1]
+                frame_len = 12 + length
+                if buf[pos + 2] & MAVLINK_IFLAG_SIGNED:
+                    frame_len += 13
+                msg_id = buf[pos + 7] | (buf[pos + 8] << 8) | (buf[pos + 9] << 16)
+                seq_pos = pos + 4
+                crc_pos = pos + 10 + length
+            elif magic == MAVLINK1_MAGIC:
+                if end - pos < 6:
+                    break
+                frame_len = 8 + buf[pos + 1]
+                msg_id = buf[pos + 5]
+                seq_pos = pos + 2
+                crc_pos = pos + 6 + buf[pos + 1]
+            else:
+                # Senkronizasyonu kaybettik, sonraki başlık baytına atla
+                next_pos = _find_magic(buf, pos + 1)
+                if next_pos < 0:
+                    next_pos = end
+                self.bad_bytes += next_pos - pos
+                pos = next_pos
+                continue
+
+            if end - pos < frame_len:
+                break
+
+            # Başlık baytı veri içinde rastlantısal olabilir; uzunluğa güvenmeden
+            # önce çerçeve doğrulanır, tutmazsa bir bayt ilerleyip yeniden eşlenir
+            decode = wanted is None or msg_id in wanted
+            if decode and msg_id in CRC_EXTRA:
+                if stats is not None:
+                    started = time.perf_counter()
+                msg = self._decode(buf, pos, frame_len)
+                valid = msg is not None
+            else:
+                # Atlanan ya da CRC_EXTRA'sı bilinmeyen çerçeveler
+                valid = self._valid_skipped(buf, pos, frame_len, end, msg_id, crc_pos)
+                if valid is None:
+                    # Tamponun sonundaki tanınmayan çerçeve: sonraki başlığı bekle
+                    break
+                if valid and decode:
+                    if stats is not None:
+                        started = time.perf_counter()
+                    msg = self._decode(buf, pos, frame_len)
+                    valid = msg is not None
+            if not valid:
+                self.resyncs += 1
+                self.bad_bytes += 1
+                pos += 1
+                continue
+
+            if stats is not None:
+                # Atlanan çerçeveler de sıra numarası takibine girer
+                stats.record_frame(buf[seq_pos + 1], buf[seq_pos + 2], buf[seq_pos], msg_id, now)
+
+            if deduplicator is not None:
+                key = (buf[seq_pos + 1], buf[seq_pos + 2], buf[seq_pos], msg_id,
+                       buf[crc_pos] | (buf[crc_pos + 1] << 8))
+                if not deduplicator.accept(key, self.link, now):
+                    self.duplicates += 1
+                    pos += frame_len
+                    continue
+
+            if recorder is not None:
+                recorder.write_frame(bytes(buf[pos:pos + frame_len]))
+
+            if decode:
+                self.decoded += 1
+                messages.append(msg)
+                if stats is not None:
+                    stats.record_decode(msg.get_type(), time.perf_counter() - started)
+            else:
+                self.skipped += 1
+                self.skipped_by_id[msg_id] = self.skipped_by_id.get(msg_id, 0) + 1
+            pos += frame_len
+
+        del buf[:pos]
+        return messages
+
+    def _decode(self, buf, pos, frame_len):
+        # CRC ya da yük hatalı çerçevede None
+        try:
+            return self.parser.decode(bytearray(buf[pos:pos + frame_len]))
+        except mavlink2.MAVError:
+            return None
+
+    def _valid_skipped(self, buf, pos, frame_len, end, msg_id, crc_pos):
+        # Atlanan çerçevelerde ardından yeni bir başlık gelmesi beklenir; tamponun
+        # sonundaki çerçevenin uzunluk baytı bozuk olabileceğinden CRC denetlenir
+        next_pos = pos + frame_len
+        if next_pos < end:
+            return buf[next_pos] in (MAVLINK2_MAGIC, MAVLINK1_MAGIC)
+        extra = CRC_EXTRA.get(msg_id)
+        if extra is None:
+            return None
+        return x25_crc(buf, pos + 1, crc_pos, extra) == buf[crc_pos] | (buf[crc_pos + 1] << 8)
+
+
+def _find_magic(buf, start):
+    v2 = buf.find(MAVLINK2_MAGIC, start)
+    v1 = buf.find(MAVLINK1_MAGIC, start)
+    if v1 < 0:
+        return v2
+    if v2 < 0:
+        return v1
+    return min(v1, v2)
@@ -1,73 +1,324 @@
 from pymavlink import mavutil
+from services.telemetry_state import TelemetryStore
+from services.telemetry_bus import FrameDispatcher, TelemetryBus
+from services.mavlink_filter import SelectiveParser
+from services.link_stats import LinkStats, consumer_name
+from services.mavlink_recorder import TlogRecorder, TlogReplay
+from services.link_manager import LinkDeduplicator, RedundantLink, select_best_link
 import threading
 import time
 
+# Eski vehicle_data sözlüğünü dolduran mesajlar
+LEGACY_MESSAGES = {'HEARTBEAT', 'GLOBAL_POSITION_INT', 'VFR_HUD', 'ATTITUDE', 'GPS_RAW_INT'}
+
 class MAVLinkHandler:
-    def __init__(self):
+    def __init__(self, transport=None, selective_decoding=False, link_timeout=2.0):
+        # Paylaşılan MAVLinkTransport verilirse bağlantı başına thread açılmaz
+        self.transport = transport
         self.connection = None
         self.is_connected = False
-        self.vehicle_data = {
-            'altitude': 0,
-            'groundspeed': 0,
-            'mode': 'UNKNOWN',
-            'gps_fix': 0,
-            'pitch': 0,
-            'roll': 0,
-            'heading': 0
-        }
+        # Araç başına tipli telemetri kayıtları
+        self.state = TelemetryStore()
+        # Alan bazlı, birleştirilmiş abonelikler (GUI thread'inde dağıtılır)
+        self.bus = TelemetryBus(self.state)
+        # İlk abonelikte GUI thread'inde oluşturulur (QTimer o thread'e bağlıdır)
+        self.dispatcher = None
         self.listeners = []
+        # Her tipli kaydı okuyucu thread'inde alan tüketiciler (ör. canlı analiz)
+        self.record_listeners = []
+
+        # Aynı araca yedekli bağlantılar (ör. 900 MHz telemetri + LTE)
+        self.links = []
+        self.link_timeout = link_timeout
+        self.deduplicator = None
+        self._handle_lock = threading.Lock()
+
+        # Seçici çözme: yalnızca abonesi olan mesaj ID'leri çözülür
+        self.selective_decoding = selective_decoding
+        self.required_messages = set()
+        self.decoder = SelectiveParser()
+        self.update_decode_filter()
+
+        # Bağlantı sağlığı ve çözme/dağıtım süresi istatistikleri
+        self.stats = LinkStats(None)
+        self.decoder.stats = self.stats
+        self.bus.stats = self.stats
+        self.recorder = None
+
+    @property
+    def vehicle_data(self):
+        # Eski dinleyiciler için birincil aracın özet sözlüğü
+        return self.state.legacy_data()
+
+    def snapshot(self, system_id=None):
+        return self.state.snapshot(system_id)
 
     def connect(self, connection_string):
+        self.links = []
+        self.stats.name = connection_string
+        link = self._open_link(connection_string, self._link_decoder(connection_string))
+        if link is None:
+            return False
+        self.connection = link.connection
+        return True
+
+    def add_link(self, connection_string):
+        """Aynı araca ek bağlantı aç; çerçeveler (sysid, compid, seq) ile tekilleştirilir"""
+        if not self.links:
+            return self.connect(connection_string)
+
+        if self.deduplicator is None:
+            self.deduplicator = LinkDeduplicator()
+            for link in self.links:
+                link.decoder.deduplicator = self.deduplicator
+        return self._open_link(connection_string, self._link_decoder(connection_string)) is not None
+
+    def _link_decoder(self, connection_string):
+        # Her bağlantının kendi parser'ı ve istatistikleri vardır; birincil
+        # bağlantı da self.decoder/self.stats'ı paylaşmaz, böylece feed_bytes
+        # ya da oynatma bağlantı gecikme/kayıp puanlarını bozmaz
+        decoder = SelectiveParser()
+        decoder.wanted_ids = self.decoder.wanted_ids
+        decoder.recorder = self.recorder
+        decoder.deduplicator = self.deduplicator
+        decoder.stats = LinkStats(connection_string)
+        return decoder
+
+    def remove_link(self, connection_string):
+        for link in list(self.links):
+            if link.name == connection_string:
+                self._close_link(link)
+                self.links.remove(link)
+        if self.links:
+            self.connection = self.links[0].connection
+
+    def _open_link(self, connection_string, decoder):
+        link = RedundantLink(connection_string, decoder, decoder.stats)
+        decoder.link = link
         try:
-            self.connection = mavutil.mavlink_connection(connection_string)
-            self.is_connected = True
-            # Mesaj dinleme thread'ini başlat
-            self.read_thread = threading.Thread(target=self._read_messages)
-            self.read_thread.daemon = True
-            self.read_thread.start()
-            return True
+            if self.transport is not None:
+                link.connection = self.transport.open_link(connection_string, self._handle_message,
+                                                           parser=decoder)
+            else:
+                link.connection = mavutil.mavlink_connection(connection_string)
         except Exception as e:
             print(f"Connection failed: {e}")
-            return False
+            return None
+
+        self.links.append(link)
+        self.is_connected = True
+        if self.transport is None:
+            # Mesaj dinleme thread'ini başlat
+            link.read_thread = threading.Thread(target=self._read_messages, args=(link,))
+            link.read_thread.daemon = True
+            link.read_thread.start()
+            if link is self.links[0]:
+                self.read_thread = link.read_thread
+        return link
+
+    def _time_parse_char(self, link):
+        # recv_match yolunda çözme süresi: mavutil her mesajı parse_char ile çıkarır.
+        # mavutil ilk baytta MAVLink sürümüne göre .mav'ı değiştirebildiğinden
+        # okuyucu her turda sarmalayıcının yerinde olduğunu denetler.
+        mav = link.connection.mav
+        parse_char = mav.parse_char
+        if getattr(parse_char, 'timed', False):
+            return
+
+        def timed_parse_char(data):
+            started = time.perf_counter()
+            msg = parse_char(data)
+            if msg is not None:
+                link.stats.record_decode(msg.get_type(), time.perf_counter() - started)
+            return msg
+
+        timed_parse_char.timed = True
+        mav.parse_char = timed_parse_char
+
+    def _close_link(self, link):
+        link.closed = True
+        link.decoder.recorder = None
+        link.connection.close()
+        # Okuyucu kapatılan tanıtıcıyı kullanmayı bırakana kadar bekle
+        if link.read_thread is not None and link.read_thread is not threading.current_thread():
+            link.read_thread.join(2.0)
 
     def disconnect(self):
         if self.connection:
             self.is_connected = False
-            self.connection.close()
+            for link in self.links:
+                self._close_link(link)
 
-    def _read_messages(self):
-        while self.is_connected:
+    def _read_messages(self, link):
+        while self.is_connected and not link.closed:
             try:
-                msg = self.connection.recv_match(blocking=True, timeout=1.0)
+                # Yedekli bağlantılarda tekilleştirme ham çerçeveler üzerinde yapılır
+                if self.selective_decoding or self.deduplicator is not None:
+                    self._read_raw(link)
+                    continue
+                self._time_parse_char(link)
+                msg = link.connection.recv_match(blocking=True, timeout=1.0)
                 if msg:
+                    now = time.monotonic()
+                    link.stats.record_message(msg, now)
+                    if self.deduplicator is not None and not self.deduplicator.accept(
+                            (msg.get_srcSystem(), msg.get_srcComponent(), msg.get_seq(),
+                             msg.get_msgId(), msg.get_crc()), link, now):
+                        continue
+                    if self.recorder is not None:
+                        self.recorder.write_frame(msg.get_msgbuf())
                     self._handle_message(msg)
             except Exception as e:
+                if link.closed or not self.is_connected:
+                    # Bağlantı kapatılırken okuma hatası beklenir
+                    break
                 print(f"Error reading message: {e}")
                 time.sleep(0.1)
 
-    def _handle_message(self, msg):
-        msg_type = msg.get_type()
-        
-        if msg_type == "GLOBAL_POSITION_INT":
-            self.vehicle_data['altitude'] = msg.relative_alt / 1000.0
-        elif msg_type == "VFR_HUD":
-            self.vehicle_data['groundspeed'] = msg.groundspeed
-            self.vehicle_data['heading'] = msg.heading
-        elif msg_type == "ATTITUDE":
-            self.vehicle_data['pitch'] = msg.pitch
-            self.vehicle_data['roll'] = msg.roll
-        elif msg_type == "HEARTBEAT":
-            self.vehicle_data['mode'] = mavutil.mode_string_v10(msg)
-        elif msg_type == "GPS_RAW_INT":
-            self.vehicle_data['gps_fix'] = msg.fix_type
-
-        # Dinleyicileri bilgilendir
-        for listener in self.listeners:
-            listener(self.vehicle_data)
+    def _read_raw(self, link):
+        # Ham baytları oku, çerçeve başlığındaki ID'ye göre filtreleyip çöz
+        if not link.connection.select(1.0):
+            return
+        data = link.connection.recv()
+        if data:
+            for msg in link.decoder.parse_buffer(data):
+                self._handle_message(msg)
+
+    def feed_bytes(self, data, timestamp=None, decoder=None):
+        # Ham MAVLink baytlarını işle; kayıt oynatma kendi parser'ını verir,
+        # böylece canlı bağlantının tamponu ve istatistikleri karışmaz
+        if decoder is None:
+            decoder = self.decoder
+        for msg in decoder.parse_buffer(data):
+            self._handle_message(msg, timestamp, decoder.stats)
+
+    def _handle_message(self, msg, timestamp=None, stats=None):
+        # Birden fazla okuyucu thread'i olduğunda depoya tek yazıcı garanti edilir
+        if stats is None:
+            stats = self.stats
+        with self._handle_lock:
+            record = self.state.update(msg, timestamp)
+            self.bus.notify(msg, record)
+
+            if record is not None and self.record_listeners:
+                system_id = msg.get_srcSystem()
+                for listener in self.record_listeners:
+                    started = time.perf_counter()
+                    listener(system_id, record)
+                    stats.record_dispatch(consumer_name(listener), time.perf_counter() - started)
+
+            # Eski dinleyicileri bilgilendir (okuyucu thread'inde, her mesajda)
+            if self.listeners:
+                vehicle_data = self.vehicle_data
+                for listener in self.listeners:
+                    started = time.perf_counter()
+                    listener(vehicle_data)
+                    stats.record_dispatch(consumer_name(listener), time.perf_counter() - started)
 
     def add_listener(self, listener):
         self.listeners.append(listener)
+        self.update_decode_filter()
 
     def remove_listener(self, listener):
         if listener in self.listeners:
-            self.listeners.remove(listener)
\ No newline at end of file
+            self.listeners.remove(listener)
+            self.update_decode_filter()
+
+    def add_record_listener(self, listener):
+        # listener(system_id, kayıt) her mesajda okuyucu thread'inde çağrılır;
+        # kayıt atlanmadığı için örnek başına hesaplar (entegrasyon vb.) içindir
+        self.record_listeners.append(listener)
+
+    def remove_record_listener(self, listener):
+        if listener in self.record_listeners:
+            self.record_listeners.remove(listener)
+
+    def subscribe(self, callback, fields=None, messages=None, max_rate=None, system_id=None):
+        # callback(system_id, {aile veya mesaj tipi: kayıt}) GUI thread'inde çağrılır
+        subscription = self.bus.subscribe(callback, fields, messages, max_rate, system_id)
+        if self.dispatcher is None:
+            self.dispatcher = FrameDispatcher(self.bus)
+        self.dispatcher.start()
+        self.update_decode_filter()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        self.bus.unsubscribe(subscription)
+        if self.dispatcher is not None and not self.bus.subscriptions:
+            self.dispatcher.stop()
+        self.update_decode_filter()
+
+    def require_messages(self, *msg_types):
+        # snapshot() ile okunan ama abonesi olmayan mesajlar için
+        self.required_messages.update(msg_types)
+        self.update_decode_filter()
+
+    def update_decode_filter(self):
+        if not self.selective_decoding:
+            self.decoder.set_wanted(None)
+            for link in self.links:
+                link.decoder.wanted_ids = None
+            return
+        wanted = {'HEARTBEAT'} | self.bus.wanted_messages() | self.required_messages
+        if self.listeners:
+            wanted |= LEGACY_MESSAGES
+        self.decoder.set_wanted(wanted)
+        for link in self.links:
+            link.decoder.wanted_ids = self.decoder.wanted_ids
+
+    def decode_counters(self):
+        # Birincil bağlantının parser sayaçları
+        decoder = self.links[0].decoder if self.links else self.decoder
+        return decoder.counters()
+
+    def start_recording(self, file_path):
+        self.stop_recording()
+        self.recorder = TlogRecorder(file_path)
+        self.decoder.recorder = self.recorder
+        for link in self.links:
+            link.decoder.recorder = self.recorder
+
+    def stop_recording(self):
+        if self.recorder is not None:
+            self.decoder.recorder = None
+            for link in self.links:
+                link.decoder.recorder = None
+            self.recorder.close()
+            self.recorder = None
+
+    def replay(self, file_path, speed=1.0, loop=False):
+        # speed: 1.0 gerçek zaman, N kat hız, None/0 beklemesiz
+        replay = TlogReplay(file_path, self, speed, loop)
+        replay.start()
+        return replay
+
+    def link_stats(self, link=None):
+        # Bağlantı sayaçları verilen (varsayılan: birincil) bağlantıdan,
+        # tüketici süreleri handler'dan
+        if link is None and self.links:
+            link = self.links[0]
+        if link is None:
+            summary = self.stats.summary()
+            summary['decoder'] = self.decoder.counters()
+        else:
+            summary = link.stats.summary()
+            summary['name'] = link.name
+            summary['decoder'] = link.decoder.counters()
+        summary['dispatch'] = self.stats.summary()['dispatch']
+        return summary
+
+    def link_health(self):
+        # Bağlantı başına canlılık, gecikme ve kayıp karşılaştırması
+        now = time.monotonic()
+        return [link.health(self.link_timeout, now) for link in self.links]
+
+    def best_link(self):
+        return select_best_link(self.links, self.link_timeout)
+
+    @property
+    def mav(self):
+        # Giden komutlar en sağlıklı bağlantı üzerinden gönderilir
+        link = self.best_link()
+        if link is None:
+            return None
+        return link.connection.mav
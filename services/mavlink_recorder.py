@@ -0,0 +1,146 @@
+from services.mavlink_filter import MAVLINK1_MAGIC, MAVLINK2_MAGIC, MAVLINK_IFLAG_SIGNED, SelectiveParser
+from services.link_stats import LinkStats
+import mmap
+import struct
+import threading
+import time
+
+TLOG_TIMESTAMP = struct.Struct('>Q')
+
+
+class TlogRecorder:
+    """Ham MAVLink çerçevelerini alış zamanıyla tlog biçiminde kaydeder.
+
+    Her çerçevenin önüne mavutil'deki gibi 8 baytlık big-endian mikrosaniye
+    zaman damgası yazılır; dosya Mission Planner/MAVExplorer ile açılabilir.
+    """
+
+    def __init__(self, file_path, buffer_size=1 << 16):
+        self.file_path = file_path
+        self.file = open(file_path, 'wb', buffering=buffer_size)
+        self.frames = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+    def write_frame(self, frame, timestamp=None):
+        if timestamp is None:
+            timestamp = time.time()
+        usec = int(timestamp * 1.0e6) & ~3
+        with self._lock:
+            if self.file is None:
+                return
+            self.file.write(TLOG_TIMESTAMP.pack(usec))
+            self.file.write(frame)
+            self.frames += 1
+            self.bytes += len(frame) + 8
+
+    def close(self):
+        with self._lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+
+def iter_tlog(file_path):
+    """tlog dosyasındaki (zaman damgası, çerçeve) çiftlerini sırayla döndürür"""
+    with open(file_path, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            pos = 0
+            end = len(data)
+            while pos + 9 < end:
+                magic = data[pos + 8]
+                if magic == MAVLINK2_MAGIC:
+                    frame_len = 12 + data[pos + 9]
+                    if pos + 10 < end and data[pos + 10] & MAVLINK_IFLAG_SIGNED:
+                        frame_len += 13
+                elif magic == MAVLINK1_MAGIC:
+                    frame_len = 8 + data[pos + 9]
+                else:
+                    # Bozuk kayıt: bir bayt ilerleyip yeniden senkronize ol
+                    pos += 1
+                    continue
+
+                frame_end = pos + 8 + frame_len
+                if frame_end > end:
+                    break
+                usec, = TLOG_TIMESTAMP.unpack_from(data, pos)
+                yield usec * 1.0e-6, data[pos + 8:frame_end]
+                pos = frame_end
+
+
+class TlogReplay:
+    """tlog kaydını MAVLinkHandler'a 1x, Nx veya sınırsız hızda besler.
+
+    speed None veya 0 ise çerçeveler beklemeden verilir; bu mod tüketicileri
+    donanım olmadan yük altında ölçmek için kullanılır. Oynatmanın kendi
+    parser'ı ve istatistikleri vardır; canlı bağlantının tamponuna, bağlantı
+    istatistiklerine, tekilleştiricisine ve açık tlog kaydına dokunmaz.
+    """
+
+    def __init__(self, file_path, handler, speed=1.0, loop=False):
+        self.file_path = file_path
+        self.handler = handler
+        self.speed = speed
+        self.loop = loop
+        self.frames = 0
+        self.elapsed = 0.0
+        self.thread = None
+        self._stop = threading.Event()
+        self.stats = LinkStats(f"replay:{file_path}")
+        self.decoder = SelectiveParser()
+        self.decoder.stats = self.stats
+
+    def start(self):
+        self._stop.clear()
+        self.thread = threading.Thread(target=self.run, name="TlogReplay")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def is_running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def run(self):
+        started = time.perf_counter()
+        while True:
+            self._replay_once()
+            if not self.loop or self._stop.is_set():
+                break
+        self.elapsed = time.perf_counter() - started
+        return self.results()
+
+    def _replay_once(self):
+        first_timestamp = None
+        wall_start = time.perf_counter()
+
+        for timestamp, frame in iter_tlog(self.file_path):
+            if self._stop.is_set():
+                break
+
+            if self.speed:
+                if first_timestamp is None:
+                    first_timestamp = timestamp
+                delay = (timestamp - first_timestamp) / self.speed - (time.perf_counter() - wall_start)
+                # Kısa beklemeleri biriktirerek uyku çağrılarını azalt
+                if delay > 0.002:
+                    self._stop.wait(delay)
+
+            # Abonelikler oynatma sırasında değişebilir; filtre her çerçevede izlenir
+            self.decoder.wanted_ids = self.handler.decoder.wanted_ids
+            self.handler.feed_bytes(frame, timestamp, self.decoder)
+            self.frames += 1
+
+    def results(self):
+        return {
+            'frames': self.frames,
+            'elapsed': self.elapsed,
+            'frames_per_s': self.frames / self.elapsed if self.elapsed else 0.0,
+            'decoder': self.decoder.counters()
+        }
@@ -0,0 +1,357 @@
+from pymavlink import mavutil
+from services.mavlink_filter import SelectiveParser
+import asyncio
+import concurrent.futures
+import os
+import serial
+import threading
+
+# Windows'ta Proactor döngüsü add_reader desteklemez ve pyserial portlarının
+# fileno'su yoktur; seri portlar orada ayrı bir okuyucu thread'inden beslenir
+SERIAL_SELECTABLE = os.name != 'nt'
+# Okuyucu thread'inin kapanma kontrolü arasındaki en uzun bekleme (s)
+SERIAL_READ_TIMEOUT = 0.1
+UDP_SCHEMES = ('udp', 'udpin', 'udpout')
+
+
+class TransportLink:
+    """Tek bir seri/UDP/TCP bağlantısı.
+
+    Gelen baytlar queue_size ile sınırlı bir kuyruğa alınır ve kuyruktan
+    çözümlenip on_message ile teslim edilir. Kuyruk dolduğunda TCP ve seri
+    bağlantılarda okuma duraklatılır, UDP'de en eski paket atılır.
+    """
+
+    def __init__(self, manager, connection_string, on_message, baud, queue_size,
+                 source_system, source_component, parser=None):
+        self.manager = manager
+        self.connection_string = connection_string
+        self.on_message = on_message
+        self.baud = baud
+        self.queue_size = queue_size
+
+        # Mesaj ID filtresi uygulayabilen parser
+        self.parser = parser if parser is not None else SelectiveParser()
+        # Komut göndermek için mavutil bağlantısındaki gibi .mav kullanılabilir
+        self.mav = mavutil.mavlink.MAVLink(self, srcSystem=source_system,
+                                           srcComponent=source_component)
+
+        self.connected = False
+        self.closed = False
+        self.error = None
+        self.bytes_received = 0
+        self.dropped_packets = 0
+
+        self.queue = None
+        self._transport = None
+        self._serial = None
+        self._serial_thread = None
+        self._peer = None
+        self._paused = False
+        self._tasks = []
+
+    # mavutil bağlantılarıyla uyumlu yazma/kapama arayüzü
+    def write(self, data):
+        self.manager.send(self, data)
+
+    def close(self):
+        self.manager.close_link(self)
+
+    # Olay döngüsü tarafı
+    def _feed(self, data):
+        self.bytes_received += len(data)
+        if self.queue.full() and self._is_datagram():
+            self.queue.get_nowait()
+            self.dropped_packets += 1
+        self.queue.put_nowait(data)
+        # Akış bağlantılarında son boş yer dolunca okuma hemen durur;
+        # duraklatılmış bağlantıdan başka veri gelmez
+        if self.queue.full() and not self._is_datagram():
+            self._pause()
+
+    async def _put(self, data):
+        # Okuyucu thread'i kuyrukta yer açılana kadar bekler
+        self.bytes_received += len(data)
+        await self.queue.put(data)
+
+    def _is_datagram(self):
+        return self._serial is None and isinstance(self._transport, asyncio.DatagramTransport)
+
+    def _pause(self):
+        if self._paused:
+            return
+        self._paused = True
+        if self._serial is not None:
+            self.manager.loop.remove_reader(self._serial.fileno())
+        elif self._transport is not None:
+            self._transport.pause_reading()
+
+    def _resume(self):
+        if not self._paused:
+            return
+        self._paused = False
+        if self._serial is not None:
+            self.manager.loop.add_reader(self._serial.fileno(), self._read_serial)
+        elif self._transport is not None:
+            self._transport.resume_reading()
+
+    def _read_serial(self):
+        try:
+            data = self._serial.read(self._serial.in_waiting or 1)
+        except Exception as e:
+            self.error = str(e)
+            self.manager.loop.remove_reader(self._serial.fileno())
+            self.connected = False
+            return
+        if data:
+            self._feed(data)
+
+    def _serial_worker(self):
+        # Seçilemeyen seri portlar için engelleyici okuma (Windows)
+        while not self.closed:
+            try:
+                data = self._serial.read(self._serial.in_waiting or 1)
+            except Exception as e:
+                if not self.closed:
+                    self.error = str(e)
+                    self.connected = False
+                return
+            if not data:
+                continue
+            future = asyncio.run_coroutine_threadsafe(self._put(data), self.manager.loop)
+            while not self.closed:
+                try:
+                    future.result(SERIAL_READ_TIMEOUT)
+                    break
+                except concurrent.futures.TimeoutError:
+                    continue
+            else:
+                future.cancel()
+
+    async def _consume(self):
+        while True:
+            data = await self.queue.get()
+            if self._paused and self.queue.qsize() < self.queue_size // 2:
+                self._resume()
+
+            msgs = self.parser.parse_buffer(data)
+            if not msgs:
+                continue
+            for msg in msgs:
+                try:
+                    self.on_message(msg)
+                except Exception as e:
+                    print(f"Error handling message: {e}")
+
+    def _send_now(self, data):
+        if self._serial is not None:
+            self._serial.write(data)
+        elif self._transport is None or self._transport.is_closing():
+            return
+        elif self._is_datagram():
+            if self._peer is not None:
+                self._transport.sendto(data, self._peer)
+        else:
+            self._transport.write(data)
+
+
+class _StreamProtocol(asyncio.Protocol):
+    def __init__(self, link):
+        self.link = link
+        # Bağlantı koptuğunda kurulur; yeniden bağlanma bunu bekler
+        self.lost = asyncio.Event()
+
+    def connection_made(self, transport):
+        self.link._transport = transport
+        self.link.connected = True
+        # Yeniden bağlanıldığında kuyruk hâlâ doluysa yeni bağlantı duraklatılmış başlar
+        self.link._paused = False
+        if self.link.queue.full():
+            self.link._pause()
+
+    def data_received(self, data):
+        self.link._feed(data)
+
+    def connection_lost(self, exc):
+        self.link.connected = False
+        if exc is not None:
+            self.link.error = str(exc)
+        self.lost.set()
+
+
+class _DatagramProtocol(asyncio.DatagramProtocol):
+    def __init__(self, link):
+        self.link = link
+
+    def connection_made(self, transport):
+        self.link._transport = transport
+        self.link.connected = True
+
+    def datagram_received(self, data, addr):
+        # udpin bağlantılarında yanıtlar son gönderene yollanır
+        self.link._peer = addr
+        self.link._feed(data)
+
+    def error_received(self, exc):
+        self.link.error = str(exc)
+
+
+class MAVLinkTransport:
+    """Birden fazla MAVLink bağlantısını tek bir asyncio olay döngüsünde yönetir.
+
+    Olay döngüsü tek bir arka plan thread'inde çalışır; bağlantı başına thread
+    açılmaz. Bağlantı dizgileri mavutil ile aynıdır: 'udpin:0.0.0.0:14550',
+    'udpout:host:port', 'udp:host:port', 'tcp:host:port', '/dev/ttyUSB0' veya
+    'COM3'. Windows'ta seri portlar olay döngüsünde seçilemediği için her biri
+    kendi okuyucu thread'inde okunur (SERIAL_SELECTABLE). on_message geri
+    çağrıları olay döngüsü thread'inde çalışır.
+    """
+
+    def __init__(self, queue_size=256, retry_interval=1.0, connect_timeout=5.0):
+        self.queue_size = queue_size
+        self.retry_interval = retry_interval
+        # İlk TCP bağlantısı için beklenecek en uzun süre (s)
+        self.connect_timeout = connect_timeout
+        self.loop = None
+        self.thread = None
+        self.links = []
+
+    def start(self):
+        if self.thread is not None:
+            return
+        self.loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(self.loop)
+            self.loop.call_soon(started.set)
+            self.loop.run_forever()
+            self.loop.close()
+
+        self.thread = threading.Thread(target=run, name="MAVLinkTransport")
+        self.thread.daemon = True
+        self.thread.start()
+        started.wait()
+
+    def stop(self, timeout=5.0):
+        if self.thread is None:
+            return
+        future = asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop)
+        try:
+            future.result(timeout)
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout)
+            self.thread = None
+
+    def open_link(self, connection_string, on_message, baud=57600,
+                  source_system=255, source_component=0, parser=None):
+        """Bağlantıyı açar; açılamazsa hatayı fırlatır.
+
+        TCP'de ilk bağlantı connect_timeout kadar beklenir, sonrasında kopan
+        bağlantı arka planda yeniden kurulur.
+        """
+        self.start()
+        link = TransportLink(self, connection_string, on_message, baud, self.queue_size,
+                             source_system, source_component, parser)
+        future = asyncio.run_coroutine_threadsafe(self._open(link), self.loop)
+        future.result()
+        return link
+
+    def close_link(self, link):
+        if link.closed or self.thread is None:
+            return
+        future = asyncio.run_coroutine_threadsafe(self._close(link), self.loop)
+        future.result()
+
+    def send(self, link, data):
+        if threading.current_thread() is self.thread:
+            link._send_now(data)
+        else:
+            self.loop.call_soon_threadsafe(link._send_now, bytes(data))
+
+    async def _open(self, link):
+        scheme, separator, address = link.connection_string.partition(':')
+        link.queue = asyncio.Queue(maxsize=link.queue_size)
+        if scheme in UDP_SCHEMES:
+            await self._open_udp(link, scheme, address)
+        elif scheme == 'tcp':
+            connected = self.loop.create_future()
+            link._tasks.append(asyncio.ensure_future(self._run_tcp(link, address, connected)))
+            try:
+                await asyncio.wait_for(asyncio.shield(connected), self.connect_timeout)
+            except asyncio.TimeoutError:
+                await self._close(link)
+                raise ConnectionError(f"{link.connection_string} bağlanılamadı: {link.error}")
+        elif separator:
+            raise ValueError(f"Desteklenmeyen bağlantı tipi: {scheme}")
+        else:
+            self._open_serial(link)
+        link._tasks.append(asyncio.ensure_future(link._consume()))
+        self.links.append(link)
+
+    async def _open_udp(self, link, scheme, address):
+        host, port = address.rsplit(':', 1)
+        if scheme == 'udpout':
+            link._peer = (host, int(port))
+            await self.loop.create_datagram_endpoint(
+                lambda: _DatagramProtocol(link), remote_addr=link._peer)
+        else:
+            # mavutil'de 'udp:' dinleme anlamına gelir
+            await self.loop.create_datagram_endpoint(
+                lambda: _DatagramProtocol(link), local_addr=(host, int(port)))
+
+    async def _run_tcp(self, link, address, connected):
+        host, port = address.rsplit(':', 1)
+        while not link.closed:
+            try:
+                transport, protocol = await self.loop.create_connection(
+                    lambda: _StreamProtocol(link), host, int(port))
+            except OSError as e:
+                link.error = str(e)
+                await asyncio.sleep(self.retry_interval)
+                continue
+            if not connected.done():
+                connected.set_result(True)
+
+            # Bağlantı kopana kadar bekle, ardından yeniden bağlan
+            await protocol.lost.wait()
+            transport.close()
+
+    def _open_serial(self, link):
+        port, _, baud = link.connection_string.partition(',')
+        if SERIAL_SELECTABLE:
+            link._serial = serial.Serial(port, int(baud or link.baud), timeout=0)
+            self.loop.add_reader(link._serial.fileno(), link._read_serial)
+        else:
+            link._serial = serial.Serial(port, int(baud or link.baud), timeout=SERIAL_READ_TIMEOUT)
+            link._serial_thread = threading.Thread(target=link._serial_worker,
+                                                   name=f"MAVLinkSerial {port}")
+            link._serial_thread.daemon = True
+            link._serial_thread.start()
+        link.connected = True
+
+    async def _close(self, link):
+        link.closed = True
+        link.connected = False
+        for task in link._tasks:
+            task.cancel()
+        await asyncio.gather(*link._tasks, return_exceptions=True)
+        link._tasks = []
+
+        if link._serial_thread is not None:
+            # Thread en geç SERIAL_READ_TIMEOUT sonra closed bayrağını görür
+            await self.loop.run_in_executor(None, link._serial_thread.join)
+            link._serial_thread = None
+        elif link._serial is not None and not link._paused:
+            self.loop.remove_reader(link._serial.fileno())
+        if link._serial is not None:
+            link._serial.close()
+        if link._transport is not None:
+            link._transport.close()
+        if link in self.links:
+            self.links.remove(link)
+
+    async def _shutdown(self):
+        for link in list(self.links):
+            await self._close(link)
@@ -0,0 +1,41 @@
+from PyQt6.QtCore import QThread, pyqtSignal
+
+
+class ReportThread(QThread):
+    """Rapor yazma fonksiyonunu arayüzü dondurmadan arka planda çalıştırır.
+
+    writer, analysis.report içindeki write_html_report/write_pdf_report
+    gibi progress(yüzde, mesaj) geri çağrısı alan bir fonksiyondur.
+    """
+    progress_updated = pyqtSignal(int)
+    status_updated = pyqtSignal(str)
+    completed = pyqtSignal(bool, str)
+
+    # Çalışan raporlar bitene kadar burada tutulur; çağıran referansı bıraksa
+    # da (ör. ikinci bir rapor başlatıldığında) Qt çalışan thread'i yok etmez
+    _running = set()
+
+    def __init__(self, writer, file_path, **kwargs):
+        super().__init__()
+        self.writer = writer
+        self.file_path = file_path
+        self.kwargs = kwargs
+        self.finished.connect(self._release)
+
+    def start(self):
+        ReportThread._running.add(self)
+        super().start()
+
+    def _release(self):
+        ReportThread._running.discard(self)
+
+    def report_progress(self, percent, message):
+        self.progress_updated.emit(percent)
+        self.status_updated.emit(message)
+
+    def run(self):
+        try:
+            self.writer(self.file_path, progress=self.report_progress, **self.kwargs)
+            self.completed.emit(True, self.file_path)
+        except Exception as e:
+            self.completed.emit(False, str(e))
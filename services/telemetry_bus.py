@@ -0,0 +1,202 @@
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from services.telemetry_state import FAMILIES, FAMILY_INDEX, MESSAGE_FAMILIES
+from services.link_stats import consumer_name
+import threading
+import time
+
+
+class Subscription:
+    """Bir tüketicinin ilgilendiği alanlar, mesaj tipleri ve teslim hızı"""
+
+    def __init__(self, callback, fields=None, messages=None, max_rate=None, system_id=None):
+        self.callback = callback
+        self.name = consumer_name(callback)
+        self.system_id = system_id
+        self.min_interval = 1.0 / max_rate if max_rate else 0.0
+        self.last_delivery = 0.0
+
+        # aile -> izlenen alanlar (None: tüm alanlar)
+        self.families = {}
+        # Kayıt ailesi olmayan ham mesaj tipleri
+        self.raw_messages = set()
+
+        for spec in fields or ():
+            family, _, field = spec.partition('.')
+            if family not in FAMILY_INDEX:
+                raise ValueError(f"Bilinmeyen telemetri ailesi: {family}")
+            if not field:
+                self.families[family] = None
+            elif family not in self.families or self.families[family] is not None:
+                self.families.setdefault(family, []).append(field)
+
+        for msg_type in messages or ():
+            entry = MESSAGE_FAMILIES.get(msg_type)
+            if entry is None:
+                self.raw_messages.add(msg_type)
+            else:
+                self.families[FAMILIES[entry[0]]] = None
+
+        # (sysid, aile) -> son teslim edilen sürüm ve değerler
+        self._versions = {}
+        self._values = {}
+        self._raw_seen = {}
+
+    def _changed_records(self, system_id, snapshot):
+        changes = {}
+        for family, fields in self.families.items():
+            record = snapshot[family]
+            key = (system_id, family)
+            if record.version == self._versions.get(key, 0):
+                continue
+            self._versions[key] = record.version
+
+            # Değer karşılaştırması ile değişmeyen kayıtları ele
+            if fields is None:
+                fields = record.fields
+            values = tuple(getattr(record, field) for field in fields)
+            if values == self._values.get(key):
+                continue
+            self._values[key] = values
+            changes[family] = record
+        return changes
+
+    def _changed_messages(self, system_id, raw):
+        changes = {}
+        for msg_type in self.raw_messages:
+            entry = raw.get((system_id, msg_type))
+            if entry is None:
+                continue
+            counter, msg = entry
+            key = (system_id, msg_type)
+            if self._raw_seen.get(key) == counter:
+                continue
+            self._raw_seen[key] = counter
+            changes[msg_type] = msg
+        return changes
+
+
+class TelemetryBus:
+    """Telemetri güncellemelerini birleştirip kare başına bir kez dağıtır.
+
+    Okuyucu thread'i yalnızca depoyu günceller ve notify() çağırır;
+    dispatch() GUI thread'inde (FrameDispatcher) çalışır, her abonenin
+    ilgilendiği ailelerde değişiklik olup olmadığına bakar ve birikmiş
+    değişiklikleri tek çağrıda teslim eder.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.subscriptions = []
+        self._raw_types = frozenset()
+        self._raw = {}
+        self._raw_counter = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+        # İsteğe bağlı LinkStats: abone başına teslim süresi
+        self.stats = None
+
+    def subscribe(self, callback, fields=None, messages=None, max_rate=None, system_id=None):
+        subscription = Subscription(callback, fields, messages, max_rate, system_id)
+        self.subscriptions.append(subscription)
+        self._update_raw_types()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        if subscription in self.subscriptions:
+            self.subscriptions.remove(subscription)
+            self._update_raw_types()
+
+    def _update_raw_types(self):
+        raw_types = set()
+        for subscription in self.subscriptions:
+            raw_types.update(subscription.raw_messages)
+        self._raw_types = frozenset(raw_types)
+
+    def wanted_messages(self):
+        """Abonelerin ihtiyaç duyduğu MAVLink mesaj tipleri"""
+        wanted = set(self._raw_types)
+        for subscription in self.subscriptions:
+            for family in subscription.families:
+                for msg_type, (index, _) in MESSAGE_FAMILIES.items():
+                    if FAMILIES[index] == family:
+                        wanted.add(msg_type)
+        return wanted
+
+    def notify(self, msg, record=None):
+        """Okuyucu thread'inden her mesaj için çağrılır"""
+        if record is None:
+            msg_type = msg.get_type()
+            if msg_type not in self._raw_types:
+                return
+            # Ham mesajlar için yalnızca en son örnek tutulur
+            with self._lock:
+                self._raw_counter += 1
+                self._raw[(msg.get_srcSystem(), msg_type)] = (self._raw_counter, msg)
+        self._dirty = True
+
+    def dispatch(self, now=None):
+        """Birikmiş değişiklikleri abonelere teslim et (GUI thread)"""
+        if not self._dirty or not self.subscriptions:
+            return 0
+        self._dirty = False
+
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            raw = dict(self._raw)
+
+        snapshots = {system_id: vehicle.snapshot()
+                     for system_id, vehicle in list(self.store.vehicles.items())}
+
+        delivered = 0
+        pending = False
+        for subscription in list(self.subscriptions):
+            if now - subscription.last_delivery < subscription.min_interval:
+                # Hız sınırı: değişiklikler bir sonraki uygun karede teslim edilir
+                pending = True
+                continue
+
+            if subscription.system_id is not None:
+                system_ids = [subscription.system_id] if subscription.system_id in snapshots else []
+            else:
+                system_ids = list(snapshots)
+
+            for system_id in system_ids:
+                changes = subscription._changed_records(system_id, snapshots[system_id])
+                changes.update(subscription._changed_messages(system_id, raw))
+                if changes:
+                    subscription.last_delivery = now
+                    if self.stats is not None:
+                        started = time.perf_counter()
+                        subscription.callback(system_id, changes)
+                        self.stats.record_dispatch(subscription.name, time.perf_counter() - started)
+                    else:
+                        subscription.callback(system_id, changes)
+                    delivered += 1
+
+        if pending:
+            self._dirty = True
+        return delivered
+
+
+class FrameDispatcher(QObject):
+    """TelemetryBus'ı GUI thread'inde sabit kare hızında çalıştırır"""
+    dispatched = pyqtSignal(int)  # teslim edilen güncelleme sayısı
+
+    def __init__(self, bus, fps=30, parent=None):
+        super().__init__(parent)
+        self.bus = bus
+        self.timer = QTimer(self)
+        self.timer.setInterval(int(1000 / fps))
+        self.timer.timeout.connect(self._on_frame)
+
+    def start(self):
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+
+    def _on_frame(self):
+        delivered = self.bus.dispatch()
+        if delivered:
+            self.dispatched.emit(delivered)
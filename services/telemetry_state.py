@@ -0,0 +1,326 @@
+from pymavlink import mavutil
+import time
+
+
+class TelemetryRecord:
+    """Tek bir MAVLink mesaj ailesinin değişmez kaydı.
+
+    Kayıtlar yayınlandıktan sonra değiştirilmez; yazıcı her mesajda yeni bir
+    kayıt oluşturup referansı tek adımda değiştirir. Böylece okuyucular kilit
+    kullanmadan yarım güncellenmiş (torn) veri görmez.
+    """
+    __slots__ = ('version', 'timestamp')
+
+    family = None
+    messages = ()
+    # alan adı -> (mesaj alanı, ölçek)
+    fields = {}
+
+    def __init__(self, version=0, timestamp=0.0, **values):
+        self.version = version
+        self.timestamp = timestamp
+        for name in self.fields:
+            setattr(self, name, values.get(name, 0))
+
+    @classmethod
+    def from_message(cls, msg, version, timestamp):
+        record = cls.__new__(cls)
+        record.version = version
+        record.timestamp = timestamp
+        for name, (attr, scale) in cls.fields.items():
+            value = getattr(msg, attr, 0)
+            setattr(record, name, value * scale if scale != 1 else value)
+        return record
+
+    def as_dict(self):
+        data = {name: getattr(self, name) for name in self.fields}
+        data['version'] = self.version
+        data['timestamp'] = self.timestamp
+        return data
+
+    def __repr__(self):
+        return f"{type(self).__name__}(version={self.version}, {self.as_dict()})"
+
+
+def _record(name, family, messages, fields):
+    return type(name, (TelemetryRecord,), {
+        '__slots__': tuple(fields),
+        'family': family,
+        'messages': tuple(messages),
+        'fields': fields,
+    })
+
+
+AttitudeRecord = _record('AttitudeRecord', 'attitude', ['ATTITUDE'], {
+    'roll': ('roll', 1),
+    'pitch': ('pitch', 1),
+    'yaw': ('yaw', 1),
+    'rollspeed': ('rollspeed', 1),
+    'pitchspeed': ('pitchspeed', 1),
+    'yawspeed': ('yawspeed', 1),
+})
+
+PositionRecord = _record('PositionRecord', 'position', ['GLOBAL_POSITION_INT'], {
+    'lat': ('lat', 1e-7),
+    'lon': ('lon', 1e-7),
+    'alt': ('alt', 1e-3),
+    'relative_alt': ('relative_alt', 1e-3),
+    'vx': ('vx', 1e-2),
+    'vy': ('vy', 1e-2),
+    'vz': ('vz', 1e-2),
+    'hdg': ('hdg', 1e-2),
+})
+
+VfrHudRecord = _record('VfrHudRecord', 'vfr_hud', ['VFR_HUD'], {
+    'airspeed': ('airspeed', 1),
+    'groundspeed': ('groundspeed', 1),
+    'heading': ('heading', 1),
+    'throttle': ('throttle', 1),
+    'alt': ('alt', 1),
+    'climb': ('climb', 1),
+})
+
+GpsRecord = _record('GpsRecord', 'gps', ['GPS_RAW_INT'], {
+    'fix_type': ('fix_type', 1),
+    'lat': ('lat', 1e-7),
+    'lon': ('lon', 1e-7),
+    'alt': ('alt', 1e-3),
+    'eph': ('eph', 1e-2),
+    'epv': ('epv', 1e-2),
+    'satellites_visible': ('satellites_visible', 1),
+})
+
+SysStatusRecord = _record('SysStatusRecord', 'sys_status', ['SYS_STATUS'], {
+    'voltage': ('voltage_battery', 1e-3),
+    'current': ('current_battery', 1e-2),
+    'battery_remaining': ('battery_remaining', 1),
+    'load': ('load', 1e-1),
+    'drop_rate_comm': ('drop_rate_comm', 1e-2),
+})
+
+BatteryRecord = _record('BatteryRecord', 'battery', ['BATTERY_STATUS'], {
+    'battery_id': ('id', 1),
+    'temperature': ('temperature', 1e-2),
+    'current': ('current_battery', 1e-2),
+    'current_consumed': ('current_consumed', 1),
+    'energy_consumed': ('energy_consumed', 1e2),
+    'battery_remaining': ('battery_remaining', 1),
+})
+
+IMU_FIELDS = ('xacc', 'yacc', 'zacc', 'xgyro', 'ygyro', 'zgyro', 'xmag', 'ymag', 'zmag')
+GRAVITY = 9.80665
+
+
+class ImuRecord(TelemetryRecord):
+    """Ölçekli IMU: ivme m/s², açısal hız rad/s, manyetik alan gauss"""
+    __slots__ = IMU_FIELDS + ('source',)
+
+    family = 'imu'
+    messages = ('SCALED_IMU', 'HIGHRES_IMU')
+    fields = dict({name: (name, 1) for name in IMU_FIELDS}, source=(None, None))
+    # Mesaj tipi -> (ivme, jiroskop, manyetometre) ölçekleri; SCALED_IMU mG, mrad/s, mgauss
+    scales = {
+        'SCALED_IMU': (GRAVITY * 1e-3, 1e-3, 1e-3),
+        'HIGHRES_IMU': (1.0, 1.0, 1.0),
+    }
+
+    def __init__(self, version=0, timestamp=0.0, **values):
+        values.setdefault('source', None)
+        super().__init__(version, timestamp, **values)
+
+    @classmethod
+    def from_message(cls, msg, version, timestamp):
+        record = cls.__new__(cls)
+        record.version = version
+        record.timestamp = timestamp
+        record.source = msg.get_type()
+        acc, gyro, mag = cls.scales[record.source]
+        for name in IMU_FIELDS:
+            scale = acc if name.endswith('acc') else gyro if name.endswith('gyro') else mag
+            setattr(record, name, getattr(msg, name, 0) * scale)
+        return record
+
+
+# RAW_IMU ham ADC sayımlarıdır (birim sensöre bağlı); SI alanlarına karıştırılmaz
+RawImuRecord = _record('RawImuRecord', 'raw_imu', ['RAW_IMU'],
+                       {name: (name, 1) for name in IMU_FIELDS})
+
+VibrationRecord = _record('VibrationRecord', 'vibration', ['VIBRATION'], {
+    'vibration_x': ('vibration_x', 1),
+    'vibration_y': ('vibration_y', 1),
+    'vibration_z': ('vibration_z', 1),
+    'clipping_0': ('clipping_0', 1),
+    'clipping_1': ('clipping_1', 1),
+    'clipping_2': ('clipping_2', 1),
+})
+
+RcChannelsRecord = _record('RcChannelsRecord', 'rc_channels', ['RC_CHANNELS'], dict(
+    [('chancount', ('chancount', 1)), ('rssi', ('rssi', 1))] +
+    [(f'chan{i}', (f'chan{i}_raw', 1)) for i in range(1, 19)]
+))
+
+ServoOutputRecord = _record('ServoOutputRecord', 'servo_output', ['SERVO_OUTPUT_RAW'], dict(
+    (f'servo{i}', (f'servo{i}_raw', 1)) for i in range(1, 17)
+))
+
+
+class HeartbeatRecord(TelemetryRecord):
+    __slots__ = ('type', 'autopilot', 'base_mode', 'custom_mode',
+                 'system_status', 'mode', 'armed')
+
+    family = 'heartbeat'
+    messages = ('HEARTBEAT',)
+    fields = {
+        'type': ('type', 1),
+        'autopilot': ('autopilot', 1),
+        'base_mode': ('base_mode', 1),
+        'custom_mode': ('custom_mode', 1),
+        'system_status': ('system_status', 1),
+        'mode': (None, None),
+        'armed': (None, None),
+    }
+
+    def __init__(self, version=0, timestamp=0.0, **values):
+        values.setdefault('mode', 'UNKNOWN')
+        values.setdefault('armed', False)
+        super().__init__(version, timestamp, **values)
+
+    @classmethod
+    def from_message(cls, msg, version, timestamp):
+        record = cls.__new__(cls)
+        record.version = version
+        record.timestamp = timestamp
+        record.type = msg.type
+        record.autopilot = msg.autopilot
+        record.base_mode = msg.base_mode
+        record.custom_mode = msg.custom_mode
+        record.system_status = msg.system_status
+        record.mode = mavutil.mode_string_v10(msg)
+        record.armed = bool(msg.base_mode & mavutil.mavlink.MAV_MODE_FLAG_SAFETY_ARMED)
+        return record
+
+
+RECORD_TYPES = (
+    HeartbeatRecord,
+    AttitudeRecord,
+    PositionRecord,
+    VfrHudRecord,
+    GpsRecord,
+    SysStatusRecord,
+    BatteryRecord,
+    ImuRecord,
+    RawImuRecord,
+    VibrationRecord,
+    RcChannelsRecord,
+    ServoOutputRecord,
+)
+
+FAMILIES = tuple(record_type.family for record_type in RECORD_TYPES)
+FAMILY_INDEX = {family: i for i, family in enumerate(FAMILIES)}
+
+# Mesaj tipi -> (aile indeksi, kayıt sınıfı)
+MESSAGE_FAMILIES = {}
+for _index, _record_type in enumerate(RECORD_TYPES):
+    for _message in _record_type.messages:
+        MESSAGE_FAMILIES[_message] = (_index, _record_type)
+
+
+class StateSnapshot:
+    """Bir aracın tüm kayıtlarının tutarlı anlık görüntüsü"""
+    __slots__ = ('system_id', '_records')
+
+    def __init__(self, system_id, records):
+        self.system_id = system_id
+        self._records = records
+
+    def __getitem__(self, family):
+        return self._records[FAMILY_INDEX[family]]
+
+    def __getattr__(self, family):
+        try:
+            return self._records[FAMILY_INDEX[family]]
+        except KeyError:
+            raise AttributeError(family) from None
+
+    def version(self, family):
+        return self[family].version
+
+    def as_dict(self):
+        return {family: record.as_dict() for family, record in zip(FAMILIES, self._records)}
+
+
+class VehicleState:
+    """Tek bir aracın (sysid) telemetri kayıtları.
+
+    Yalnızca okuyucu thread'i yazar. Her güncellemede yeni bir kayıt
+    listedeki tek bir referansın yerine konur; snapshot() bu listenin
+    sabit boyutlu bir kopyasını alır.
+    """
+
+    def __init__(self, system_id):
+        self.system_id = system_id
+        self._records = [record_type() for record_type in RECORD_TYPES]
+
+    def update(self, msg, timestamp=None):
+        entry = MESSAGE_FAMILIES.get(msg.get_type())
+        if entry is None:
+            return None
+
+        index, record_type = entry
+        if timestamp is None:
+            timestamp = time.time()
+        record = record_type.from_message(msg, self._records[index].version + 1, timestamp)
+        self._records[index] = record
+        return record
+
+    def get(self, family):
+        return self._records[FAMILY_INDEX[family]]
+
+    def snapshot(self):
+        return StateSnapshot(self.system_id, tuple(self._records))
+
+
+class TelemetryStore:
+    """Araç başına telemetri durumunu tutan depo"""
+
+    def __init__(self):
+        self.vehicles = {}
+        self.primary_system = None
+
+    def update(self, msg, timestamp=None):
+        system_id = msg.get_srcSystem()
+        vehicle = self.vehicles.get(system_id)
+        if vehicle is None:
+            vehicle = self.vehicles[system_id] = VehicleState(system_id)
+
+        record = vehicle.update(msg, timestamp)
+
+        # İlk heartbeat gönderen araç (GCS hariç) birincil araç olarak seçilir
+        if (self.primary_system is None and isinstance(record, HeartbeatRecord)
+                and record.type != mavutil.mavlink.MAV_TYPE_GCS):
+            self.primary_system = system_id
+        return record
+
+    def vehicle(self, system_id=None):
+        if system_id is None:
+            system_id = self.primary_system
+        return self.vehicles.get(system_id)
+
+    def snapshot(self, system_id=None):
+        vehicle = self.vehicle(system_id)
+        if vehicle is None:
+            return StateSnapshot(system_id, tuple(record_type() for record_type in RECORD_TYPES))
+        return vehicle.snapshot()
+
+    def legacy_data(self, system_id=None):
+        """Eski vehicle_data sözlüğü biçiminde özet"""
+        snapshot = self.snapshot(system_id)
+        return {
+            'altitude': snapshot.position.relative_alt,
+            'groundspeed': snapshot.vfr_hud.groundspeed,
+            'mode': snapshot.heartbeat.mode,
+            'gps_fix': snapshot.gps.fix_type,
+            'pitch': snapshot.attitude.pitch,
+            'roll': snapshot.attitude.roll,
+            'heading': snapshot.vfr_hud.heading
+        }
@@ -1,30 +1,56 @@
 from services.mavlink_handler import MAVLinkHandler
+from utils.columnar_log import ColumnarLogWriter, load_logging_settings
 from datetime import datetime
 import json
 import os
 
 class TelemetrySystem:
-    def __init__(self):
+    def __init__(self, log_format=None):
         self.mavlink = MAVLinkHandler()
         self.logging_enabled = False
         self.log_file = None
-        
+        self.log_writer = None
+
+        settings = load_logging_settings()
+        # 'json': satır başına JSON (varsayılan); 'binary': sütunlu, arka planda
+        # yazılan log. Verilmezse settings.json'daki logging.log_format kullanılır.
+        self.log_format = log_format or settings.get('log_format', 'json')
+        self.log_directory = settings.get('log_directory', 'logs/')
+        self.max_log_files = settings.get('max_log_files', 100)
+
     def start_logging(self):
         if not self.logging_enabled:
-            timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-            self.log_file = open(f'logs/telemetry_{timestamp}.json', 'w')
+            if self.log_format == 'binary':
+                self.log_writer = ColumnarLogWriter(
+                    log_dir=self.log_directory,
+                    max_log_files=self.max_log_files
+                )
+                self.log_writer.start()
+            else:
+                os.makedirs(self.log_directory, exist_ok=True)
+                timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+                self.log_file = open(os.path.join(self.log_directory, f'telemetry_{timestamp}.json'), 'w')
             self.logging_enabled = True
-            
+
     def stop_logging(self):
-        if self.logging_enabled and self.log_file:
-            self.log_file.close()
+        if self.logging_enabled:
+            if self.log_writer:
+                self.log_writer.stop()
+                self.log_writer = None
+            if self.log_file:
+                self.log_file.close()
+                self.log_file = None
             self.logging_enabled = False
-            
+
     def log_data(self, data):
-        if self.logging_enabled and self.log_file:
+        if not self.logging_enabled:
+            return
+        if self.log_writer:
+            self.log_writer.append(data)
+        elif self.log_file:
             timestamp = datetime.utcnow().isoformat()
             log_entry = {
                 'timestamp': timestamp,
                 'data': data
             }
-            self.log_file.write(json.dumps(log_entry) + '\n')
\ No newline at end of file
+            self.log_file.write(json.dumps(log_entry) + '\n')
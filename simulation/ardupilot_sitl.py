@@ -8,6 +8,7 @@ class ArdupilotSITL(QObject):
     state_updated = pyqtSignal(dict)
     connection_status = pyqtSignal(bool, str)
     log_message = pyqtSignal(str)
+    instance_stopped = pyqtSignal(int)  # vehicle_id
 
     def __init__(self):
         super().__init__()
@@ -121,6 +122,7 @@ class ArdupilotSITL(QObject):
             if process.state() == QProcess.ProcessState.Running:
                 process.kill()
             del self.processes[vehicle_id]
+            self.instance_stopped.emit(vehicle_id)
             self.connection_status.emit(False, f"Vehicle {vehicle_id} durduruldu")
 
     def stop_all(self):
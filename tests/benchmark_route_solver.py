@@ -0,0 +1,43 @@
+"""50/500/5000 noktalı rastgele görevlerde solve_route karşılaştırması.
+
+Depo kökünden: python tests/benchmark_route_solver.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mission.route_solver import EnergyCostModel, TimeCostModel, route_cost, solve_route
+
+SIZES = (50, 500, 5000)
+TIME_LIMITS = (0.5, 2.0, 10.0)
+
+
+def main():
+    rng = np.random.default_rng(1)
+    print(f"{'nokta':>6} {'model':>7} {'sınır':>6} {'tavlama':>8} {'süre':>7} {'maliyet':>14} {'girdi sırası':>14}")
+    for n in SIZES:
+        # Nokta yoğunluğu sabit kalsın diye alan nokta sayısıyla büyür
+        span = 0.02 * (n / 50) ** 0.5
+        lats = 39.9 + rng.random(n) * span
+        lons = 32.8 + rng.random(n) * span
+        alts = rng.uniform(20, 120, n)
+        for model in (TimeCostModel(), EnergyCostModel()):
+            name = 'süre' if isinstance(model, TimeCostModel) else 'enerji'
+            identity = route_cost(model, lats, lons, alts, np.arange(n))
+            for time_limit in TIME_LIMITS:
+                for anneal in (False, True):
+                    started = time.monotonic()
+                    order = solve_route(model, lats, lons, alts, time_limit=time_limit,
+                                        anneal=anneal, seed=0)
+                    elapsed = time.monotonic() - started
+                    cost = route_cost(model, lats, lons, alts, order)
+                    print(f"{n:>6} {name:>7} {time_limit:>6.1f} {str(anneal):>8} {elapsed:>7.2f} "
+                          f"{cost:>14.1f} {identity:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Modüller depo kökünden mutlak içe aktarılır (from mission.x import Y)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Arayüz testleri ekran olmadan çalışır
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
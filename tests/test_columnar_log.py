@@ -0,0 +1,33 @@
+import json
+
+from utils.columnar_log import ColumnarLogWriter, load_columnar_log
+
+
+def _write(tmp_path, samples):
+    writer = ColumnarLogWriter(log_dir=str(tmp_path), chunk_size=8, compress=False)
+    writer.start()
+    for timestamp, data in enumerate(samples):
+        writer.append(data, timestamp=float(timestamp))
+    writer.stop()
+    return writer, load_columnar_log(writer.current_file)
+
+
+def test_long_strings_and_type_changes_are_kept(tmp_path):
+    long_text = 'uzun durum metni ' * 10
+    mission = {'waypoints': list(range(40))}
+    writer, segments = _write(tmp_path, [
+        {'mode': 'GUIDED', 'armed': True, 'alt': 10.0, 'mission': {'count': 0}},
+        {'mode': long_text, 'armed': False, 'alt': 12.5, 'mission': mission},
+        {'mode': 'AUTO', 'armed': 1.5, 'alt': 'bilinmiyor', 'mission': None},
+    ])
+
+    assert writer.dropped == 0
+    rows = [row for segment in segments for row in segment]
+    assert [row['timestamp'] for row in rows] == [0.0, 1.0, 2.0]
+    assert rows[1]['mode'].decode('utf-8') == long_text
+    assert json.loads(rows[1]['mission']) == mission
+    assert rows[2]['mode'] == b'AUTO'
+    # Bool sütununa sayı, sayısal sütuna metin gelince sütun türü genişler
+    assert rows[2]['armed'] == 1.5
+    assert rows[2]['alt'] == b'bilinmiyor'
+    assert segments[-1].dtype['alt'].kind == 'S'
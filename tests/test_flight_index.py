@@ -0,0 +1,16 @@
+from analysis.flight_index import flight_record
+
+
+def summary(sensor_health):
+    return {'file': 'flight.bin', 'vehicle': {'started_at': '2026-01-01 10:00:00'},
+            'analyses': {'sensor_health': sensor_health}}
+
+
+def test_clipping_is_vibe_clip_increment():
+    record = flight_record(summary({'clipping': 1500, 'vibe': {'clips': 12}, 'vibe_clips': 12}))
+    assert record['clipping'] == 12
+
+
+def test_clipping_is_null_without_vibe():
+    assert flight_record(summary({'clipping': 1500}))['clipping'] is None
+    assert flight_record(summary({}))['clipping'] is None
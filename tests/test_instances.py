@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from analysis.flight_analysis import analyze_battery, analyze_sensor_health
+from analysis.text_log import parse_text_log
+from analysis.vibration import vibe_summary
+
+
+def interleave(dtype, instances):
+    # Örnekler DataFlash'taki gibi aynı akışta sırayla karışık
+    rows = np.concatenate(instances)
+    return rows[np.argsort(rows['timestamp'], kind='stable')].astype(dtype)
+
+
+def imu_stream(rate=1000.0, seconds=4.0):
+    dtype = [('timestamp', 'f8'), ('I', 'u1')] + [(f'{kind}_{axis}', 'f8')
+                                                   for kind in ('acc', 'gyr') for axis in 'xyz']
+    t = np.arange(int(rate * seconds)) / rate
+    instances = []
+    for instance, freq in ((0, 80.0), (1, 210.0)):
+        rows = np.zeros(len(t), dtype=dtype)
+        rows['timestamp'] = t + instance * 1e-4
+        rows['I'] = instance
+        rows['acc_z'] = -9.8 + 3 * np.sin(2 * np.pi * freq * t)
+        instances.append(rows)
+    return interleave(dtype, instances)
+
+
+def test_vibration_uses_first_imu():
+    results = analyze_sensor_health({'IMU': imu_stream()})
+    assert results['imu_sample_rate'] == pytest.approx(1000.0, rel=1e-3)
+    assert results['dominant_frequencies']['z'][0] == pytest.approx(80.0, abs=2.0)
+
+
+def test_battery_uses_first_instance():
+    dtype = [('timestamp', 'f8'), ('Inst', 'u1'), ('voltage', 'f8'), ('current', 'f8')]
+    t = np.arange(100.0)
+    first = np.zeros(100, dtype=dtype)
+    first['timestamp'], first['voltage'], first['current'] = t, 16.0, 10.0
+    second = np.zeros(100, dtype=dtype)
+    second['timestamp'], second['Inst'], second['voltage'], second['current'] = t + 0.5, 1, 5.0, 1.0
+    results = analyze_battery({'BATTERY': interleave(dtype, [first, second])})
+    assert results['min_voltage'] == 16.0
+    assert results['energy_wh'] == pytest.approx(16.0 * 10.0 * 99 / 3600)
+
+
+def test_vibe_clips_are_summed_per_imu():
+    dtype = [('timestamp', 'f8'), ('IMU', 'u1'), ('VibeX', 'f8'), ('VibeY', 'f8'),
+             ('VibeZ', 'f8'), ('Clip', 'f8')]
+    vibe = np.zeros(4, dtype=dtype)
+    vibe['timestamp'] = [0, 0, 1, 1]
+    vibe['IMU'] = [0, 1, 0, 1]
+    vibe['VibeX'] = [1, 50, 2, 60]
+    vibe['Clip'] = [0, 3, 2, 7]
+    summary = vibe_summary(vibe)
+    assert summary['max_x'] == 2
+    # Sayaç artışları: IMU0 0->2, IMU1 3->7
+    assert summary['clips'] == 6
+
+
+def test_text_log_instances(tmp_path):
+    path = tmp_path / 'flight.log'
+    path.write_text('IMU[0],0.0,1,2,3,4,5,6\n'
+                    'IMU[1],0.0,9,9,9,9,9,9\n'
+                    'IMU[0],0.01,1,2,3,4,5,6\n'
+                    'IMU,0.02,1,2,3,4,5,6\n'
+                    'GPS,0.5,39.9,32.8,100,1\n')
+    data = parse_text_log(str(path))
+    imu = data['IMU']
+    assert list(imu['I']) == [0, 1, 0, 0]
+    assert list(imu['timestamp']) == [0.0, 0.0, 0.01, 0.02]
+    assert 'IMU[1]' not in data
+    assert 'I' not in data['GPS'].dtype.names
@@ -0,0 +1,47 @@
+import socket
+import time
+
+import pytest
+
+QtWidgets = pytest.importorskip('PyQt6.QtWidgets')
+mavlink2 = pytest.importorskip('pymavlink.dialects.v20.ardupilotmega')
+
+from services.mavlink_handler import MAVLinkHandler
+from widgets.link_stats_panel import LinkStatsPanel
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def test_default_path_records_decode_time_and_panel_lists_links(app):
+    handler = MAVLinkHandler()
+    first, second = free_port(), free_port()
+    assert handler.connect(f'udpin:127.0.0.1:{first}')
+    mav = mavlink2.MAVLink(None, srcSystem=1)
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender:
+            deadline = time.monotonic() + 3
+            while time.monotonic() < deadline and 'HEARTBEAT' not in handler.links[0].stats.decode:
+                sender.sendto(mav.heartbeat_encode(2, 3, 0, 0, 4).pack(mav), ('127.0.0.1', first))
+                time.sleep(0.05)
+        # Tek bağlantıda seçici çözme kapalı: recv_match yolu
+        assert handler.deduplicator is None
+        stats = handler.link_stats()
+        assert 'decode' in stats['types']['HEARTBEAT']
+
+        assert handler.add_link(f'udpin:127.0.0.1:{second}')
+
+        panel = LinkStatsPanel([handler])
+        panel.refresh()
+        names = {panel.link_table.item(row, 0).text() for row in range(panel.link_table.rowCount())}
+        assert names == {link.name for link in handler.links}
+    finally:
+        handler.disconnect()
@@ -0,0 +1,30 @@
+import pytest
+
+mavlink2 = pytest.importorskip('pymavlink.dialects.v20.ardupilotmega')
+
+from analysis.live_analytics import FlightStatistics
+from services.telemetry_state import VehicleState
+
+mav = mavlink2.MAVLink(None, srcSystem=1)
+
+
+def test_keys_match_offline_meanings():
+    state = VehicleState(1)
+    stats = FlightStatistics()
+    # Açılıştan beri birikmiş kırpılmalar bu uçuşa sayılmaz
+    for timestamp, levels, clips in ((0.0, (10, 20, 30), (100, 5, 0)),
+                                     (1.0, (30, 10, 20), (103, 5, 1))):
+        stats.update(state.update(mav.vibration_encode(0, *levels, *clips), timestamp))
+    for timestamp, alt, relative_alt in ((0.0, 500000, 0), (2.0, 620000, 120000)):
+        msg = mav.global_position_int_encode(0, 0, 0, alt, relative_alt, 0, 0, 0, 0)
+        stats.update(state.update(msg, timestamp))
+
+    results = stats.results()
+    assert results['vibe_clips'] == 4
+    assert results['vibe'] == pytest.approx({'max_x': 30, 'mean_x': 20, 'max_y': 20, 'mean_y': 15,
+                                             'max_z': 30, 'mean_z': 25, 'clips': 4})
+    assert results['vibe_max'] == 30
+    assert results['max_altitude'] == pytest.approx(620)
+    assert results['max_relative_alt'] == pytest.approx(120)
+    assert results['flight_time'] == 2.0
+    assert 'vibration_level' not in results
@@ -0,0 +1,74 @@
+from collections import Counter
+
+import pytest
+
+mavlink2 = pytest.importorskip('pymavlink.dialects.v20.ardupilotmega')
+
+from services.mavlink_filter import SelectiveParser
+
+
+def stream(count=100):
+    mav = mavlink2.MAVLink(None, srcSystem=1)
+    frames = []
+    for i in range(count):
+        frames.append(mav.heartbeat_encode(2, 3, 0, 0, 4).pack(mav))
+        frames.append(mav.attitude_encode(i, 0.1, 0.2, 0.3, 0, 0, 0).pack(mav))
+        frames.append(mav.sys_status_encode(0, 0, 0, 500, 12000, 100, 50, 0, 0, 0, 0, 0, 0).pack(mav))
+    return frames
+
+
+def parse(data, wanted, chunk=50):
+    parser = SelectiveParser(wanted)
+    messages = []
+    for i in range(0, len(data), chunk):
+        messages += parser.parse_buffer(data[i:i + chunk])
+    return Counter(msg.get_type() for msg in messages), parser
+
+
+@pytest.mark.parametrize('wanted', [None, ['ATTITUDE']])
+def test_stray_magic_bytes_do_not_lose_frames(wanted):
+    frames = stream()
+    frames[10] = b'\xfd' + frames[10]
+    frames[50] = b'\xfe\x30' + frames[50]
+    frames[200] = b'\xfd\x05\x00' + frames[200]
+    counts, parser = parse(b''.join(frames), wanted)
+
+    expected = {'HEARTBEAT': 100, 'ATTITUDE': 100, 'SYS_STATUS': 100}
+    if wanted is not None:
+        expected = {'ATTITUDE': 100}
+    assert counts == expected
+    assert parser.resyncs == 3
+    if wanted is not None:
+        # Bozuk baytlar atlanan çerçeve sayılmaz
+        assert parser.skipped == 200
+
+
+def test_corrupted_frame_is_dropped_by_crc():
+    frames = stream(10)
+    corrupted = bytearray(frames[4])
+    corrupted[12] ^= 0xFF
+    frames[4] = bytes(corrupted)
+    counts, parser = parse(b''.join(frames), None)
+    assert counts['ATTITUDE'] == 9
+    assert counts['HEARTBEAT'] == 10 and counts['SYS_STATUS'] == 10
+    assert not any(name.startswith('UNKNOWN') for name in counts)
+
+
+def test_corrupted_length_in_tail_frame_is_rejected():
+    frames = stream(2)
+    # Datagramın son çerçevesi (atlanan tip): uzunluk baytı küçültülüp
+    # çerçeve tam tamponun sonunda bitecek şekilde kesilmiş
+    tail = bytearray(frames[2])
+    tail[1] -= 3
+    datagram = frames[0] + frames[1] + bytes(tail[:-3])
+
+    parser = SelectiveParser(['ATTITUDE'])
+    messages = parser.parse_buffer(datagram)
+    assert [msg.get_type() for msg in messages] == ['ATTITUDE']
+    assert parser.skipped == 1
+    assert parser.resyncs >= 1
+
+    # Sonraki datagram kayıpsız çözülür
+    messages = parser.parse_buffer(b''.join(frames[3:]))
+    assert [msg.get_type() for msg in messages] == ['ATTITUDE']
+    assert parser.skipped == 3
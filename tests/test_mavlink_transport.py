@@ -0,0 +1,100 @@
+import os
+import socket
+import time
+
+import pytest
+
+mavlink2 = pytest.importorskip('pymavlink.dialects.v20.ardupilotmega')
+pytest.importorskip('serial')
+
+from services import mavlink_transport
+from services.mavlink_transport import MAVLinkTransport
+
+
+@pytest.mark.skipif(not hasattr(os, 'openpty'), reason='pty gerekli')
+@pytest.mark.parametrize('selectable', [True, False])
+def test_serial_link_reads_frames(monkeypatch, selectable):
+    # False: Windows'taki okuyucu thread yolu
+    monkeypatch.setattr(mavlink_transport, 'SERIAL_SELECTABLE', selectable)
+    master, slave = os.openpty()
+    received = []
+    transport = MAVLinkTransport()
+    try:
+        link = transport.open_link(f"{os.ttyname(slave)},115200", received.append)
+        mav = mavlink2.MAVLink(None, srcSystem=1)
+        frame = mav.heartbeat_encode(2, 3, 0, 0, 4).pack(mav)
+        deadline = time.monotonic() + 2
+        while not received and time.monotonic() < deadline:
+            os.write(master, frame)
+            time.sleep(0.05)
+        assert received and received[0].get_type() == 'HEARTBEAT'
+        assert (link._serial_thread is None) == selectable
+
+        thread = link._serial_thread
+        link.close()
+        assert link._serial is None or not link._serial.is_open
+        assert thread is None or not thread.is_alive()
+    finally:
+        transport.stop()
+        os.close(master)
+        os.close(slave)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def test_open_failures_are_raised():
+    transport = MAVLinkTransport(connect_timeout=0.3, retry_interval=0.05)
+    try:
+        with pytest.raises(ValueError):
+            transport.open_link('tcpin:127.0.0.1:5760', print)
+        with pytest.raises(ConnectionError):
+            transport.open_link(f'tcp:127.0.0.1:{free_port()}', print)
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as taken:
+            taken.bind(('127.0.0.1', 0))
+            with pytest.raises(OSError):
+                transport.open_link(f'udpin:127.0.0.1:{taken.getsockname()[1]}', print)
+        assert transport.links == []
+    finally:
+        transport.stop()
+
+
+def test_handler_reports_failed_connect():
+    from services.mavlink_handler import MAVLinkHandler
+    transport = MAVLinkTransport(connect_timeout=0.3)
+    try:
+        assert not MAVLinkHandler(transport).connect(f'tcp:127.0.0.1:{free_port()}')
+    finally:
+        transport.stop()
+
+
+def test_tcp_reconnects_and_bounds_queue():
+    server = socket.socket()
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.bind(('127.0.0.1', 0))
+    server.listen()
+    port = server.getsockname()[1]
+    received = []
+    transport = MAVLinkTransport(queue_size=4, retry_interval=0.05)
+    try:
+        link = transport.open_link(f'tcp:127.0.0.1:{port}', received.append)
+        assert link.queue.maxsize == 4
+        peer, _ = server.accept()
+        peer.close()
+
+        # Kopan bağlantı yeniden kurulur ve veri akmaya devam eder
+        server.settimeout(2)
+        peer, _ = server.accept()
+        mav = mavlink2.MAVLink(None, srcSystem=1)
+        deadline = time.monotonic() + 2
+        while not received and time.monotonic() < deadline:
+            peer.sendall(mav.heartbeat_encode(2, 3, 0, 0, 4).pack(mav))
+            time.sleep(0.05)
+        assert received
+        peer.close()
+    finally:
+        transport.stop()
+        server.close()
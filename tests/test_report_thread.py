@@ -0,0 +1,40 @@
+import gc
+import time
+
+import pytest
+
+QtWidgets = pytest.importorskip('PyQt6.QtWidgets')
+
+from services.report_thread import ReportThread
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def slow_writer(file_path, progress=None, delay=0.2):
+    for percent in (0, 50, 100):
+        progress(percent, file_path)
+        time.sleep(delay / 3)
+
+
+def test_dropped_threads_run_to_completion(app):
+    results = []
+    progress = QtWidgets.QProgressDialog()
+    for name in ('a', 'b'):
+        thread = ReportThread(slow_writer, name)
+        thread.progress_updated.connect(progress.setValue)
+        thread.completed.connect(progress.close)
+        thread.completed.connect(lambda success, message: results.append((success, message)))
+        thread.start()
+    # Çağıran referansı bıraktı (rapor üst üste başlatıldı)
+    del thread
+    gc.collect()
+
+    deadline = time.monotonic() + 5
+    while (len(results) < 2 or ReportThread._running) and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    assert sorted(results) == [(True, 'a'), (True, 'b')]
+    assert not ReportThread._running
@@ -0,0 +1,66 @@
+import itertools
+import time
+
+import numpy as np
+import pytest
+
+from mission.route_solver import EnergyCostModel, TimeCostModel, route_cost, solve_route
+
+
+def random_mission(n, seed=1, span=0.02):
+    rng = np.random.default_rng(seed)
+    return (39.9 + rng.random(n) * span, 32.8 + rng.random(n) * span, rng.uniform(20, 120, n))
+
+
+def directed_cost(model, lats, lons, alts, order):
+    # Yöne bağlı maliyetin doğrudan hesabı (tırmanma/alçalma ayrı güçle)
+    from mission.route_optimization import haversine_matrix
+    horizontal = haversine_matrix(lats, lons)
+    total = 0.0
+    for a, b in zip(order[:-1], order[1:]):
+        climb = alts[b] - alts[a]
+        if isinstance(model, EnergyCostModel):
+            power = model.climb_power if climb > 0 else model.descent_power
+            total += (model.base_power * horizontal[a, b] / model.horizontal_speed
+                      + power * abs(climb) / model.vertical_speed)
+        else:
+            total += horizontal[a, b] / model.horizontal_speed + abs(climb) / model.vertical_speed
+    return total
+
+
+@pytest.mark.parametrize('model', [TimeCostModel(), EnergyCostModel()])
+def test_route_cost_matches_directed_cost(model):
+    lats, lons, alts = random_mission(12)
+    order = np.random.default_rng(0).permutation(12)
+    assert route_cost(model, lats, lons, alts, order) == pytest.approx(
+        directed_cost(model, lats, lons, alts, order))
+
+
+@pytest.mark.parametrize('model', [TimeCostModel(), EnergyCostModel()])
+def test_small_mission_is_optimal(model):
+    lats, lons, alts = random_mission(8)
+    best = min(directed_cost(model, lats, lons, alts, (0,) + rest)
+               for rest in itertools.permutations(range(1, 8)))
+    order = solve_route(model, lats, lons, alts, time_limit=0.3, seed=0)
+    assert order[0] == 0
+    assert route_cost(model, lats, lons, alts, order) == pytest.approx(best)
+
+
+def test_fixed_end():
+    lats, lons, alts = random_mission(30)
+    order = solve_route(TimeCostModel(), lats, lons, alts, start=3, end=7, time_limit=0.2, seed=0)
+    assert order[0] == 3 and order[-1] == 7
+    assert sorted(order) == list(range(30))
+
+
+@pytest.mark.parametrize('n, time_limit', [(500, 0.2), (5000, 0.5)])
+def test_time_limit_is_respected(n, time_limit):
+    lats, lons, alts = random_mission(n, span=0.2)
+    started = time.monotonic()
+    order = solve_route(EnergyCostModel(), lats, lons, alts, time_limit=time_limit, seed=0)
+    elapsed = time.monotonic() - started
+    assert sorted(order) == list(range(n))
+    # Komşu listeleri (KD-ağacı) bütçe dışıdır; küçük bir pay bırakılır
+    assert elapsed < time_limit + 0.2
+    assert route_cost(EnergyCostModel(), lats, lons, alts, order) < \
+        route_cost(EnergyCostModel(), lats, lons, alts, np.arange(n))
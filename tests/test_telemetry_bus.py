@@ -0,0 +1,35 @@
+import time
+
+import pytest
+
+QtWidgets = pytest.importorskip('PyQt6.QtWidgets')
+mavlink2 = pytest.importorskip('pymavlink.dialects.v20.ardupilotmega')
+
+from services.mavlink_handler import MAVLinkHandler
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def test_subscription_fires(app):
+    mav = mavlink2.MAVLink(None, srcSystem=1)
+    handler = MAVLinkHandler()
+    received = []
+    subscription = handler.subscribe(lambda system_id, changes: received.append((system_id, changes)),
+                                     messages=['ATTITUDE'])
+
+    handler.feed_bytes(mav.attitude_encode(0, 0.1, 0.2, 0.3, 0, 0, 0).pack(mav))
+    deadline = time.monotonic() + 2
+    while not received and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+
+    assert received
+    system_id, changes = received[0]
+    assert system_id == 1
+    assert len(changes) == 1
+
+    handler.unsubscribe(subscription)
+    assert not handler.dispatcher.timer.isActive()
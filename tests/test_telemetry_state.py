@@ -0,0 +1,34 @@
+import pytest
+
+mavlink2 = pytest.importorskip('pymavlink.dialects.v20.ardupilotmega')
+
+from services.telemetry_state import GRAVITY, VehicleState
+
+mav = mavlink2.MAVLink(None, srcSystem=1)
+
+
+def test_scaled_imu_is_converted_to_si():
+    state = VehicleState(1)
+    state.update(mav.scaled_imu_encode(0, 1000, 0, -500, 250, 0, 0, 400, 0, 0))
+    imu = state.get('imu')
+    assert imu.source == 'SCALED_IMU'
+    assert imu.xacc == pytest.approx(GRAVITY)
+    assert imu.zacc == pytest.approx(-GRAVITY / 2)
+    assert imu.xgyro == pytest.approx(0.25)
+    assert imu.xmag == pytest.approx(0.4)
+
+
+def test_highres_imu_is_kept_in_si():
+    state = VehicleState(1)
+    state.update(mav.highres_imu_encode(0, 0.5, 0, -9.8, 0.1, 0, 0, 0.3, 0, 0, 0, 0, 0, 0, 0))
+    imu = state.get('imu')
+    assert imu.source == 'HIGHRES_IMU'
+    assert (imu.xacc, imu.zacc, imu.xgyro, imu.xmag) == pytest.approx((0.5, -9.8, 0.1, 0.3))
+
+
+def test_raw_imu_stays_out_of_si_fields():
+    state = VehicleState(1)
+    state.update(mav.raw_imu_encode(0, 2048, 0, 0, 0, 0, 0, 0, 0, 0))
+    assert state.get('raw_imu').xacc == 2048
+    assert state.get('imu').version == 0
+    assert state.get('imu').source is None
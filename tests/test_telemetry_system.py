@@ -0,0 +1,20 @@
+import json
+
+import pytest
+
+pytest.importorskip('pymavlink')
+
+from services.telemetry_system import TelemetrySystem
+
+
+def test_default_log_format_is_json(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert TelemetrySystem().log_format == 'json'
+
+
+def test_log_format_from_settings(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'config').mkdir()
+    (tmp_path / 'config' / 'settings.json').write_text(json.dumps({'logging': {'log_format': 'binary'}}))
+    assert TelemetrySystem().log_format == 'binary'
+    assert TelemetrySystem(log_format='json').log_format == 'json'
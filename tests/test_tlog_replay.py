@@ -0,0 +1,71 @@
+import pytest
+
+mavlink2 = pytest.importorskip('pymavlink.dialects.v20.ardupilotmega')
+
+from services.mavlink_handler import MAVLinkHandler
+from services.mavlink_recorder import TlogRecorder, iter_tlog
+
+
+def write_tlog(path, count=50):
+    mav = mavlink2.MAVLink(None, srcSystem=1)
+    recorder = TlogRecorder(str(path))
+    for i in range(count):
+        recorder.write_frame(mav.heartbeat_encode(2, 3, 0, 0, 4).pack(mav), 1000.0 + i)
+        recorder.write_frame(mav.attitude_encode(i, 0.1, 0.2, 0.3, 0, 0, 0).pack(mav), 1000.0 + i)
+    recorder.close()
+
+
+def test_replay_uses_its_own_parser(tmp_path):
+    source = tmp_path / 'source.tlog'
+    write_tlog(source)
+    handler = MAVLinkHandler()
+    handler.start_recording(str(tmp_path / 'live.tlog'))
+    # Canlı tamponda yarım kalmış bir çerçeve
+    handler.decoder._buffer += b'\xfd\x10'
+
+    replay = handler.replay(str(source), speed=None)
+    replay.thread.join(10)
+    handler.stop_recording()
+
+    assert replay.results()['decoder']['decoded'] == 100
+    assert replay.stats.messages.total == 100
+    # Canlı parser, istatistik ve kayıt oynatmadan etkilenmez
+    assert handler.stats.messages.total == 0
+    assert handler.decoder.decoded == 0
+    assert bytes(handler.decoder._buffer) == b'\xfd\x10'
+    assert list(iter_tlog(str(tmp_path / 'live.tlog'))) == []
+    assert handler.snapshot(1) is not None
+
+
+def free_port():
+    import socket
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def test_replay_does_not_touch_redundant_links(tmp_path):
+    source = tmp_path / 'source.tlog'
+    write_tlog(source)
+    handler = MAVLinkHandler()
+    first = f'udpin:127.0.0.1:{free_port()}'
+    second = f'udpin:127.0.0.1:{free_port()}'
+    assert handler.connect(first)
+    assert handler.add_link(second)
+    try:
+        primary, backup = handler.links
+        # Birincil bağlantı handler'ın ortak parser/istatistiklerini kullanmaz
+        assert primary.decoder is not handler.decoder
+        assert primary.stats is not handler.stats
+
+        replay = handler.replay(str(source), speed=None)
+        replay.thread.join(10)
+        assert replay.results()['decoder']['decoded'] == 100
+
+        for link in (primary, backup):
+            assert link.stats.messages.total == 0
+            assert link.first_count == 0 and link.duplicate_count == 0
+        assert handler.deduplicator.accepted == 0
+        assert handler.link_stats()['messages'] == 0
+    finally:
+        handler.disconnect()
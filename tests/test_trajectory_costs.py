@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from mission.route_solver import EnergyCostModel, TimeCostModel
+from mission.trajectory_costs import (CONSTRAINT_TOLERANCE, altitude_constraint, model_weights,
+                                      path_cost, refine, segment_lengths, spacing_constraint)
+
+MAX_ALTITUDE = 120.0
+MIN_DISTANCE = 5.0
+
+
+def zigzag_mission(n, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(n)
+    lats = 39.9 + t * 2e-4 + rng.normal(0, 5e-5, n)
+    lons = 32.8 + rng.normal(0, 5e-5, n)
+    alts = rng.uniform(20, 140, n)
+    return np.concatenate((lats, lons, alts))
+
+
+def cost_objective(model, turn_radius, x0):
+    horizontal, vertical, climb = model_weights(model)
+    ref_lat = float(np.mean(x0[:len(x0) // 3]))
+    return lambda x: path_cost(x, horizontal, vertical, climb, turn_radius, ref_lat)
+
+
+def numeric_gradient(fun, x, steps):
+    grad = np.zeros_like(x)
+    for i in range(len(x)):
+        dx = np.zeros_like(x)
+        dx[i] = steps[i]
+        grad[i] = (fun(x + dx) - fun(x - dx)) / (2 * steps[i])
+    return grad
+
+
+def test_path_cost_gradient():
+    x = zigzag_mission(8)
+    objective = cost_objective(EnergyCostModel(), 5.0, x)
+    steps = np.concatenate((np.full(16, 1e-7), np.full(8, 1e-4)))
+    _, grad = objective(x)
+    assert grad == pytest.approx(numeric_gradient(lambda v: objective(v)[0], x, steps), rel=1e-4, abs=1e-2)
+
+
+def test_constraint_vjp_matches_jacobian():
+    x = zigzag_mission(8)
+    weights = np.random.default_rng(1).random(7)
+    spacing = spacing_constraint(MIN_DISTANCE)
+    assert spacing['vjp'](x, weights) == pytest.approx(spacing['jac'](x).T @ weights)
+    altitude = altitude_constraint(MAX_ALTITUDE)
+    weights = np.random.default_rng(2).random(8)
+    assert altitude['vjp'](x, weights) == pytest.approx(altitude['jac'](x).T @ weights)
+
+
+@pytest.mark.parametrize('model', [TimeCostModel(horizontal_speed=5.0), EnergyCostModel(horizontal_speed=5.0)])
+def test_refine_converges_on_small_mission(model):
+    x0 = zigzag_mission(30)
+    objective = cost_objective(model, 5.0, x0)
+    constraints = [altitude_constraint(MAX_ALTITUDE), spacing_constraint(MIN_DISTANCE)]
+    result = refine(objective, x0, constraints)
+
+    assert result.success, result.message
+    assert result.constr_violation <= CONSTRAINT_TOLERANCE
+    n = len(x0) // 3
+    assert np.all(result.x[2 * n:] <= MAX_ALTITUDE + CONSTRAINT_TOLERANCE)
+    assert np.all(segment_lengths(result.x)[0] >= MIN_DISTANCE - CONSTRAINT_TOLERANCE)
+    assert result.fun < objective(x0)[0]
+    assert result.fun == pytest.approx(objective(result.x)[0])
+
+
+def test_refine_reports_iteration_limit():
+    x0 = zigzag_mission(30)
+    objective = cost_objective(TimeCostModel(horizontal_speed=5.0), 5.0, x0)
+    result = refine(objective, x0, [spacing_constraint(MIN_DISTANCE)], maxiter=5)
+    assert not result.success
+    assert result.nit <= 5 + 1
@@ -4,19 +4,28 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
                             QTableWidgetItem, QMessageBox)
 from PyQt6.QtCore import Qt, pyqtSignal
 from .widgets.vehicle_status import VehicleStatusWidget
+from .widgets.link_stats_panel import LinkStatsPanel
 from simulation.ardupilot_sitl import ArdupilotSITL
+from services.mavlink_handler import MAVLinkHandler
+from services.mavlink_transport import MAVLinkTransport
 
 class MultiVehicleControl(QWidget):
     def __init__(self):
         super().__init__()
         self.sitl = ArdupilotSITL()
         self.vehicles = {}
+        # Tüm SITL bağlantıları tek bir olay döngüsünde okunur
+        # SITL açılışı sürerken ilk TCP bağlantısı için uzun bekleme
+        self.transport = MAVLinkTransport(connect_timeout=30.0)
+        # vehicle_id -> (MAVLinkHandler, abonelik)
+        self.handlers = {}
         self.init_ui()
         
         # SITL sinyallerini bağla
         self.sitl.state_updated.connect(self.update_vehicle_state)
         self.sitl.connection_status.connect(self.handle_connection_status)
         self.sitl.log_message.connect(self.handle_log_message)
+        self.sitl.instance_stopped.connect(self.release_handler)
 
     def init_ui(self):
         layout = QVBoxLayout()
@@ -46,6 +55,8 @@ class MultiVehicleControl(QWidget):
 
         # Araç listesi ve durumları
         self.vehicle_tabs = QTabWidget()
+        self.vehicle_tabs.setTabsClosable(True)
+        self.vehicle_tabs.tabCloseRequested.connect(self.close_vehicle_tab)
         control_layout.addWidget(self.vehicle_tabs)
 
         control_group.setLayout(control_layout)
@@ -74,6 +85,14 @@ class MultiVehicleControl(QWidget):
         batch_group.setLayout(batch_layout)
         layout.addWidget(batch_group)
 
+        # Hata ayıklama: tüm araç bağlantılarının mesaj/çözme/dağıtım istatistikleri
+        stats_group = QGroupBox("Bağlantı İstatistikleri")
+        stats_layout = QVBoxLayout()
+        self.link_stats_panel = LinkStatsPanel()
+        stats_layout.addWidget(self.link_stats_panel)
+        stats_group.setLayout(stats_layout)
+        layout.addWidget(stats_group)
+
         self.setLayout(layout)
 
     def add_vehicle(self):
@@ -96,6 +115,20 @@ class MultiVehicleControl(QWidget):
         
         if self.sitl.start_instance(vehicle_id, self.vehicle_type.currentText(), location):
             self.vehicles[vehicle_id] = vehicle_widget
+
+            # MAVLink telemetrisi için paylaşılan transport üzerinden bağlan
+            port = self.sitl.processes[vehicle_id]['ports']['mavlink']
+            handler = MAVLinkHandler(self.transport)
+            if handler.connect(f"tcp:127.0.0.1:{port}"):
+                # Araç sekmesi SITL çıktısı yerine MAVLink telemetrisiyle güncellenir
+                subscription = handler.subscribe(
+                    lambda system_id, changes: self.update_vehicle_telemetry(vehicle_id, system_id),
+                    fields=['position', 'attitude', 'vfr_hud'], max_rate=10)
+                self.handlers[vehicle_id] = (handler, subscription)
+                self.link_stats_panel.add_handler(handler)
+            else:
+                self.handle_log_message(f"Vehicle {vehicle_id} MAVLink bağlantısı açılamadı")
+
             vehicle_widget.command_requested.connect(
                 lambda cmd, params: self.handle_vehicle_command(vehicle_id, cmd, params)
             )
@@ -105,6 +138,47 @@ class MultiVehicleControl(QWidget):
         if vehicle_id in self.vehicles:
             self.vehicles[vehicle_id].update_state(data['state'])
 
+    def update_vehicle_telemetry(self, vehicle_id, system_id):
+        if vehicle_id not in self.vehicles or vehicle_id not in self.handlers:
+            return
+        snapshot = self.handlers[vehicle_id][0].snapshot(system_id)
+        self.vehicles[vehicle_id].update_state({
+            'lat': snapshot.position.lat,
+            'lon': snapshot.position.lon,
+            'alt': snapshot.position.relative_alt,
+            'roll': snapshot.attitude.roll,
+            'pitch': snapshot.attitude.pitch,
+            'yaw': snapshot.attitude.yaw,
+            'velocity': snapshot.vfr_hud.groundspeed
+        })
+
+    def release_handler(self, vehicle_id):
+        # SITL instance durduğunda bağlantı da kapatılır
+        entry = self.handlers.pop(vehicle_id, None)
+        if entry is None:
+            return
+        handler, subscription = entry
+        self.link_stats_panel.remove_handler(handler)
+        handler.unsubscribe(subscription)
+        handler.disconnect()
+
+    def close_vehicle_tab(self, index):
+        vehicle_widget = self.vehicle_tabs.widget(index)
+        for vehicle_id, widget in list(self.vehicles.items()):
+            if widget is vehicle_widget:
+                self.remove_vehicle(vehicle_id)
+                return
+        self.vehicle_tabs.removeTab(index)
+
+    def remove_vehicle(self, vehicle_id):
+        vehicle_widget = self.vehicles.pop(vehicle_id, None)
+        self.sitl.stop_instance(vehicle_id)
+        # Instance zaten durmuşsa instance_stopped gelmez
+        self.release_handler(vehicle_id)
+        if vehicle_widget is not None:
+            self.vehicle_tabs.removeTab(self.vehicle_tabs.indexOf(vehicle_widget))
+            vehicle_widget.deleteLater()
+
     def handle_connection_status(self, connected, message):
         if connected:
             QMessageBox.information(self, "Bağlantı", message)
@@ -134,5 +208,8 @@ class MultiVehicleControl(QWidget):
             self.sitl.send_command(vehicle_id, 'NAV_RETURN_TO_LAUNCH')
 
     def closeEvent(self, event):
+        for vehicle_id in list(self.handlers):
+            self.release_handler(vehicle_id)
+        self.transport.stop()
         self.sitl.stop_all()
         super().closeEvent(event)
\ No newline at end of file
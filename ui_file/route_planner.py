@@ -1,78 +1,26 @@
     def optimize_time(self):
-        points = np.array([[wp['lat'], wp['lon'], wp['alt']] for wp in self.waypoints])
-        n_points = len(points)
-        
-        def calculate_time(ordered_points):
-            total_time = 0
-            speed = 15  # m/s varsayılan hız
-            
-            for i in range(len(ordered_points)-1):
-                # 3B mesafe hesapla
-                dist = np.sqrt(np.sum((ordered_points[i] - ordered_points[i+1])**2))
-                # Yükseklik değişimi için ek süre
-                alt_diff = abs(ordered_points[i][2] - ordered_points[i+1][2])
-                vertical_time = alt_diff / 5  # 5 m/s dikey hız
-                
-                # Toplam süreyi hesapla
-                segment_time = dist/speed + vertical_time
-                total_time += segment_time
-                
-                # Bekleme süresini ekle
-                total_time += self.waypoints[i]['hold_time']
-            
-            return total_time
-
-        # Başlangıç çözümü
-        x0 = np.arange(n_points)
-        
-        def objective(order):
-            ordered_points = points[order.astype(int)]
-            return calculate_time(ordered_points)
-
-        # Optimizasyon
-        result = minimize(objective, x0, method='SLSQP')
-        optimal_order = result.x.astype(int)
-
-        return [self.waypoints[i] for i in optimal_order]
+        # Süre modeli: 15 m/s yatay, 5 m/s dikey hız; bekleme süreleri
+        # sıradan bağımsız olduğu için sıralamayı etkilemez
+        from mission.route_solver import TimeCostModel
+        return self.order_waypoints(TimeCostModel(horizontal_speed=15, vertical_speed=5))
 
     def optimize_energy(self):
-        points = np.array([[wp['lat'], wp['lon'], wp['alt']] for wp in self.waypoints])
-        n_points = len(points)
-        
-        def calculate_energy(ordered_points):
-            total_energy = 0
-            base_power = 100  # Watt, hovering için temel güç tüketimi
-            
-            for i in range(len(ordered_points)-1):
-                # Yatay ve dikey hareket için enerji hesapla
-                dist = np.sqrt(np.sum((ordered_points[i] - ordered_points[i+1])**2))
-                alt_diff = ordered_points[i+1][2] - ordered_points[i][2]
-                
-                # Yükselme için daha fazla enerji gerekir
-                if alt_diff > 0:
-                    vertical_power = base_power * 1.5
-                else:
-                    vertical_power = base_power * 0.8
-                
-                # Toplam enerjiyi hesapla (Joule)
-                segment_energy = base_power * (dist/15)  # 15 m/s hızla
-                vertical_energy = vertical_power * (abs(alt_diff)/5)  # 5 m/s dikey hız
-                total_energy += segment_energy + vertical_energy
-                
-                # Bekleme enerjisini ekle
-                total_energy += base_power * self.waypoints[i]['hold_time']
-            
-            return total_energy
-
-        def objective(order):
-            ordered_points = points[order.astype(int)]
-            return calculate_energy(ordered_points)
+        # Enerji modeli: 100 W temel güç, tırmanmada 1.5, alçalmada 0.8 katı
+        from mission.route_solver import EnergyCostModel
+        return self.order_waypoints(EnergyCostModel(base_power=100, climb_factor=1.5, descent_factor=0.8))
 
-        x0 = np.arange(n_points)
-        result = minimize(objective, x0, method='SLSQP')
-        optimal_order = result.x.astype(int)
+    def order_waypoints(self, model, time_limit=2.0):
+        # İlk nokta sabit, bitiş serbest; süre sınırında bulunan en iyi sıra
+        from mission.route_solver import solve_route
 
-        return [self.waypoints[i] for i in optimal_order]
+        if len(self.waypoints) < 3:
+            return list(self.waypoints)
+        order = solve_route(model,
+                            [wp['lat'] for wp in self.waypoints],
+                            [wp['lon'] for wp in self.waypoints],
+                            [wp['alt'] for wp in self.waypoints],
+                            start=0, time_limit=time_limit)
+        return [self.waypoints[i] for i in order]
 
     def optimize_coverage(self):
         # Alan kapsama optimizasyonu
@@ -0,0 +1,310 @@
+import glob
+import io
+import json
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+
+from utils.segmented_log import BlockFileReader, BlockFileWriter, index_path
+
+# Dosya, art arda np.save ile yazılmış yapılandırılmış dizilerden oluşur
+COLUMNAR_LOG_EXTENSION = '.tlm'
+# Aynı içerik, her parça ayrı gzip bloğu olarak ve zaman indeksiyle
+COMPRESSED_LOG_EXTENSION = '.tlz'
+# Metinler UTF-8 bayt olarak sabit genişlikte saklanır; sığmayan değer sütunu genişletir
+STRING_DTYPE = 'S24'
+OBJECT_DTYPE = 'S96'
+
+
+def load_logging_settings(settings_file='config/settings.json'):
+    try:
+        with open(settings_file, 'r') as f:
+            return json.load(f).get('logging', {})
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def prune_log_files(log_dir, pattern, max_files):
+    """En yeni max_files dosya dışındakileri sil"""
+    if not max_files:
+        return []
+    files = sorted(glob.glob(os.path.join(log_dir, pattern)))
+    removed = files[:-max_files] if len(files) > max_files else []
+    for file_path in removed:
+        for path in (file_path, index_path(file_path)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+    return removed
+
+
+def is_number(value):
+    return isinstance(value, (int, float, np.integer, np.floating))
+
+
+def infer_dtype(value):
+    if isinstance(value, (bool, np.bool_)):
+        return '?'
+    if is_number(value):
+        return 'f8'
+    if isinstance(value, str):
+        return STRING_DTYPE
+    return OBJECT_DTYPE
+
+
+def text_dtype(width, size):
+    """size baytlık metni taşıyan sütun türü; width mevcut metin genişliğidir (0: metin değil)"""
+    # Her uzun değerde şemayı değiştirmemek için genişlik en az ikiye katlanır
+    return f'S{max(size, 2 * width, np.dtype(STRING_DTYPE).itemsize)}'
+
+
+def default_value(dtype):
+    if dtype == '?':
+        return False
+    if dtype == 'f8':
+        return np.nan
+    return b''
+
+
+class ColumnarLogWriter:
+    """Örnekleri önceden ayrılmış sütunlu parçalara yazar.
+
+    append() yalnızca parçadaki bir satırı doldurur; dolan parçalar kuyruğa
+    alınır ve arka plandaki yazıcı thread'i tarafından diske yazılır. Yeni bir
+    anahtar geldiğinde ya da değer sütununa sığmadığında (uzun metin, tür
+    değişikliği) mevcut parça kapatılır ve genişletilmiş şemayla yeni parça
+    başlar. Dosya max_file_size'ı aşınca yeni dosyaya geçilir ve en eski
+    dosyalar max_log_files sınırına göre silinir.
+
+    compress=True ise her parça ayrı sıkıştırılmış blok olarak yazılır ve
+    zaman indeksi tutulur (bkz. utils.segmented_log).
+    """
+
+    def __init__(self, log_dir='logs', prefix='telemetry', chunk_size=4096,
+                 max_log_files=100, max_file_size=64 * 1024 * 1024, compress=True):
+        self.log_dir = log_dir
+        self.prefix = prefix
+        self.compress = compress
+        self.extension = COMPRESSED_LOG_EXTENSION if compress else COLUMNAR_LOG_EXTENSION
+        self.chunk_size = chunk_size
+        self.max_log_files = max_log_files
+        self.max_file_size = max_file_size
+
+        self.fields = []
+        self.dtype = None
+        self._field_index = {}
+        self._field_types = {}
+        self._text_widths = {}
+        # İlk değeri metin dışı nesne olan sütunlar JSON olarak saklanır
+        self._object_fields = set()
+        self.chunk = None
+        self.count = 0
+        self.samples = 0
+        # Yine de yazılamayan değerler
+        self.dropped = 0
+        self._dropped_fields = set()
+        self.current_file = None
+        self.files = []
+
+        self._file = None
+        self._file_index = 0
+        self._session = None
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        os.makedirs(self.log_dir, exist_ok=True)
+        self._session = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+        self._file_index = 0
+        self._open_next_file()
+        self._thread = threading.Thread(target=self._writer_loop, name="ColumnarLogWriter")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self.flush()
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def append(self, data, timestamp=None):
+        if timestamp is None:
+            timestamp = time.time()
+        with self._lock:
+            if self.dtype is None or not self._field_index.keys() >= data.keys():
+                self._extend_schema(data)
+
+            values = []
+            changed = {}
+            for key, value in data.items():
+                if value is None:
+                    continue
+                value, field_type = self._encode(key, value)
+                if field_type != self._field_types[key]:
+                    changed[key] = field_type
+                values.append((key, value))
+            if changed:
+                self._extend_schema({}, changed)
+
+            row = self.chunk[self.count]
+            row['timestamp'] = timestamp
+            for key, value in values:
+                try:
+                    row[key] = value
+                except (TypeError, ValueError, OverflowError) as e:
+                    self._drop(key, e)
+            self.count += 1
+            self.samples += 1
+
+            if self.count == self.chunk_size:
+                self._submit_chunk()
+
+    def flush(self):
+        """Yarım parçayı yazıcıya gönder"""
+        with self._lock:
+            if self.count:
+                self._submit_chunk()
+
+    def _encode(self, key, value):
+        """Değeri sütuna yazılacak biçime çevirir; sığmıyorsa gereken yeni türü döndürür"""
+        field_type = self._field_types[key]
+        if field_type == '?' and isinstance(value, (bool, np.bool_)):
+            return value, field_type
+        if field_type in ('?', 'f8') and is_number(value):
+            return value, 'f8'
+
+        # Sayısal sütuna metin gelirse sütun metne çevrilir
+        if isinstance(value, str) and key not in self._object_fields:
+            value = value.encode('utf-8')
+        else:
+            value = json.dumps(value, default=str).encode('utf-8')
+        width = self._text_widths.get(key, 0)
+        if len(value) <= width:
+            return value, field_type
+        return value, text_dtype(width, len(value))
+
+    def _drop(self, key, error):
+        self.dropped += 1
+        if key not in self._dropped_fields:
+            self._dropped_fields.add(key)
+            print(f"Log sütunu '{key}' değeri yazılamadı: {error}")
+
+    def _extend_schema(self, data, changed=None):
+        # Önceki şemayla yazılmış satırları kapat
+        if self.count:
+            self._submit_chunk()
+
+        fields = list(self.fields)
+        if changed:
+            fields = [(name, changed.get(name, dtype)) for name, dtype in fields]
+        for key, value in data.items():
+            if key not in self._field_index:
+                dtype = infer_dtype(value)
+                fields.append((key, dtype))
+                if dtype == OBJECT_DTYPE:
+                    self._object_fields.add(key)
+        self.fields = fields
+        self.dtype = np.dtype([('timestamp', 'f8')] + fields)
+        self._field_index = {name: i for i, (name, _) in enumerate(fields)}
+        self._field_types = dict(fields)
+        self._text_widths = {name: self.dtype[name].itemsize
+                             for name, dtype in fields if dtype.startswith('S')}
+        self._defaults = tuple([np.nan] + [default_value(dtype) for _, dtype in fields])
+        self._new_chunk()
+
+    def _new_chunk(self):
+        self.chunk = np.empty(self.chunk_size, dtype=self.dtype)
+        self.chunk[:] = self._defaults
+        self.count = 0
+
+    def _submit_chunk(self):
+        self._queue.put(self.chunk[:self.count])
+        self._new_chunk()
+
+    def _writer_loop(self):
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                break
+            try:
+                if self.compress:
+                    buffer = io.BytesIO()
+                    np.save(buffer, chunk, allow_pickle=False)
+                    timestamps = chunk['timestamp']
+                    self._file.write_block(buffer.getvalue(), timestamps[0], timestamps[-1], len(chunk))
+                else:
+                    np.save(self._file, chunk, allow_pickle=False)
+                if self._file.tell() >= self.max_file_size:
+                    self._file.close()
+                    self._open_next_file()
+            except Exception as e:
+                print(f"Log yazma hatası: {e}")
+
+    def _open_next_file(self):
+        self._file_index += 1
+        file_path = os.path.join(
+            self.log_dir,
+            f'{self.prefix}_{self._session}_{self._file_index:03d}{self.extension}'
+        )
+        if self.compress:
+            self._file = BlockFileWriter(file_path)
+        else:
+            self._file = open(file_path, 'wb')
+        self.current_file = file_path
+        self.files.append(file_path)
+        prune_log_files(self.log_dir, f'{self.prefix}_*{self.extension}', self.max_log_files)
+
+
+def iter_columnar_log(file_path, t_start=None, t_end=None):
+    """Dosyadaki parçaları (yapılandırılmış numpy dizileri) sırayla döndürür.
+
+    Sıkıştırılmış dosyalarda yalnızca [t_start, t_end] aralığına düşen
+    bloklar açılır.
+    """
+    if file_path.endswith(COMPRESSED_LOG_EXTENSION):
+        chunks = (np.load(io.BytesIO(payload), allow_pickle=False)
+                  for _, payload in BlockFileReader(file_path).iter_blocks(t_start, t_end))
+    else:
+        chunks = _iter_npy_stream(file_path)
+
+    for chunk in chunks:
+        if t_start is not None or t_end is not None:
+            timestamps = chunk['timestamp']
+            mask = np.ones(len(chunk), dtype=bool)
+            if t_start is not None:
+                mask &= timestamps >= t_start
+            if t_end is not None:
+                mask &= timestamps <= t_end
+            chunk = chunk[mask]
+            if not len(chunk):
+                continue
+        yield chunk
+
+
+def _iter_npy_stream(file_path):
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        while f.tell() < size:
+            yield np.load(f, allow_pickle=False)
+
+
+def load_columnar_log(file_path, t_start=None, t_end=None):
+    """Aynı şemalı ardışık parçaları birleştirerek dizi listesi döndürür"""
+    segments = []
+    for chunk in iter_columnar_log(file_path, t_start, t_end):
+        if segments and segments[-1][-1].dtype == chunk.dtype:
+            segments[-1].append(chunk)
+        else:
+            segments.append([chunk])
+    return [np.concatenate(chunks) for chunks in segments]
@@ -1,14 +1,62 @@
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 import json
 import csv
+import queue
+import threading
+import time
+from utils.segmented_log import BlockFileReader, BlockFileWriter
+
+_STOP = object()
 
 class LogManager:
-    def __init__(self, log_dir="logs"):
+    """Telemetri örneklerini JSON ve CSV olarak kaydeder.
+
+    log_data() örneği yalnızca kuyruğa ekler; tek bir yazıcı thread'i
+    kuyruktaki örnekleri gruplar halinde (group commit) iki dosyaya yazar.
+    flush_policy: 'batch' her gruptan sonra, 'interval' flush_interval
+    saniyede bir, 'none' yalnızca kapanışta diske boşaltır. fsync=True ise
+    boşaltmalar os.fsync ile kalıcı hale getirilir.
+
+    CSV başlıkları sabit değildir: yeni bir anahtar geldiğinde mevcut CSV
+    segmenti kapatılır ve genişletilmiş başlıklarla yeni segment açılır.
+
+    compress=True ise JSON kayıtları block_size baytlık sıkıştırılmış
+    bloklar halinde, zaman indeksli ve max_segment_size'da bölünen
+    .jsonl.gz segmentlerine yazılır (bkz. read_json_log).
+    """
+
+    def __init__(self, log_dir="logs", flush_policy='interval', flush_interval=1.0,
+                 fsync=False, batch_size=512, max_queue=0, compress=False,
+                 block_size=256 * 1024, max_segment_size=64 * 1024 * 1024):
         self.log_dir = log_dir
+        self.compress = compress
+        self.block_size = block_size
+        self.max_segment_size = max_segment_size
+        self.json_segment = 0
+        self.json_files = []
+        self._pending_lines = []
+        self._pending_bytes = 0
+        self._pending_range = None
+        self.flush_policy = flush_policy
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self.batch_size = batch_size
+
         self.current_log_file = None
         self.current_csv_file = None
         self.csv_writer = None
+        self.csv_headers = None
+        self._header_set = set()
+        self.csv_segment = 0
+        self.csv_files = []
+        self.session = None
+
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.writer_thread = None
+        self.samples_written = 0
+        self.dropped_samples = 0
+        self._last_flush = 0.0
         self.ensure_log_directory()
 
     def ensure_log_directory(self):
@@ -16,39 +64,52 @@ class LogManager:
             os.makedirs(self.log_dir)
 
     def start_logging(self):
-        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-        
+        self.session = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+
         # JSON log dosyası
-        json_filename = os.path.join(self.log_dir, f'telemetry_{timestamp}.json')
-        self.current_log_file = open(json_filename, 'w')
+        self.json_segment = 0
+        self.json_files = []
+        if self.compress:
+            self._open_json_segment()
+        else:
+            json_filename = os.path.join(self.log_dir, f'telemetry_{self.session}.json')
+            self.current_log_file = open(json_filename, 'w')
+            self.json_files.append(json_filename)
 
-        # CSV log dosyası
-        csv_filename = os.path.join(self.log_dir, f'telemetry_{timestamp}.csv')
-        self.current_csv_file = open(csv_filename, 'w', newline='')
-        self.csv_writer = None  # İlk veri geldiğinde başlıklar oluşturulacak
+        # CSV log dosyası ilk veri geldiğinde başlıklarla birlikte açılır
+        self.csv_segment = 0
+        self.csv_files = []
+        self.csv_headers = None
+        self.csv_writer = None
+
+        self._last_flush = time.monotonic()
+        self.writer_thread = threading.Thread(target=self._writer_loop, name="LogManagerWriter")
+        self.writer_thread.daemon = True
+        self.writer_thread.start()
 
     def log_data(self, data: dict):
-        # JSON formatında kaydet
-        timestamp = datetime.utcnow().isoformat()
-        log_entry = {
-            'timestamp': timestamp,
-            'data': data
-        }
-        self.current_log_file.write(json.dumps(log_entry) + '\n')
-
-        # CSV formatında kaydet
-        if self.csv_writer is None:
-            # CSV başlıklarını oluştur
-            headers = ['timestamp'] + list(data.keys())
-            self.csv_writer = csv.DictWriter(self.current_csv_file, fieldnames=headers)
-            self.csv_writer.writeheader()
-
-        # CSV satırını yaz
-        row_data = {'timestamp': timestamp}
-        row_data.update(data)
-        self.csv_writer.writerow(row_data)
+        if self.writer_thread is None:
+            return
+        # Sıcak yolda yalnızca zaman damgası alınır ve kuyruğa eklenir
+        try:
+            self.queue.put_nowait((time.time(), dict(data)))
+        except queue.Full:
+            self.dropped_samples += 1
+
+    def flush(self, timeout=None):
+        """Kuyruktaki tüm örnekler yazılıp diske boşaltılana kadar bekle"""
+        if self.writer_thread is None:
+            return
+        done = threading.Event()
+        self.queue.put(done)
+        done.wait(timeout)
 
     def stop_logging(self):
+        if self.writer_thread is not None:
+            self.queue.put(_STOP)
+            self.writer_thread.join()
+            self.writer_thread = None
+
         if self.current_log_file:
             self.current_log_file.close()
             self.current_log_file = None
@@ -56,4 +117,164 @@ class LogManager:
         if self.current_csv_file:
             self.current_csv_file.close()
             self.current_csv_file = None
-            self.csv_writer = None
\ No newline at end of file
+            self.csv_writer = None
+
+    def _writer_loop(self):
+        while True:
+            timeout = self.flush_interval if self.flush_policy == 'interval' else None
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                self._flush_files()
+                continue
+
+            # Kuyrukta bekleyenleri tek seferde topla
+            batch = []
+            markers = []
+            stop = False
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    batch.append(item)
+                if stop or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                print(f"Log yazma hatası: {e}")
+
+            now = time.monotonic()
+            if (stop or markers or self.flush_policy == 'batch' or
+                    (self.flush_policy == 'interval' and now - self._last_flush >= self.flush_interval)):
+                self._flush_files()
+
+            for marker in markers:
+                marker.set()
+            if stop:
+                break
+
+    def _write_batch(self, batch):
+        json_lines = []
+        if batch and self.compress:
+            self._extend_pending_range(batch[0][0], batch[-1][0])
+        for timestamp, data in batch:
+            iso_timestamp = datetime.utcfromtimestamp(timestamp).isoformat()
+            json_lines.append(json.dumps({'timestamp': iso_timestamp, 'data': data}))
+
+            # Yeni anahtar gelirse yeni CSV segmenti başlat
+            if self.csv_headers is None or not self._header_set.issuperset(data):
+                self._open_csv_segment(data)
+
+            row_data = {'timestamp': iso_timestamp}
+            row_data.update(data)
+            self.csv_writer.writerow(row_data)
+
+        if not json_lines:
+            return
+        self.samples_written += len(json_lines)
+        if self.compress:
+            text = '\n'.join(json_lines) + '\n'
+            self._pending_lines.append(text)
+            self._pending_bytes += len(text)
+            if self._pending_bytes >= self.block_size:
+                self._write_json_block()
+        else:
+            self.current_log_file.write('\n'.join(json_lines) + '\n')
+
+    def _extend_pending_range(self, t_start, t_end):
+        if self._pending_range is None:
+            self._pending_range = [t_start, t_end]
+        else:
+            self._pending_range[1] = t_end
+
+    def _write_json_block(self):
+        if not self._pending_lines:
+            return
+        payload = ''.join(self._pending_lines).encode('utf-8')
+        t_start, t_end = self._pending_range
+        self.current_log_file.write_block(payload, t_start, t_end, payload.count(b'\n'))
+        self._pending_lines = []
+        self._pending_bytes = 0
+        self._pending_range = None
+
+        if self.current_log_file.tell() >= self.max_segment_size:
+            self.current_log_file.close()
+            self._open_json_segment()
+
+    def _open_json_segment(self):
+        self.json_segment += 1
+        json_filename = os.path.join(self.log_dir, f'telemetry_{self.session}_{self.json_segment:03d}.jsonl.gz')
+        self.current_log_file = BlockFileWriter(json_filename)
+        self.json_files.append(json_filename)
+
+    def _open_csv_segment(self, data):
+        headers = list(self.csv_headers or ['timestamp'])
+        for key in data:
+            if key not in headers:
+                headers.append(key)
+
+        if self.current_csv_file:
+            self.current_csv_file.close()
+
+        self.csv_segment += 1
+        if self.csv_segment == 1:
+            csv_filename = os.path.join(self.log_dir, f'telemetry_{self.session}.csv')
+        else:
+            csv_filename = os.path.join(self.log_dir, f'telemetry_{self.session}_{self.csv_segment:02d}.csv')
+        self.current_csv_file = open(csv_filename, 'w', newline='')
+        self.csv_files.append(csv_filename)
+
+        self.csv_headers = headers
+        self._header_set = set(headers)
+        self.csv_writer = csv.DictWriter(self.current_csv_file, fieldnames=headers)
+        self.csv_writer.writeheader()
+
+    def _flush_files(self):
+        if self.compress:
+            self._write_json_block()
+            self.current_log_file.flush(self.fsync)
+            files = (self.current_csv_file,)
+        else:
+            files = (self.current_log_file, self.current_csv_file)
+        for f in files:
+            if f:
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+        self._last_flush = time.monotonic()
+
+
+def read_json_log(file_path, t_start=None, t_end=None):
+    """LogManager JSON kayıtlarını döndürür.
+
+    .jsonl.gz segmentlerinde yalnızca [t_start, t_end] (epoch saniye)
+    aralığıyla kesişen bloklar açılır.
+    """
+    if file_path.endswith('.gz'):
+        lines = (line
+                 for _, payload in BlockFileReader(file_path).iter_blocks(t_start, t_end)
+                 for line in payload.decode('utf-8').splitlines())
+    else:
+        lines = open(file_path, 'r')
+
+    try:
+        for line in lines:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if t_start is not None or t_end is not None:
+                timestamp = datetime.fromisoformat(entry['timestamp']).replace(tzinfo=timezone.utc).timestamp()
+                if (t_start is not None and timestamp < t_start) or (t_end is not None and timestamp > t_end):
+                    continue
+            yield entry
+    finally:
+        if hasattr(lines, 'close'):
+            lines.close()
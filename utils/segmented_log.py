@@ -0,0 +1,115 @@
+import gzip
+import os
+
+import numpy as np
+
+# Yan dosyadaki her satır bir sıkıştırılmış bloğu tanımlar
+INDEX_DTYPE = np.dtype([
+    ('offset', '<u8'),
+    ('size', '<u4'),
+    ('raw_size', '<u4'),
+    ('t_start', '<f8'),
+    ('t_end', '<f8'),
+    ('count', '<u4'),
+])
+INDEX_EXTENSION = '.idx'
+
+
+def index_path(file_path):
+    return file_path + INDEX_EXTENSION
+
+
+class BlockFileWriter:
+    """Blok blok sıkıştırılmış log dosyası ve zaman indeksi yazar.
+
+    Her blok ayrı bir gzip üyesidir; dosyanın tamamı standart gzip araçlarıyla
+    baştan sona açılabilir. Yan dosya (.idx) her bloğun konumunu, boyutunu ve
+    zaman aralığını tutar; okuyucu yalnızca istenen zaman aralığındaki
+    blokları açar.
+    """
+
+    def __init__(self, file_path, compresslevel=6):
+        self.file_path = file_path
+        self.compresslevel = compresslevel
+        self.file = open(file_path, 'wb')
+        self.index_file = open(index_path(file_path), 'wb')
+        self.blocks = 0
+        self.raw_bytes = 0
+
+    def write_block(self, payload, t_start, t_end, count):
+        compressed = gzip.compress(payload, compresslevel=self.compresslevel, mtime=0)
+        entry = np.array([(self.file.tell(), len(compressed), len(payload), t_start, t_end, count)],
+                         dtype=INDEX_DTYPE)
+        self.file.write(compressed)
+        self.index_file.write(entry.tobytes())
+        self.blocks += 1
+        self.raw_bytes += len(payload)
+
+    def tell(self):
+        return self.file.tell()
+
+    def flush(self, fsync=False):
+        # İndeks, işaret ettiği veriden önce diske ulaşmamalı
+        self.file.flush()
+        if fsync:
+            os.fsync(self.file.fileno())
+        self.index_file.flush()
+        if fsync:
+            os.fsync(self.index_file.fileno())
+
+    def close(self):
+        if self.file is not None:
+            self.flush()
+            self.file.close()
+            self.index_file.close()
+            self.file = None
+            self.index_file = None
+
+
+class BlockFileReader:
+    """BlockFileWriter dosyalarından zamana göre blok okur"""
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.index = self.load_index(file_path)
+
+    @staticmethod
+    def load_index(file_path):
+        index = np.fromfile(index_path(file_path), dtype=INDEX_DTYPE)
+        # Yarım yazılmış blokları (çökme sonrası) dışarıda bırak
+        size = os.path.getsize(file_path)
+        return index[index['offset'] + index['size'] <= size]
+
+    def time_range(self):
+        if not len(self.index):
+            return None
+        return float(self.index['t_start'][0]), float(self.index['t_end'].max())
+
+    def find_blocks(self, t_start=None, t_end=None):
+        """[t_start, t_end] ile kesişen blokların indeksleri"""
+        count = len(self.index)
+        first = 0
+        last = count
+        if t_start is not None:
+            # Blok bitişleri monoton olmayabilir; kümülatif maksimumla ara
+            ends = np.maximum.accumulate(self.index['t_end'])
+            first = int(np.searchsorted(ends, t_start, side='left'))
+        if t_end is not None:
+            last = int(np.searchsorted(self.index['t_start'], t_end, side='right'))
+        return range(first, max(first, last))
+
+    def read_block(self, i, f=None):
+        entry = self.index[i]
+        if f is None:
+            with open(self.file_path, 'rb') as f:
+                f.seek(int(entry['offset']))
+                data = f.read(int(entry['size']))
+        else:
+            f.seek(int(entry['offset']))
+            data = f.read(int(entry['size']))
+        return gzip.decompress(data)
+
+    def iter_blocks(self, t_start=None, t_end=None):
+        with open(self.file_path, 'rb') as f:
+            for i in self.find_blocks(t_start, t_end):
+                yield self.index[i], self.read_block(i, f)
@@ -0,0 +1,119 @@
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QGroupBox, QTableWidget,
+                            QTableWidgetItem, QHeaderView)
+from PyQt6.QtCore import QTimer
+
+class LinkStatsPanel(QWidget):
+    def __init__(self, handlers=None):
+        super().__init__()
+        self.handlers = list(handlers or [])
+        self.init_ui()
+
+        # İstatistikleri saniyede bir yenile
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(1000)
+
+    def init_ui(self):
+        layout = QVBoxLayout()
+
+        # Bağlantı özeti
+        link_group = QGroupBox("Bağlantılar")
+        link_layout = QVBoxLayout()
+        self.link_table = self._create_table([
+            'Bağlantı', 'Mesaj/s', 'Bayt/s', 'Kayıp (%)', 'Çözülen', 'Atlanan'
+        ])
+        link_layout.addWidget(self.link_table)
+        link_group.setLayout(link_layout)
+        layout.addWidget(link_group)
+
+        # Mesaj tipi bazında
+        type_group = QGroupBox("Mesaj Tipleri")
+        type_layout = QVBoxLayout()
+        self.type_table = self._create_table([
+            'Bağlantı', 'Mesaj', 'Adet', 'Hz', 'Çözme p50 (us)', 'Çözme p99 (us)'
+        ])
+        type_layout.addWidget(self.type_table)
+        type_group.setLayout(type_layout)
+        layout.addWidget(type_group)
+
+        # Dinleyici/abone dağıtım süreleri
+        dispatch_group = QGroupBox("Dağıtım Süreleri")
+        dispatch_layout = QVBoxLayout()
+        self.dispatch_table = self._create_table([
+            'Bağlantı', 'Tüketici', 'Çağrı', 'Ortalama (us)', 'p99 (us)', 'Maks (us)'
+        ])
+        dispatch_layout.addWidget(self.dispatch_table)
+        dispatch_group.setLayout(dispatch_layout)
+        layout.addWidget(dispatch_group)
+
+        self.setLayout(layout)
+
+    def _create_table(self, headers):
+        table = QTableWidget()
+        table.setColumnCount(len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        return table
+
+    def add_handler(self, handler):
+        if handler not in self.handlers:
+            self.handlers.append(handler)
+
+    def remove_handler(self, handler):
+        if handler in self.handlers:
+            self.handlers.remove(handler)
+
+    def refresh(self):
+        link_rows = []
+        type_rows = []
+        dispatch_rows = []
+
+        for handler in self.handlers:
+            # Yedekli bağlantıların her biri ayrı satırda
+            for link in list(handler.links) or [None]:
+                stats = handler.link_stats(link)
+                name = str(stats['name'])
+                decoder = stats['decoder']
+                link_rows.append([
+                    name,
+                    f"{stats['messages_per_s']:.1f}",
+                    f"{stats['bytes_per_s']:.0f}",
+                    f"{stats['packet_loss']:.2f}",
+                    str(decoder['decoded']),
+                    str(decoder['skipped'])
+                ])
+
+                for msg_type, entry in sorted(stats['types'].items(), key=lambda item: -item[1]['rate']):
+                    decode = entry.get('decode', {})
+                    type_rows.append([
+                        name,
+                        msg_type,
+                        str(entry['count']),
+                        f"{entry['rate']:.1f}",
+                        str(decode.get('p50_us', '-')),
+                        str(decode.get('p99_us', '-'))
+                    ])
+
+            # Tüketici süreleri handler başınadır
+            name = str(handler.stats.name)
+            dispatch = handler.stats.summary()['dispatch']
+            for consumer, entry in sorted(dispatch.items(), key=lambda item: -item[1]['mean_us']):
+                dispatch_rows.append([
+                    name,
+                    consumer,
+                    str(entry['count']),
+                    f"{entry['mean_us']:.1f}",
+                    str(entry['p99_us']),
+                    f"{entry['max_us']:.0f}"
+                ])
+
+        self._fill_table(self.link_table, link_rows)
+        self._fill_table(self.type_table, type_rows)
+        self._fill_table(self.dispatch_table, dispatch_rows)
+
+    def _fill_table(self, table, rows):
+        table.setRowCount(len(rows))
+        for row, values in enumerate(rows):
+            for col, value in enumerate(values):
+                table.setItem(row, col, QTableWidgetItem(value))